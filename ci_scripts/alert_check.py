@@ -22,6 +22,8 @@ Nutzung:
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import statistics
 from datetime import date, datetime, timedelta
 from typing import List, Dict, Optional, Tuple
@@ -36,6 +38,28 @@ AIRTABLE_BASE_ID = os.environ.get("AIRTABLE_BASE_ID", "")  # Muss in CI/CD Varia
 TEAMS_WEBHOOK_URL = os.environ.get("TEAMS_WEBHOOK_URL", "")
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
 
+# Wochentage (date.weekday(): 0 = Montag)
+WEEKDAY_NAMES_DE = ("Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag")
+
+# HTTP-Session für Airtable, OpenAI und Teams:
+# Keep-Alive + Retry/Backoff über urllib3 (inkl. Retry-After bei 429).
+# Nur GET wird wiederholt - ein wiederholter POST kann die Alert-Karte doppelt
+# posten bzw. einen GPT-Request doppelt verrechnen.
+HTTP_MAX_RETRIES = 3
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False  # Letzte Antwort zurückgeben statt Exception
+    )
+))
+
 # =============================================================================
 # SCHWELLENWERTE - Angepasst an VOL.AT / VIENNA.AT Daten
 # =============================================================================
@@ -139,7 +163,7 @@ def get_measurements(days: int = 14) -> List[Dict]:
             params["offset"] = offset
             
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = _SESSION.get(url, headers=headers, params=params, timeout=30)
             if response.status_code != 200:
                 print(f"⚠️ Airtable Fehler: {response.status_code}")
                 break
@@ -180,7 +204,8 @@ def parse_measurements(records: List[Dict]) -> Dict[str, Dict[str, Dict[date, in
         metric = fields.get("Metrik")
         wert = fields.get("Wert")
         
-        if not all([datum_str, brand, metric, wert]):
+        # Kurzschluss-Prüfung statt all([...]) - keine Listen-Allokation pro Record
+        if not (datum_str and brand and metric and wert):
             continue
         
         try:
@@ -386,8 +411,7 @@ def generate_alert_analysis(alerts: List[Alert], trend_data: Dict, target_date:
     if not OPENAI_API_KEY:
         return "⚠️ GPT-Analyse nicht verfügbar (API Key fehlt)"
     
-    weekday_names = ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"]
-    weekday_name = weekday_names[target_date.weekday()]
+    weekday_name = WEEKDAY_NAMES_DE[target_date.weekday()]
     
     # Alerts formatieren - MIT GENAUEN DATEN
     alert_text = "\n".join([
@@ -438,7 +462,7 @@ FORMAT (max. 200 Wörter):
 """
 
     try:
-        response = requests.post(
+        response = _SESSION.post(
             "https://api.openai.com/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {OPENAI_API_KEY}",
@@ -497,8 +521,7 @@ def send_alert_to_teams(alerts: List[Alert], analysis: str, target_date: date):
         )
     
     # Facts - mit klarer Unterscheidung
-    weekday_names = ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"]
-    weekday_name = weekday_names[target_date.weekday()]
+    weekday_name = WEEKDAY_NAMES_DE[target_date.weekday()]
     
     facts = [
         {"name": "📅 Abweichungsdatum", "value": f"**{target_date.strftime('%d.%m.%Y')}** ({weekday_name})"},
@@ -539,7 +562,7 @@ def send_alert_to_teams(alerts: List[Alert], analysis: str, target_date: date):
     }
     
     try:
-        response = requests.post(TEAMS_WEBHOOK_URL, json=card, timeout=10)
+        response = _SESSION.post(TEAMS_WEBHOOK_URL, json=card, timeout=10)
         if response.status_code == 200:
             print("✅ Alert-Report an Teams gesendet")
         else:
@@ -39,6 +39,9 @@ ALERT_THRESHOLD_PCT = 0.10
 # Daten-Verzögerung (Tage) - INFOnline API liefert erst nach ~2 Tagen finale Daten
 STANDARD_DELAY_DAYS = 2  # PI, Visits, Homepage PI
 
+# Wochentage (date.weekday(): 0 = Montag)
+WEEKDAY_NAMES_DE = ("Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag")
+
 # =============================================================================
 # SITES KONFIGURATION - Erweitert für Web + iOS + Android
 # =============================================================================
@@ -383,8 +386,7 @@ def generate_alert_gpt_analysis(alerts: List[Dict], target_date: date) -> str:
     if not OPENAI_API_KEY:
         return "⚠️ GPT-Analyse nicht verfügbar (API Key fehlt)"
     
-    weekday_names = ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"]
-    weekday_name = weekday_names[target_date.weekday()]
+    weekday_name = WEEKDAY_NAMES_DE[target_date.weekday()]
     
     # Alerts formatieren - MIT GENAUEN DATEN
     alert_details = []
@@ -463,8 +465,7 @@ def send_alert_notification(alerts: List[Dict], analysis: str, target_date: date
         print("⚠️ TEAMS_WEBHOOK_URL nicht konfiguriert")
         return
     
-    weekday_names = ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"]
-    weekday_name = weekday_names[target_date.weekday()]
+    weekday_name = WEEKDAY_NAMES_DE[target_date.weekday()]
     
     # Farbe basierend auf Schwere
     has_critical = any(abs(a["pct_change"]) >= 0.20 for a in alerts)
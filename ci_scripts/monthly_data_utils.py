@@ -21,12 +21,26 @@ VERWENDUNG:
 """
 
 import os
+import json
+import tempfile
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from functools import lru_cache
 from calendar import monthrange
 from typing import Dict, List, Optional, Tuple
-from time import sleep
+from time import monotonic, sleep, time
+
+# orjson (optional) - deutlich schnelleres Parsen großer Airtable-Seiten
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # =============================================================================
 # KONFIGURATION
@@ -40,11 +54,49 @@ APP_PLATFORMS = ["iOS", "Android"]
 # Standard-Metriken
 METRICS = ["Page Impressions", "Visits", "Unique Clients", "Homepage PI"]
 
+# Deutsche Monatskürzel für Trend-Labels (Index = Monat)
+MONTH_NAMES_SHORT_DE = ("", "Jan", "Feb", "Mär", "Apr", "Mai", "Jun",
+                        "Jul", "Aug", "Sep", "Okt", "Nov", "Dez")
+
+# Airtable-Pagination ist sequentiell (jede Seite braucht den Offset der vorherigen).
+# Ein Monat wird daher in disjunkte Datums-Fenster geteilt, die parallel geladen werden.
+# Das Airtable-Limit (5 Requests/Sekunde pro Base) hält _airtable_throttle über
+# alle Threads ein - auch wenn Trend-Vorladen und Fallback gleichzeitig laden.
+AIRTABLE_DATE_SLICES = 4
+AIRTABLE_MAX_RPS = 4  # Airtable-Requests pro Sekunde (Limit: 5/s pro Base, etwas Puffer)
+_airtable_lock = threading.Lock()
+_airtable_next_slot = 0.0
+
+# HTTP-Session für Airtable: Keep-Alive über alle Seiten/Fenster,
+# Retry/Backoff über urllib3 (inkl. Retry-After bei 429)
+HTTP_MAX_RETRIES = 3
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_maxsize=AIRTABLE_DATE_SLICES + 1,
+    max_retries=Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False  # Letzte Antwort zurückgeben statt Exception
+    )
+))
+
+# Disk-Cache für get_monthly_data (Re-Runs ohne Airtable-Roundtrips).
+# Abgeschlossene Monate ändern sich nicht mehr → kein Ablauf; der aktuelle
+# und der Vormonat (Nachlieferungen/Korrekturen) laufen nach
+# MONTHLY_CACHE_TTL Sekunden ab. MONTHLY_CACHE_DIR="" schaltet den Cache ab
+# (z.B. nach einem Backfill, der abgeschlossene Monate korrigiert).
+MONTHLY_CACHE_DIR = os.environ.get("MONTHLY_CACHE_DIR", ".oewa_cache")
+MONTHLY_CACHE_TTL = 3600
+
 
 # =============================================================================
 # HILFSFUNKTIONEN
 # =============================================================================
 
+@lru_cache(maxsize=256)
 def get_month_dates(year: int, month: int) -> Tuple[date, date]:
     """Gibt Start- und Enddatum eines Monats zurück."""
     start = date(year, month, 1)
@@ -53,6 +105,7 @@ def get_month_dates(year: int, month: int) -> Tuple[date, date]:
     return start, end
 
 
+@lru_cache(maxsize=256)
 def get_previous_month(year: int, month: int) -> Tuple[int, int]:
     """Gibt Jahr und Monat des Vormonats zurück."""
     if month == 1:
@@ -60,6 +113,24 @@ def get_previous_month(year: int, month: int) -> Tuple[int, int]:
     return year, month - 1
 
 
+def _airtable_throttle():
+    """Wartet auf den nächsten freien Request-Slot (max. AIRTABLE_MAX_RPS/s über alle Threads)."""
+    global _airtable_next_slot
+    with _airtable_lock:
+        now = monotonic()
+        slot = max(now, _airtable_next_slot)
+        _airtable_next_slot = slot + 1 / AIRTABLE_MAX_RPS
+    if slot > now:
+        sleep(slot - now)
+
+
+def parse_json_response(response: requests.Response) -> Dict:
+    """Parst eine JSON-Response - mit orjson falls verfügbar, sonst stdlib."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 def aggregate_platforms(data: Dict, aggregate_app: bool = True) -> Dict:
     """
     Aggregiert iOS und Android zu 'App' falls gewünscht.
@@ -96,6 +167,90 @@ def aggregate_platforms(data: Dict, aggregate_app: bool = True) -> Dict:
     return result
 
 
+def split_date_range(start: date, end: date, slices: int) -> List[Tuple[date, date]]:
+    """Teilt [start, end] in bis zu `slices` disjunkte, lückenlose Datums-Fenster."""
+    total_days = (end - start).days + 1
+    slices = max(1, min(slices, total_days))
+    base, extra = divmod(total_days, slices)
+    
+    ranges = []
+    slice_start = start
+    for i in range(slices):
+        length = base + (1 if i < extra else 0)
+        slice_end = slice_start + timedelta(days=length - 1)
+        ranges.append((slice_start, slice_end))
+        slice_start = slice_end + timedelta(days=1)
+    return ranges
+
+
+def fetch_all_records(formula: str, fields: List[str] = None) -> List[Dict]:
+    """
+    Lädt alle Measurements-Records zu einer Filterformel (inkl. Pagination).
+    
+    Args:
+        formula: Airtable filterByFormula
+        fields: Optional - nur diese Felder laden
+    
+    Raises:
+        requests.HTTPError: Eine Seite kam (auch nach Retries) nicht mit 200 -
+            lieber kein Ergebnis als ein unvollständiges, das im Monats-Cache
+            landen würde
+    """
+    url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/Measurements"
+    headers = {"Authorization": f"Bearer {AIRTABLE_API_KEY}"}
+    
+    records = []
+    offset = None
+    
+    while True:
+        params = {
+            "filterByFormula": formula,
+            "pageSize": 100
+        }
+        if fields:
+            params["fields[]"] = fields
+        if offset:
+            params["offset"] = offset
+        
+        _airtable_throttle()
+        response = _SESSION.get(url, headers=headers, params=params, timeout=30)
+        if response.status_code != 200:
+            raise requests.HTTPError(f"Airtable-Abfrage fehlgeschlagen: HTTP {response.status_code}",
+                                     response=response)
+        
+        data = parse_json_response(response)
+        records.extend(data.get("records", []))
+        offset = data.get("offset")
+        if not offset:
+            break
+    
+    return records
+
+
+def fetch_daily_records(start: date, end: date, brand_filter: str = None,
+                        fields: List[str] = None, slices: int = AIRTABLE_DATE_SLICES) -> List[Dict]:
+    """
+    Lädt Tagesdaten (kein _MONTH_) im Zeitraum [start, end].
+    
+    Der Zeitraum wird in disjunkte Fenster geteilt, die parallel geladen werden -
+    so blockiert nicht jede Seite auf den Offset der vorherigen.
+    """
+    def slice_formula(slice_start: date, slice_end: date) -> str:
+        formula = f"AND(IS_AFTER({{Datum}}, '{(slice_start - timedelta(days=1)).isoformat()}'), IS_BEFORE({{Datum}}, '{(slice_end + timedelta(days=1)).isoformat()}'), FIND('_MONTH_', {{Unique Key}}) = 0)"
+        if brand_filter:
+            formula = f"AND({formula}, {{Brand}} = '{brand_filter}')"
+        return formula
+    
+    formulas = [slice_formula(s, e) for s, e in split_date_range(start, end, slices)]
+    
+    if len(formulas) == 1:
+        return fetch_all_records(formulas[0], fields)
+    
+    with ThreadPoolExecutor(max_workers=len(formulas)) as executor:
+        results = executor.map(lambda f: fetch_all_records(f, fields), formulas)
+        return [record for chunk in results for record in chunk]
+
+
 # =============================================================================
 # CORE-FUNKTIONEN
 # =============================================================================
@@ -117,7 +272,8 @@ def check_daily_data_exists(year: int, month: int) -> int:
         "pageSize": 1
     }
     
-    response = requests.get(url, headers=headers, params=params, timeout=30)
+    _airtable_throttle()
+    response = _SESSION.get(url, headers=headers, params=params, timeout=30)
     if response.status_code == 200:
         records = response.json().get("records", [])
         return len(records) > 0
@@ -140,37 +296,10 @@ def get_daily_data_aggregated(year: int, month: int, brand_filter: str = None) -
             ...
         }
     """
-    url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/Measurements"
-    headers = {"Authorization": f"Bearer {AIRTABLE_API_KEY}"}
-    
     start, end = get_month_dates(year, month)
     
-    # Filter: Nur Tagesdaten (kein _MONTH_), optional Brand
-    formula = f"AND(IS_AFTER({{Datum}}, '{(start - timedelta(days=1)).isoformat()}'), IS_BEFORE({{Datum}}, '{(end + timedelta(days=1)).isoformat()}'), FIND('_MONTH_', {{Unique Key}}) = 0)"
-    
-    if brand_filter:
-        formula = f"AND({formula}, {{Brand}} = '{brand_filter}')"
-    
-    records = []
-    offset = None
-    
-    while True:
-        params = {
-            "filterByFormula": formula,
-            "pageSize": 100
-        }
-        if offset:
-            params["offset"] = offset
-        
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        if response.status_code != 200:
-            break
-        
-        data = response.json()
-        records.extend(data.get("records", []))
-        offset = data.get("offset")
-        if not offset:
-            break
+    # Nur Tagesdaten (kein _MONTH_), optional Brand - parallel in Datums-Fenstern
+    records = fetch_daily_records(start, end, brand_filter)
     
     # Aggregieren
     result = defaultdict(lambda: defaultdict(int))
@@ -219,7 +348,8 @@ def get_monthly_data_records(year: int, month: int, brand_filter: str = None) ->
         "pageSize": 100
     }
     
-    response = requests.get(url, headers=headers, params=params, timeout=30)
+    _airtable_throttle()
+    response = _SESSION.get(url, headers=headers, params=params, timeout=30)
     
     result = defaultdict(lambda: defaultdict(int))
     
@@ -245,48 +375,102 @@ def count_daily_data_days(year: int, month: int, brand_filter: str = None) -> in
     Returns:
         Anzahl der Tage mit Daten
     """
-    url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/Measurements"
-    headers = {"Authorization": f"Bearer {AIRTABLE_API_KEY}"}
-    
     start, end = get_month_dates(year, month)
     
-    formula = f"AND(IS_AFTER({{Datum}}, '{(start - timedelta(days=1)).isoformat()}'), IS_BEFORE({{Datum}}, '{(end + timedelta(days=1)).isoformat()}'), FIND('_MONTH_', {{Unique Key}}) = 0)"
-    
-    if brand_filter:
-        formula = f"AND({formula}, {{Brand}} = '{brand_filter}')"
-    
     dates = set()
-    offset = None
-    
-    while True:
-        params = {
-            "filterByFormula": formula,
-            "fields[]": "Datum",
-            "pageSize": 100
-        }
-        if offset:
-            params["offset"] = offset
-        
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        if response.status_code != 200:
-            break
-        
-        data = response.json()
-        for record in data.get("records", []):
-            datum = record.get("fields", {}).get("Datum")
-            if datum:
-                dates.add(datum)
-        
-        offset = data.get("offset")
-        if not offset:
-            break
+    for record in fetch_daily_records(start, end, brand_filter, fields=["Datum"]):
+        datum = record.get("fields", {}).get("Datum")
+        if datum:
+            dates.add(datum)
     
     return len(dates)
 
 
+def _monthly_cache_path(year: int, month: int, brand_filter: str, aggregate_app: bool) -> str:
+    """Cache-Datei für einen get_monthly_data()-Aufruf (Dateiname = Argumente)."""
+    variant = "app" if aggregate_app else "split"
+    return os.path.join(MONTHLY_CACHE_DIR, f"{year}-{month:02d}_{brand_filter or 'ALL'}_{variant}.json")
+
+
+def _monthly_cache_ttl(year: int, month: int) -> Optional[int]:
+    """Gültigkeit in Sekunden (None = abgeschlossener Monat, läuft nie ab)."""
+    today = date.today()
+    if (year, month) < get_previous_month(today.year, today.month):
+        return None
+    return MONTHLY_CACHE_TTL
+
+
+def _read_monthly_cache(path: str, ttl: Optional[int]) -> Optional[Dict]:
+    """Liefert gespeicherte Monatsdaten oder None (fehlt/abgelaufen/defekt)."""
+    try:
+        if ttl is not None and time() - os.path.getmtime(path) > ttl:
+            return None
+        with open(path, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_monthly_cache(path: str, data: Dict):
+    """Speichert Monatsdaten (Fehler beim Schreiben sind nicht kritisch)."""
+    try:
+        os.makedirs(MONTHLY_CACHE_DIR, exist_ok=True)
+        raw = orjson.dumps(data) if ORJSON_AVAILABLE else json.dumps(data).encode("utf-8")
+        # Atomar ersetzen: parallele Loader (Trend + Fallback) sehen nie halbe Dateien
+        fd, tmp_path = tempfile.mkstemp(dir=MONTHLY_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError) as e:
+        print(f"   ⚠️ Monats-Cache nicht beschreibbar: {e}")
+
+
 def get_monthly_data(year: int, month: int, brand_filter: str = None, aggregate_app: bool = True) -> Dict:
     """
-    UNIVERSELLE FUNKTION: Lädt Monatsdaten intelligent.
+    Wie load_monthly_data(), aber mit Disk-Cache (siehe get_months_data).
+    """
+    return get_months_data([(year, month)], brand_filter, aggregate_app)[(year, month)]
+
+
+def get_months_data(months: List[Tuple[int, int]], brand_filter: str = None,
+                    aggregate_app: bool = True) -> Dict[Tuple[int, int], Dict]:
+    """
+    Wie load_months_data(), aber mit Disk-Cache (MONTHLY_CACHE_DIR).
+    
+    Abgeschlossene Monate kommen dauerhaft aus dem Cache, aktueller und
+    Vormonat für MONTHLY_CACHE_TTL Sekunden. Nur die fehlenden Monate werden
+    (gemeinsam) aus Airtable geladen. Leere Ergebnisse werden nicht
+    gespeichert; schlägt eine Airtable-Seite fehl, bricht der Aufruf mit
+    requests.HTTPError ab, bevor irgendetwas gespeichert wird. Jeder Aufruf
+    liefert neue Dicts (Aufrufer dürfen sie verändern).
+    """
+    if not MONTHLY_CACHE_DIR:
+        return load_months_data(months, brand_filter, aggregate_app)
+    
+    result = {}
+    missing = []
+    for year, month in months:
+        path = _monthly_cache_path(year, month, brand_filter, aggregate_app)
+        cached = _read_monthly_cache(path, _monthly_cache_ttl(year, month))
+        if cached is not None:
+            result[(year, month)] = cached
+        else:
+            missing.append((year, month))
+    
+    if missing:
+        loaded = load_months_data(missing, brand_filter, aggregate_app)
+        for (year, month), data in loaded.items():
+            if data:
+                _write_monthly_cache(_monthly_cache_path(year, month, brand_filter, aggregate_app), data)
+        result.update(loaded)
+    
+    return {ym: result[ym] for ym in months}
+
+
+def load_monthly_data(year: int, month: int, brand_filter: str = None, aggregate_app: bool = True) -> Dict:
+    """
+    UNIVERSELLE FUNKTION: Lädt Monatsdaten intelligent (ohne Cache).
     
     STRATEGIE (Priorisierung):
     1. Prüfe ob vollständige Tagesdaten existieren (>= 28 Tage)
@@ -304,38 +488,94 @@ def get_monthly_data(year: int, month: int, brand_filter: str = None, aggregate_
     Returns:
         Dictionary mit Monatssummen pro Brand/Plattform/Metrik
     """
-    _, last_day = monthrange(year, month)
+    return load_months_data([(year, month)], brand_filter, aggregate_app)[(year, month)]
+
+
+def load_months_data(months: List[Tuple[int, int]], brand_filter: str = None,
+                     aggregate_app: bool = True) -> Dict[Tuple[int, int], Dict]:
+    """
+    Lädt Monatsdaten für mehrere Monate gemeinsam (ohne Cache).
+    
+    Statt Abfragen pro Monat: EIN Durchgang über alle Tagesdaten des
+    Gesamtzeitraums (parallel in Datums-Fenstern) und, gleichzeitig dazu,
+    EINE Abfrage für alle _MONTH_-Records. Die Zuordnung zu den Monaten und
+    die Strategie aus load_monthly_data() laufen danach in Python.
+    
+    Args:
+        months: Liste von (Jahr, Monat)
+        brand_filter: Optional - nur bestimmte Brand (z.B. 'VOL')
+        aggregate_app: Wenn True, werden iOS+Android zu 'App' zusammengefasst
     
-    # Prüfe wie viele Tage mit Tagesdaten existieren
-    days_with_data = count_daily_data_days(year, month, brand_filter)
+    Returns:
+        {(Jahr, Monat): Monatssummen pro Brand/Plattform/Metrik}
+    """
+    if not months:
+        return {}
     
-    # Schwellwert: Mindestens 90% der Tage müssen Daten haben
-    completeness_threshold = int(last_day * 0.9)  # z.B. 28 von 31 Tagen
+    by_prefix = {f"{year}-{month:02d}": (year, month) for year, month in months}
+    days = {ym: set() for ym in months}
+    daily = {ym: defaultdict(lambda: defaultdict(int)) for ym in months}
+    monthly = {ym: defaultdict(dict) for ym in months}
     
-    # Strategie 1: Vollständige Tagesdaten vorhanden
-    if days_with_data >= completeness_threshold:
-        daily_data = get_daily_data_aggregated(year, month, brand_filter)
-        if daily_data:
-            if aggregate_app:
-                return aggregate_platforms(daily_data, aggregate_app=True)
-            return daily_data
+    # _MONTH_-Abfrage (Unique Key "YYYY-MM_MONTH_...") läuft parallel zu den Tagesdaten
+    conditions = [f"FIND('{prefix}_MONTH_', {{Unique Key}}) > 0" for prefix in by_prefix]
+    formula = conditions[0] if len(conditions) == 1 else f"OR({', '.join(conditions)})"
+    if brand_filter:
+        formula = f"AND({formula}, {{Brand}} = '{brand_filter}')"
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        month_records = executor.submit(fetch_all_records, formula, ["Unique Key", "Brand", "Plattform", "Metrik", "Wert"])
+        
+        # 1. Tagesdaten des Gesamtzeitraums (kein _MONTH_)
+        start = get_month_dates(*min(months))[0]
+        end = get_month_dates(*max(months))[1]
+        daily_records = fetch_daily_records(start, end, brand_filter, fields=["Datum", "Brand", "Plattform", "Metrik", "Wert"])
+    
+    for record in daily_records:
+        fields = record.get("fields", {})
+        datum = fields.get("Datum")
+        ym = by_prefix.get(datum[:7]) if datum else None
+        if ym is None:
+            continue
+        days[ym].add(datum)
+        
+        brand = fields.get("Brand", "")
+        platform = fields.get("Plattform", "Web")
+        metric = fields.get("Metrik", "")
+        value = fields.get("Wert", 0)
+        if brand and metric and value:
+            daily[ym][f"{brand}_{platform}"][metric] += value
     
-    # Strategie 2: Monatsdaten verfügbar (bevorzugt bei unvollständigen Tagesdaten)
-    monthly_data = get_monthly_data_records(year, month, brand_filter)
-    if monthly_data:
-        if aggregate_app:
-            return aggregate_platforms(monthly_data, aggregate_app=True)
-        return monthly_data
+    # 2. Monatsdaten (_MONTH_ Records)
+    for record in month_records.result():
+        fields = record.get("fields", {})
+        ym = by_prefix.get(fields.get("Unique Key", "").split("_MONTH_", 1)[0][-7:])
+        brand = fields.get("Brand", "")
+        platform = fields.get("Plattform", "Web")
+        metric = fields.get("Metrik", "")
+        if ym is not None and brand and metric:
+            monthly[ym][f"{brand}_{platform}"][metric] = fields.get("Wert", 0)  # Überschreiben, nicht addieren
     
-    # Strategie 3: Fallback auf unvollständige Tagesdaten
-    daily_data = get_daily_data_aggregated(year, month, brand_filter)
-    if daily_data:
-        if aggregate_app:
-            return aggregate_platforms(daily_data, aggregate_app=True)
-        return daily_data
+    # 3. Strategie pro Monat
+    result = {}
+    for year, month in months:
+        ym = (year, month)
+        daily_data = {key: dict(metrics) for key, metrics in daily[ym].items()}
+        monthly_data = dict(monthly[ym])
+        
+        # Schwellwert: Mindestens 90% der Tage müssen Daten haben
+        _, last_day = monthrange(year, month)
+        completeness_threshold = int(last_day * 0.9)  # z.B. 28 von 31 Tagen
+        
+        if len(days[ym]) >= completeness_threshold and daily_data:
+            data = daily_data  # Strategie 1: Vollständige Tagesdaten
+        elif monthly_data:
+            data = monthly_data  # Strategie 2: Monatsdaten
+        else:
+            data = daily_data  # Strategie 3: Unvollständige Tagesdaten (oder keine)
+        
+        result[ym] = aggregate_platforms(data, aggregate_app) if data else {}
     
-    # Keine Daten gefunden
-    return {}
+    return result
 
 
 # =============================================================================
@@ -360,31 +600,26 @@ def get_12_month_trend(year: int, month: int, brand_filter: str = None, aggregat
             ...
         ]
     """
-    month_names = ["", "Jan", "Feb", "Mär", "Apr", "Mai", "Jun", 
-                   "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"]
-    
-    trend = []
+    # 12 Monate rückwärts bestimmen (dann umkehren → ältester zuerst)
+    months = []
     current_year, current_month = year, month
-    
-    # 12 Monate rückwärts sammeln (dann umkehren)
     for _ in range(12):
-        month_str = f"{month_names[current_month]} {current_year}"
-        
-        data = get_monthly_data(current_year, current_month, brand_filter, aggregate_app)
-        
-        trend.append({
-            "year": current_year,
-            "month": current_month,
-            "month_str": month_str,
-            "data": data
-        })
-        
-        # Vormonat
+        months.append((current_year, current_month))
         current_year, current_month = get_previous_month(current_year, current_month)
-        sleep(0.1)  # Rate limit
+    months.reverse()
+    
+    # Alle 12 Monate gemeinsam laden (eine Abfrage-Runde statt 12)
+    data_by_month = get_months_data(months, brand_filter, aggregate_app)
     
-    # Umkehren (ältester zuerst)
-    return list(reversed(trend))
+    return [
+        {
+            "year": y,
+            "month": m,
+            "month_str": f"{MONTH_NAMES_SHORT_DE[m]} {y}",
+            "data": data_by_month[(y, m)]
+        }
+        for y, m in months
+    ]
 
 
 def get_yoy_comparison(year: int, month: int, brand_filter: str = None, aggregate_app: bool = True) -> Dict:
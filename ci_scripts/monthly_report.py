@@ -32,12 +32,21 @@ import os
 import sys
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import statistics
-import base64
 import argparse
-import time
+import hashlib
+import importlib.util
+import multiprocessing.util
+import threading
+import traceback
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from functools import lru_cache
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Dict, NamedTuple, Optional, Tuple
 from calendar import monthrange
 
 # Importiere monthly_data_utils für intelligente Monatsdaten-Abfragen
@@ -47,6 +56,7 @@ try:
         get_monthly_data,
         get_12_month_trend,
         get_yoy_comparison,
+        aggregate_platforms,
         get_previous_month as util_get_previous_month
     )
     MONTHLY_UTILS_AVAILABLE = True
@@ -54,16 +64,50 @@ except ImportError:
     MONTHLY_UTILS_AVAILABLE = False
     print("⚠️ monthly_data_utils nicht verfügbar - Fallback auf Legacy-Modus")
 
-# Plotly für Diagramme
+# orjson (optional) - schnelleres Parsen der API-Antworten und Serialisieren der Teams-Card
 try:
-    import plotly.express as px
-    import plotly.graph_objects as go
-    import pandas as pd
-    PLOTLY_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PLOTLY_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# Plotly für Diagramme
+if TYPE_CHECKING:
+    import plotly.graph_objects as go  # nur für Typ-Annotationen
+# Nur Verfügbarkeit prüfen - importiert wird erst beim ersten Diagramm (_get_go)
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
+if not PLOTLY_AVAILABLE:
     print("⚠️ Plotly nicht verfügbar - keine Diagramme möglich")
 
+
+@lru_cache(maxsize=1)
+def _get_go():
+    """
+    plotly.graph_objects (lazy, einmal pro Prozess importiert).
+    
+    Registriert beim ersten Aufruf das Template "oewa" mit dem gemeinsamen
+    Layout aller Report-Diagramme; die create_*-Funktionen setzen nur noch
+    ihre Abweichungen (Titel, Legende, Achsen-Spezialfälle).
+    """
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    
+    pio.templates["oewa"] = go.layout.Template(layout=dict(
+        width=CHART_WIDTH,
+        height=CHART_HEIGHT,
+        font=dict(size=14),
+        title_font_size=18,
+        xaxis=dict(title=""),
+        yaxis=dict(tickformat=",", title="")
+    ))
+    pio.templates.default = "plotly+oewa"
+    return go
+
+
+# Horizontale Legende oben rechts (Balken-/Liniendiagramme). Bewusst nicht im
+# Template: Pies und das Dashboard-Raster behalten die Standard-Legende.
+LEGEND_TOP = dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, title_text="")
+
 # =============================================================================
 # KONFIGURATION
 # =============================================================================
@@ -72,6 +116,7 @@ AIRTABLE_BASE_ID = os.environ.get("AIRTABLE_BASE_ID", "")  # Muss in CI/CD Varia
 TEAMS_WEBHOOK_URL = os.environ.get("TEAMS_WEBHOOK_URL", "")
 TEAMS_WEBHOOK_URL_SECONDARY = os.environ.get("TEAMS_WEBHOOK_URL_SECONDARY", "")  # Zusätzlicher Teams Channel
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
+OEWA_DEBUG = os.environ.get("OEWA_DEBUG", "") not in ("", "0")  # Tracebacks bei Fehlern ausgeben
 IMGBB_API_KEY = os.environ.get("IMGBB_API_KEY", "")
 INFONLINE_API_KEY = os.environ.get("INFONLINE_API_KEY", "")  # Für direkte API-Abfragen
 
@@ -91,10 +136,44 @@ INFONLINE_METRICS = {
     "uniqueclients": {"api_field": "uclients", "display_name": "Unique Clients"},
 }
 
+# Parallele Abfragen (I/O-bound); die Semaphore begrenzt gleichzeitige
+# Requests, _infonline_throttle die Rate (INFONLINE_MAX_RPS über alle Threads)
+INFONLINE_MAX_WORKERS = 12
+INFONLINE_MAX_CONCURRENT = 5
+INFONLINE_MAX_RPS = 5
+_INFONLINE_SEMAPHORE = threading.Semaphore(INFONLINE_MAX_CONCURRENT)
+_infonline_lock = threading.Lock()
+_infonline_next_slot = 0.0
+
 # Chart-Größe (optimiert für Teams)
 CHART_WIDTH = 1200  # Reduziert für schnelleren Upload
 CHART_HEIGHT = 600
-CHART_SCALE = 2  # Retina-Qualität
+CHART_SCALE = 1.5  # Teams zeigt max. ~800 px breit - 1.5x bleibt scharf, ~44% weniger Pixel als 2x
+
+# Bildformat (png, webp, jpeg). WebP/JPEG sind deutlich kleiner, PNG wird
+# von allen Teams-Clients in MessageCards angezeigt → Standard.
+# SVG geht nicht: imgBB nimmt kein SVG an, Teams zeigt es in Cards nicht an.
+CHART_FORMAT = os.environ.get("CHART_FORMAT", "png").lower()
+CHART_MIME_TYPES = {"png": "image/png", "webp": "image/webp", "jpeg": "image/jpeg"}
+if CHART_FORMAT not in CHART_MIME_TYPES:
+    print(f"⚠️ CHART_FORMAT '{CHART_FORMAT}' nicht unterstützt - verwende png")
+    CHART_FORMAT = "png"
+CHART_RENDER_WORKERS = int(os.environ.get("CHART_RENDER_WORKERS", os.cpu_count() or 1))
+CHART_CACHE_DIR = os.environ.get("CHART_CACHE_DIR", ".chart_cache")  # PNG-Cache (Key = Figure-Inhalt)
+CHART_URL_CACHE = os.path.join(CHART_CACHE_DIR, "urls.json")  # imgBB-URLs bereits hochgeladener Bilder
+
+# Interaktive Detail-Charts über GitLab Pages (statt PNG-Rendering + imgBB-Upload).
+# Nur aktiv wenn CHART_PAGES_URL gesetzt ist, z.B.
+# https://florian1143.gitlab.io/oewa-reporter/charts/monthly
+CHART_PAGES_DIR = os.environ.get("CHART_PAGES_DIR", "public/charts/monthly")
+CHART_PAGES_URL = os.environ.get("CHART_PAGES_URL", "")
+INTERACTIVE_ONLY_CHARTS = ("12-Monats-Trend PI", "12-Monats-Trend Visits", "MoM-Übersicht")
+
+# Dashboard (opt-in): CHART_DASHBOARD=1 → Detail-Charts als ein Raster-Bild
+# (ein Render, ein Upload). Standard bleibt ein Bild pro Diagramm.
+CHART_DASHBOARD = os.environ.get("CHART_DASHBOARD", "0") == "1"
+DASHBOARD_STANDALONE_CHARTS = ("PI MoM-Vergleich",)  # bleiben einzeln als Vorschau in der Card
+DASHBOARD_ROW_HEIGHT = 450
 
 # Farben - NUR VOL (Vienna ausgeschlossen)
 BRAND_COLORS = {
@@ -106,6 +185,10 @@ BRAND_COLORS = {
 
 METRICS = ["Page Impressions", "Visits", "Unique Clients", "Homepage PI"]
 
+# Deutsche Monatsnamen (Index = Monat; calendar.month_name ist locale-abhängig)
+MONTH_NAMES_DE = ("", "Januar", "Februar", "März", "April", "Mai", "Juni",
+                  "Juli", "August", "September", "Oktober", "November", "Dezember")
+
 # Plattform-Farben für getrennte Darstellung
 PLATFORM_COLORS = {
     "Web": "#3B82F6",      # Blau
@@ -117,14 +200,60 @@ PLATFORM_COLORS = {
 # Plattformen, die als "App" zusammengefasst werden
 APP_PLATFORMS = ["iOS", "Android"]
 
+# Chart-Farben (einmal auf Modulebene statt pro Chart-Aufruf)
+TREND_COLORS = {
+    "Web": "#3B82F6",           # Blau
+    "App (Gesamt)": "#60A5FA",  # Hellblau
+    "iOS": "#10B981",           # Grün
+    "Android": "#F59E0B",       # Orange
+}
+MOM_COLORS = {"Aktuell": "#3B82F6", "Vormonat": "#93C5FD"}
+CHANGE_COLORS = {"VOL Web": "#3B82F6", "VOL App": "#10B981"}
+# Aktuelles Jahr / Vorjahr (Keys hängen vom Jahr ab)
+YOY_PALETTE = ("#3B82F6", "#93C5FD")
+# App-Split: (Label, Datenschlüssel, Farbe)
+APP_SPLIT_CONFIG = (
+    ("iOS", "VOL_iOS", "#10B981"),          # Grün
+    ("Android", "VOL_Android", "#F59E0B"),  # Orange
+)
+
 # Metriken ohne YoY (wegen Methodenwechsel)
 YOY_EXCLUDED_METRICS = ["Unique Clients"]
 
+# HTTP-Session für INFOnline, imgBB, OpenAI und Teams:
+# Keep-Alive spart den TLS-Handshake pro Request, Retry/Backoff übernimmt urllib3
+# (inkl. Retry-After bei 429)
+HTTP_MAX_RETRIES = 3
+IMGBB_UPLOAD_WORKERS = 8  # Parallele Chart-Uploads (= pool_maxsize)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=IMGBB_UPLOAD_WORKERS,
+    max_retries=Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "POST"],
+        respect_retry_after_header=True,
+        raise_on_status=False  # Letzte Antwort zurückgeben statt Exception
+    )
+))
+
+# GPT-Antwort-Cache (Re-Runs desselben Monats ohne erneuten OpenAI-Call)
+GPT_CACHE_DIR = os.environ.get("GPT_CACHE_DIR", ".gpt_cache")
+# OEWA_DISABLE_GPT_CACHE=1: gespeicherte Antworten ignorieren (Neu-Generierung erzwingen)
+GPT_CACHE_DISABLED = os.environ.get("OEWA_DISABLE_GPT_CACHE", "") not in ("", "0")
+
+# Stabiler Monat (alle PI-Änderungen unter den Schwellen) → Template statt GPT
+STABLE_MOM_THRESHOLD = 0.02
+STABLE_YOY_THRESHOLD = 0.05
+
 
 # =============================================================================
 # HILFSFUNKTIONEN
 # =============================================================================
 
+@lru_cache(maxsize=256)
 def get_month_dates(year: int, month: int) -> tuple:
     """Gibt Start- und Enddatum eines Monats zurück."""
     start = date(year, month, 1)
@@ -133,6 +262,7 @@ def get_month_dates(year: int, month: int) -> tuple:
     return start, end
 
 
+@lru_cache(maxsize=256)
 def get_previous_month(year: int, month: int) -> tuple:
     """Gibt Jahr und Monat des Vormonats zurück."""
     if month == 1:
@@ -144,6 +274,17 @@ def get_previous_month(year: int, month: int) -> tuple:
 # INFONLINE API DIREKTABFRAGE (für offizielle Monatswerte)
 # =============================================================================
 
+def _infonline_throttle():
+    """Wartet auf den nächsten freien Request-Slot (max. INFONLINE_MAX_RPS/s über alle Threads)."""
+    global _infonline_next_slot
+    with _infonline_lock:
+        now = monotonic()
+        slot = max(now, _infonline_next_slot)
+        _infonline_next_slot = slot + 1 / INFONLINE_MAX_RPS
+    if slot > now:
+        sleep(slot - now)
+
+
 def fetch_infonline_monthly(site_id: str, metric: str, year: int, month: int) -> dict:
     """
     Ruft offizielle Monatsdaten von der INFOnline API ab.
@@ -175,9 +316,11 @@ def fetch_infonline_monthly(site_id: str, metric: str, year: int, month: int) ->
     }
     
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+        with _INFONLINE_SEMAPHORE:
+            _infonline_throttle()
+            response = _SESSION.get(url, params=params, headers=headers, timeout=30)
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json_response(response)
             # IOM-Daten (hochgerechneter offizieller Wert) extrahieren
             if "iom" in data and len(data["iom"]) > 0:
                 iom = data["iom"][0]
@@ -194,11 +337,48 @@ def fetch_infonline_monthly(site_id: str, metric: str, year: int, month: int) ->
         return {"success": False, "error": str(e)}
 
 
-def fetch_all_monthly_data_from_api(year: int, month: int) -> Dict:
+def fetch_infonline_months(months: List[Tuple[int, int]]) -> Dict[Tuple[int, int], Dict[Tuple[str, str], dict]]:
+    """
+    Ruft alle (Plattform, Metrik)-Werte für mehrere Monate parallel ab.
+    
+    Die Abfragen sind unabhängig und rein I/O-bound → Thread-Pool statt
+    sequenzieller Requests; gleichzeitige Requests begrenzt
+    _INFONLINE_SEMAPHORE, die Request-Rate _infonline_throttle.
+    
+    Args:
+        months: Liste von (Jahr, Monat)
+    
+    Returns:
+        {(Jahr, Monat): {(Plattform, Metrik): Ergebnis von fetch_infonline_monthly}}
+    """
+    results = {ym: {} for ym in months}
+    
+    with ThreadPoolExecutor(max_workers=INFONLINE_MAX_WORKERS) as executor:
+        futures = {}
+        for ym in results:
+            for platform, site_info in INFONLINE_SITES.items():
+                # Homepage hat nur Page Impressions
+                metrics_to_fetch = ["pageimpressions"] if platform == "Homepage" else list(INFONLINE_METRICS.keys())
+                for metric in metrics_to_fetch:
+                    future = executor.submit(fetch_infonline_monthly, site_info["site_id"], metric, *ym)
+                    futures[future] = (ym, platform, metric)
+        
+        for future in as_completed(futures):
+            ym, platform, metric = futures[future]
+            results[ym][(platform, metric)] = future.result()
+    
+    return results
+
+
+def fetch_all_monthly_data_from_api(year: int, month: int, api_results: Dict[Tuple[str, str], dict] = None) -> Dict:
     """
     Ruft ALLE Monatsdaten für VOL.AT direkt von der INFOnline API ab.
     Gibt Daten im gleichen Format zurück wie get_monthly_data().
     
+    Args:
+        api_results: Bereits abgerufene Rohwerte aus fetch_infonline_months()
+                     (sonst werden sie hier abgerufen)
+    
     Returns:
         Dict im Format:
         {
@@ -219,12 +399,15 @@ def fetch_all_monthly_data_from_api(year: int, month: int) -> Dict:
     
     print(f"      API-Key vorhanden: {INFONLINE_API_KEY[:10]}...{INFONLINE_API_KEY[-4:]}")
     
+    if api_results is None:
+        api_results = fetch_infonline_months([(year, month)])[(year, month)]
+    
     result = {}
     api_errors = []
     api_successes = 0
     
-    for platform, site_info in INFONLINE_SITES.items():
-        site_id = site_info["site_id"]
+    # Auswertung in fester Reihenfolge (unabhängig von der Abschlussreihenfolge)
+    for platform in INFONLINE_SITES:
         key = f"VOL_{platform}"
         result[key] = {}
         
@@ -232,7 +415,7 @@ def fetch_all_monthly_data_from_api(year: int, month: int) -> Dict:
         metrics_to_fetch = ["pageimpressions"] if platform == "Homepage" else list(INFONLINE_METRICS.keys())
         
         for metric in metrics_to_fetch:
-            api_result = fetch_infonline_monthly(site_id, metric, year, month)
+            api_result = api_results[(platform, metric)]
             
             if api_result.get("success"):
                 display_name = INFONLINE_METRICS.get(metric, {}).get("display_name", metric)
@@ -244,9 +427,6 @@ def fetch_all_monthly_data_from_api(year: int, month: int) -> Dict:
                 error_msg = f"{platform}/{metric}: {api_result.get('error', 'Unbekannter Fehler')}"
                 api_errors.append(error_msg)
                 print(f"      ⚠️ {error_msg}")
-        
-        # Kurze Pause für Rate Limiting
-        time.sleep(0.1)
     
     # Prüfe ob überhaupt Daten abgerufen wurden
     if api_successes == 0:
@@ -296,22 +476,27 @@ def fetch_monthly_comparison_from_api(year: int, month: int) -> Tuple[Dict, Dict
     """
     print(f"\n📥 Lade Monatsdaten direkt von INFOnline API...")
     
+    prev_year, prev_month = get_previous_month(year, month)
+    
+    # Alle drei Zeiträume in einem Durchgang parallel abrufen
+    api_results = fetch_infonline_months([(year, month), (prev_year, prev_month), (year - 1, month)])
+    
     # Aktueller Monat
     print(f"   → Aktueller Monat: {month:02d}/{year}")
-    current_data = fetch_all_monthly_data_from_api(year, month)
+    current_data = fetch_all_monthly_data_from_api(year, month, api_results[(year, month)])
     
     # Vormonat
-    prev_year, prev_month = get_previous_month(year, month)
     print(f"   → Vormonat: {prev_month:02d}/{prev_year}")
-    prev_month_data = fetch_all_monthly_data_from_api(prev_year, prev_month)
+    prev_month_data = fetch_all_monthly_data_from_api(prev_year, prev_month, api_results[(prev_year, prev_month)])
     
     # Vorjahr (gleicher Monat)
     print(f"   → Vorjahr: {month:02d}/{year - 1}")
-    prev_year_data = fetch_all_monthly_data_from_api(year - 1, month)
+    prev_year_data = fetch_all_monthly_data_from_api(year - 1, month, api_results[(year - 1, month)])
     
     return current_data, prev_month_data, prev_year_data
 
 
+@lru_cache(maxsize=256)
 def format_number(n: float) -> str:
     """Formatiert große Zahlen lesbar (z.B. 35.5M, 12.3M)."""
     if n >= 1_000_000:
@@ -321,6 +506,32 @@ def format_number(n: float) -> str:
     return f"{n:,.0f}"
 
 
+def pct_change(current: float, previous: float) -> Optional[float]:
+    """Relative Änderung current vs. previous (None ohne Vergleichswert > 0)."""
+    if previous > 0:
+        return (current - previous) / previous
+    return None
+
+
+def compute_changes(current: Dict, reference: Dict) -> Dict:
+    """
+    Relative Änderungen pro Plattform und Metrik (MoM/YoY).
+    
+    Args:
+        current: {key: {metric: Wert}}
+        reference: Vergleichszeitraum im selben Format
+    
+    Returns:
+        {key: {metric: Änderung oder None}} für alle keys, die in beiden vorkommen
+    """
+    return {
+        key: {metric: pct_change(value, reference[key].get(metric, 0)) for metric, value in metrics.items()}
+        for key, metrics in current.items()
+        if key in reference
+    }
+
+
+@lru_cache(maxsize=256)
 def format_change(change: Optional[float], prefix: str = "") -> str:
     """Formatiert prozentuale Änderung."""
     if change is None:
@@ -328,77 +539,273 @@ def format_change(change: Optional[float], prefix: str = "") -> str:
     return f"{prefix}{change*100:+.2f}%"
 
 
+@lru_cache(maxsize=256)
+def format_num_de(value: int) -> str:
+    """Formatiert Zahl mit Punkt als Tausendertrennzeichen (deutsch)."""
+    return f"{value:,}".replace(",", ".")
+
+
+@lru_cache(maxsize=256)
+def format_pct(change: Optional[float], is_uc_yoy: bool = False) -> str:
+    """Formatiert prozentuale Änderung kurz: +2% oder -3% (Teams-KPI-Zeilen)."""
+    if is_uc_yoy:
+        return "N/A"
+    if change is None:
+        return "N/A"
+    pct = change * 100
+    if pct >= 0:
+        return f"+{pct:.0f}%"
+    return f"{pct:.0f}%"
+
+
+def parse_json_response(response: requests.Response) -> Dict:
+    """Parst eine JSON-Response - mit orjson falls verfügbar, sonst stdlib."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def dump_json(obj) -> bytes:
+    """Serialisiert einen Request-Body (UTF-8) - mit orjson falls verfügbar, sonst stdlib."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+class PlatformShare(NamedTuple):
+    """Web/App-Summen und -Anteile (einmal pro Report berechnet)."""
+    web_pi: int
+    app_pi: int
+    total_pi: int
+    web_visits: int
+    app_visits: int
+    total_visits: int
+    web_share: float  # PI-Anteil Web in %
+    app_share: float  # PI-Anteil App in %
+
+
+def compute_platform_share(data: Dict) -> PlatformShare:
+    """
+    Berechnet Web/App-Summen und PI-Anteile aus den verarbeiteten Daten.
+    Nur Web + App zählen (iOS/Android sind in App enthalten).
+    """
+    web = data.get("VOL_Web", {})
+    app = data.get("VOL_App", {})
+    web_pi = web.get("Page Impressions", {}).get("current_sum", 0)
+    app_pi = app.get("Page Impressions", {}).get("current_sum", 0)
+    web_visits = web.get("Visits", {}).get("current_sum", 0)
+    app_visits = app.get("Visits", {}).get("current_sum", 0)
+    total_pi = web_pi + app_pi
+    web_share = (web_pi / total_pi * 100) if total_pi > 0 else 0
+    app_share = (app_pi / total_pi * 100) if total_pi > 0 else 0
+    return PlatformShare(web_pi, app_pi, total_pi,
+                         web_visits, app_visits, web_visits + app_visits,
+                         web_share, app_share)
+
+
+class PlatformMetrics(NamedTuple):
+    """Alle KPIs einer Plattform (VOL_Web/App/iOS/Android) als flaches Objekt."""
+    visits: int
+    visits_prev: int
+    visits_mom: Optional[float]
+    visits_yoy: Optional[float]
+    visits_prev_year: int
+    pi: int
+    pi_prev: int
+    pi_mom: Optional[float]
+    pi_yoy: Optional[float]
+    pi_prev_year: int
+    uc: int
+    uc_prev: int
+    uc_mom: Optional[float]
+    hppi: int
+    hppi_mom: Optional[float]
+    hppi_yoy: Optional[float]
+
+
+PLATFORM_KEYS = ("VOL_Web", "VOL_App", "VOL_iOS", "VOL_Android")
+
+
+def extract_platform_metrics(data: Dict, yoy_data: Dict) -> Dict[str, PlatformMetrics]:
+    """
+    Liest data und yoy_data in einem Durchlauf in PlatformMetrics pro Plattform.
+    Nachfolgender Code greift nur noch per Attribut zu (kein .get()-Kettenlesen).
+    """
+    yoy_changes = yoy_data.get("yoy_changes", {})
+    prev_year_data = yoy_data.get("previous_year", {}).get("data", {})
+    
+    metrics = {}
+    for key in PLATFORM_KEYS:
+        platform_data = data.get(key, {})
+        yoy_platform = yoy_changes.get(key, {})
+        prev_year_platform = prev_year_data.get(key, {})
+        visits = platform_data.get("Visits", {})
+        pi = platform_data.get("Page Impressions", {})
+        uc = platform_data.get("Unique Clients", {})
+        hppi = platform_data.get("Homepage PI", {})
+        
+        metrics[key] = PlatformMetrics(
+            visits=visits.get("current_sum", 0),
+            visits_prev=visits.get("prev_sum", 0),
+            visits_mom=visits.get("mom_change"),
+            visits_yoy=yoy_platform.get("Visits"),
+            visits_prev_year=prev_year_platform.get("Visits", 0),
+            pi=pi.get("current_sum", 0),
+            pi_prev=pi.get("prev_sum", 0),
+            pi_mom=pi.get("mom_change"),
+            pi_yoy=yoy_platform.get("Page Impressions"),
+            pi_prev_year=prev_year_platform.get("Page Impressions", 0),
+            uc=uc.get("current_sum", 0),
+            uc_prev=uc.get("prev_sum", 0),
+            uc_mom=uc.get("mom_change"),
+            hppi=hppi.get("current_sum", 0),
+            hppi_mom=hppi.get("mom_change"),
+            hppi_yoy=yoy_platform.get("Homepage PI"),
+        )
+    return metrics
+
+
 # =============================================================================
 # ROBUSTER IMAGE UPLOAD (mit Retry)
 # =============================================================================
 
-def upload_to_imgbb(image_bytes: bytes, max_retries: int = 3) -> Optional[str]:
+# imgBB-Antworten, nach denen weitere Uploads in diesem Lauf zwecklos sind
+# (ungültiger Key bzw. Rate-Limit auch nach den Session-Retries)
+IMGBB_FATAL_STATUS = (401, 403, 429)
+_IMGBB_DISABLED = False
+
+
+def upload_to_imgbb(image_bytes: bytes) -> Optional[str]:
     """
-    Lädt ein Bild zu imgBB hoch mit Retry-Mechanismus.
+    Lädt ein Bild zu imgBB hoch.
+    
+    Retries mit exponentiellem Backoff (429/5xx, Verbindungsfehler)
+    übernimmt der HTTPAdapter der Modul-Session.
     
     Args:
         image_bytes: PNG-Bilddaten
-        max_retries: Maximale Anzahl Versuche
     
     Returns:
         URL des hochgeladenen Bildes oder None
     """
+    global _IMGBB_DISABLED
     if not image_bytes or not IMGBB_API_KEY:
         if not IMGBB_API_KEY:
             print("   ⚠️ IMGBB_API_KEY nicht konfiguriert")
         return None
+    if _IMGBB_DISABLED:
+        return None
     
-    for attempt in range(max_retries):
+    try:
+        print(f"   📤 Upload ({len(image_bytes)} bytes)...")
+        
+        response = _SESSION.post(
+            "https://api.imgbb.com/1/upload",
+            data={
+                "key": IMGBB_API_KEY,
+                "expiration": 0  # Permanent
+            },
+            # Multipart-Upload: Rohdaten statt Base64 (~33% kleinerer Request)
+            files={"image": (f"chart.{CHART_FORMAT}", image_bytes, CHART_MIME_TYPES[CHART_FORMAT])},
+            timeout=90  # Erhöht für große Bilder
+        )
+        
+        if response.status_code == 200:
+            url = parse_json_response(response)["data"]["url"]
+            print(f"   ✅ Upload erfolgreich: {url[:50]}...")
+            return url
+        
+        print(f"   ⚠️ HTTP {response.status_code}")
+        if response.status_code in IMGBB_FATAL_STATUS:
+            # Restliche Charts nicht mehr hochladen (spart deren Retry-Backoff)
+            _IMGBB_DISABLED = True
+            print("   ⛔ imgBB abgelehnt - weitere Uploads in diesem Lauf übersprungen")
         try:
-            print(f"   📤 Upload-Versuch {attempt + 1}/{max_retries} ({len(image_bytes)} bytes)...")
-            
-            response = requests.post(
-                "https://api.imgbb.com/1/upload",
-                data={
-                    "key": IMGBB_API_KEY,
-                    "image": base64.b64encode(image_bytes).decode("utf-8"),
-                    "expiration": 0  # Permanent
-                },
-                timeout=90  # Erhöht für große Bilder
-            )
-            
-            if response.status_code == 200:
-                url = response.json()["data"]["url"]
-                print(f"   ✅ Upload erfolgreich: {url[:50]}...")
-                return url
-            else:
-                print(f"   ⚠️ HTTP {response.status_code}")
-                try:
-                    error_info = response.json()
-                    if "error" in error_info:
-                        print(f"      Fehler: {error_info['error']}")
-                except:
-                    pass
-                
-                # Exponential Backoff
-                if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt
-                    print(f"   ⏳ Warte {wait_time}s vor erneutem Versuch...")
-                    time.sleep(wait_time)
-                    
-        except requests.exceptions.Timeout:
-            print(f"   ⚠️ Timeout bei Versuch {attempt + 1}")
-            if attempt < max_retries - 1:
-                time.sleep(2)
-        except Exception as e:
-            print(f"   ⚠️ Fehler: {type(e).__name__}: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2)
+            error_info = parse_json_response(response)
+            if "error" in error_info:
+                print(f"      Fehler: {error_info['error']}")
+        except:
+            pass
+    except requests.exceptions.Timeout:
+        print("   ⚠️ Timeout beim Upload")
+    except Exception as e:
+        print(f"   ⚠️ Fehler: {type(e).__name__}: {e}")
     
     print("   ❌ Upload nach allen Versuchen fehlgeschlagen")
     return None
 
 
+def _read_chart_url_cache() -> Dict[str, str]:
+    """Liefert {MD5 des Bildes: imgBB-URL} aus früheren Läufen (leer bei Fehler)."""
+    try:
+        with open(CHART_URL_CACHE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_chart_url_cache(url_cache: Dict[str, str]):
+    """Speichert den URL-Cache (Fehler beim Schreiben sind nicht kritisch)."""
+    try:
+        os.makedirs(CHART_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{CHART_URL_CACHE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(url_cache, f)
+        os.replace(tmp_path, CHART_URL_CACHE)
+    except OSError as e:
+        print(f"   ⚠️ Chart-URL-Cache nicht beschreibbar: {e}")
+
+
+def upload_charts(charts: Iterable[Tuple[str, bytes]], order: List[str] = None) -> Dict[str, str]:
+    """
+    Lädt mehrere Diagramme parallel zu imgBB hoch.
+    
+    Jeder Upload startet, sobald sein PNG vorliegt - charts darf ein
+    Iterator sein, der noch rendert (siehe render_charts). Bricht der
+    Iterator mit einem Fehler ab, bleiben die bis dahin gelieferten
+    Diagramme erhalten. Bilder, die schon in einem früheren Lauf
+    hochgeladen wurden (gleiche Bytes), verwenden die gespeicherte URL
+    (Uploads sind permanent).
+    
+    Args:
+        charts: (Name, PNG-Bytes)-Paare
+        order: Reihenfolge der Namen im Ergebnis (Default: Eingangsreihenfolge)
+    
+    Returns:
+        {Name: URL}, fehlgeschlagene Uploads fehlen
+    """
+    url_cache = _read_chart_url_cache()
+    image_keys = {}
+    futures = {}
+    with ThreadPoolExecutor(max_workers=IMGBB_UPLOAD_WORKERS) as executor:
+        try:
+            for name, png in charts:
+                image_keys[name] = hashlib.md5(png).hexdigest()
+                if image_keys[name] not in url_cache:
+                    futures[name] = executor.submit(upload_to_imgbb, png)
+        except Exception as e:
+            print(f"   ⚠️ Diagramm-Fehler: {type(e).__name__}: {e} - lade {len(image_keys)} fertige Diagramme hoch")
+    
+    uploaded = {image_keys[name]: future.result() for name, future in futures.items() if future.result()}
+    if len(futures) < len(image_keys):
+        print(f"   ♻️ {len(image_keys) - len(futures)} Diagramme bereits hochgeladen (URL aus Cache)")
+    if uploaded:
+        url_cache.update(uploaded)
+        _write_chart_url_cache(url_cache)
+    
+    urls = {name: url_cache.get(key) for name, key in image_keys.items()}
+    if order is not None:
+        urls = {name: urls[name] for name in order if name in urls}
+    return {name: url for name, url in urls.items() if url}
+
+
 # =============================================================================
 # DIAGRAMM-FUNKTIONEN
 # =============================================================================
+# Die create_*-Funktionen bauen nur die Figure; gerendert wird gesammelt
+# (und parallel) in render_charts().
 
-def create_summary_chart(data: Dict) -> Optional[bytes]:
+def create_summary_chart(data: Dict) -> Optional["go.Figure"]:
     """
     Erstellt ein Gesamt-Übersichts-Balkendiagramm (Web vs. App).
     Zeigt PI und Visits nebeneinander.
@@ -406,53 +813,44 @@ def create_summary_chart(data: Dict) -> Optional[bytes]:
     if not PLOTLY_AVAILABLE:
         return None
     
-    chart_data = []
+    # Direkt nach Plattform gruppieren (ein Trace pro Plattform, ohne DataFrame)
+    traces = {}
     
     for metric in ["Page Impressions", "Visits"]:
         for platform in ["Web", "App"]:
             key = f"VOL_{platform}"
             if key in data and metric in data[key]:
-                m = data[key][metric]
-                chart_data.append({
-                    "metrik": metric,
-                    "plattform": platform,
-                    "wert": m.get("current_sum", 0),
-                    "mom": m.get("mom_change", 0) or 0
-                })
+                xs, ys = traces.setdefault(platform, ([], []))
+                xs.append(metric)
+                ys.append(data[key][metric].get("current_sum", 0))
     
-    if not chart_data:
+    if not traces:
         return None
     
-    df = pd.DataFrame(chart_data)
+    go = _get_go()
     
-    fig = px.bar(
-        df,
-        x="metrik",
-        y="wert",
-        color="plattform",
-        barmode="group",
-        title="📊 VOL Monatssummary - Web vs. App",
-        color_discrete_map=PLATFORM_COLORS,
-        text=df["wert"].apply(lambda x: format_number(x))
-    )
+    fig = go.Figure([
+        go.Bar(
+            name=platform,
+            x=xs,
+            y=ys,
+            marker_color=PLATFORM_COLORS.get(platform),
+            text=[format_number(y) for y in ys],
+            textposition="outside"
+        )
+        for platform, (xs, ys) in traces.items()
+    ])
     
     fig.update_layout(
-        yaxis=dict(tickformat=",", title=""),
-        xaxis_title="",
-        legend_title="",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        width=CHART_WIDTH,
-        height=CHART_HEIGHT,
-        font=dict(size=14),
-        title_font_size=18
+        title="📊 VOL Monatssummary - Web vs. App",
+        barmode="group",
+        legend=LEGEND_TOP
     )
     
-    fig.update_traces(textposition="outside")
-    
-    return fig.to_image(format="png", scale=CHART_SCALE)
+    return fig
 
 
-def create_mom_comparison_chart(data: Dict, metric: str = "Page Impressions", include_ios_android: bool = True) -> Optional[bytes]:
+def create_mom_comparison_chart(data: Dict, metric: str = "Page Impressions", include_ios_android: bool = True) -> Optional["go.Figure"]:
     """
     Erstellt ein MoM-Vergleichs-Balkendiagramm.
     Inkl. iOS/Android wenn include_ios_android=True.
@@ -460,7 +858,8 @@ def create_mom_comparison_chart(data: Dict, metric: str = "Page Impressions", in
     if not PLOTLY_AVAILABLE:
         return None
     
-    chart_data = []
+    # Spaltenweise sammeln: ein Trace für Aktuell, einer für Vormonat
+    labels, current_values, prev_values = [], [], []
     
     # Basis: Web und App (aggregiert)
     platforms = ["VOL_Web", "VOL_App"]
@@ -478,52 +877,31 @@ def create_mom_comparison_chart(data: Dict, metric: str = "Page Impressions", in
             if key == "VOL_App":
                 label = "App (Gesamt)"
             
-            chart_data.append({
-                "property": label,
-                "wert": m.get("current_sum", 0),
-                "periode": "Aktuell"
-            })
-            
-            chart_data.append({
-                "property": label,
-                "wert": m.get("prev_sum", 0),
-                "periode": "Vormonat"
-            })
+            labels.append(label)
+            current_values.append(m.get("current_sum", 0))
+            prev_values.append(m.get("prev_sum", 0))
     
-    if not chart_data:
+    if not labels:
         return None
     
-    df = pd.DataFrame(chart_data)
+    go = _get_go()
     
-    fig = px.bar(
-        df,
-        x="property",
-        y="wert",
-        color="periode",
-        barmode="group",
-        title=f"📊 {metric} - MoM Vergleich (Web, App, iOS, Android)",
-        color_discrete_map={
-            "Aktuell": "#3B82F6",
-            "Vormonat": "#93C5FD"
-        }
-    )
+    fig = go.Figure([
+        go.Bar(name="Aktuell", x=labels, y=current_values, marker_color=MOM_COLORS["Aktuell"]),
+        go.Bar(name="Vormonat", x=labels, y=prev_values, marker_color=MOM_COLORS["Vormonat"]),
+    ])
     
     fig.update_layout(
-        yaxis=dict(tickformat=",", title=""),
-        xaxis_title="",
-        legend_title="",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        width=CHART_WIDTH,
-        height=CHART_HEIGHT,
-        font=dict(size=14),
-        title_font_size=18
+        title=f"📊 {metric} - MoM Vergleich (Web, App, iOS, Android)",
+        barmode="group",
+        legend=LEGEND_TOP
     )
     
-    return fig.to_image(format="png", scale=CHART_SCALE)
+    return fig
 
 
 def create_12_month_trend_chart(trend_data: List[Dict], metric: str = "Page Impressions", 
-                                 trend_data_separate: List[Dict] = None) -> Optional[bytes]:
+                                 trend_data_separate: List[Dict] = None) -> Optional["go.Figure"]:
     """
     Erstellt ein 12-Monats-Trend-Liniendiagramm.
     Optional mit iOS/Android wenn trend_data_separate übergeben wird.
@@ -531,7 +909,8 @@ def create_12_month_trend_chart(trend_data: List[Dict], metric: str = "Page Impr
     if not PLOTLY_AVAILABLE or not trend_data:
         return None
     
-    chart_data = []
+    # Direkt nach Plattform gruppieren (ein Trace pro Linie, ohne DataFrame)
+    traces = {}
     
     # Basis: Web und App (aggregiert)
     for entry in trend_data:
@@ -542,11 +921,9 @@ def create_12_month_trend_chart(trend_data: List[Dict], metric: str = "Page Impr
             key = f"VOL_{platform}"
             if key in data and metric in data[key]:
                 label = "App (Gesamt)" if platform == "App" else platform
-                chart_data.append({
-                    "monat": month_str,
-                    "wert": data[key][metric],
-                    "plattform": label
-                })
+                xs, ys = traces.setdefault(label, ([], []))
+                xs.append(month_str)
+                ys.append(data[key][metric])
     
     # Optional: iOS und Android separat
     if trend_data_separate:
@@ -557,50 +934,30 @@ def create_12_month_trend_chart(trend_data: List[Dict], metric: str = "Page Impr
             for platform in ["iOS", "Android"]:
                 key = f"VOL_{platform}"
                 if key in data and metric in data[key]:
-                    chart_data.append({
-                        "monat": month_str,
-                        "wert": data[key][metric],
-                        "plattform": platform
-                    })
+                    xs, ys = traces.setdefault(platform, ([], []))
+                    xs.append(month_str)
+                    ys.append(data[key][metric])
     
-    if not chart_data:
+    if not traces:
         return None
     
-    df = pd.DataFrame(chart_data)
+    go = _get_go()
     
-    # Erweiterte Farbpalette
-    color_map = {
-        "Web": "#3B82F6",        # Blau
-        "App (Gesamt)": "#60A5FA", # Hellblau
-        "iOS": "#10B981",        # Grün
-        "Android": "#F59E0B",    # Orange
-    }
-    
-    fig = px.line(
-        df,
-        x="monat",
-        y="wert",
-        color="plattform",
-        title=f"📈 {metric} - 12-Monats-Trend (inkl. iOS/Android)",
-        color_discrete_map=color_map,
-        markers=True
-    )
+    fig = go.Figure([
+        go.Scatter(name=label, x=xs, y=ys, mode="lines+markers", line_color=TREND_COLORS.get(label))
+        for label, (xs, ys) in traces.items()
+    ])
     
     fig.update_layout(
-        yaxis=dict(tickformat=",", title=""),
-        xaxis=dict(title="", tickangle=-45),
-        legend_title="",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        width=CHART_WIDTH,
-        height=CHART_HEIGHT,
-        font=dict(size=14),
-        title_font_size=18
+        title=f"📈 {metric} - 12-Monats-Trend (inkl. iOS/Android)",
+        xaxis=dict(tickangle=-45),
+        legend=LEGEND_TOP
     )
     
-    return fig.to_image(format="png", scale=CHART_SCALE)
+    return fig
 
 
-def create_platform_pie_chart(data: Dict, metric: str = "Page Impressions") -> Optional[bytes]:
+def create_platform_pie_chart(data: Dict, metric: str = "Page Impressions") -> Optional["go.Figure"]:
     """
     Erstellt ein Pie Chart für Web vs. App Anteil.
     """
@@ -622,6 +979,8 @@ def create_platform_pie_chart(data: Dict, metric: str = "Page Impressions") -> O
     if not values:
         return None
     
+    go = _get_go()
+    
     fig = go.Figure(data=[go.Pie(
         labels=labels,
         values=values,
@@ -631,18 +990,12 @@ def create_platform_pie_chart(data: Dict, metric: str = "Page Impressions") -> O
         texttemplate="%{label}<br>%{percent:.1%}"
     )])
     
-    fig.update_layout(
-        title=f"📊 {metric} - Plattform-Anteil",
-        width=CHART_WIDTH,
-        height=CHART_HEIGHT,
-        font=dict(size=14),
-        title_font_size=18
-    )
+    fig.update_layout(title=f"📊 {metric} - Plattform-Anteil")
     
-    return fig.to_image(format="png", scale=CHART_SCALE)
+    return fig
 
 
-def create_app_split_pie_chart(data: Dict, metric: str = "Page Impressions") -> Optional[bytes]:
+def create_app_split_pie_chart(data: Dict, metric: str = "Page Impressions") -> Optional["go.Figure"]:
     """
     Erstellt ein Pie Chart für iOS vs. Android Anteil innerhalb der App.
     """
@@ -653,12 +1006,7 @@ def create_app_split_pie_chart(data: Dict, metric: str = "Page Impressions") ->
     labels = []
     colors = []
     
-    platform_config = [
-        ("iOS", "VOL_iOS", "#10B981"),       # Grün
-        ("Android", "VOL_Android", "#F59E0B") # Orange
-    ]
-    
-    for label, key, color in platform_config:
+    for label, key, color in APP_SPLIT_CONFIG:
         if key in data and metric in data[key]:
             m = data[key][metric]
             val = m.get("current_sum", 0)
@@ -670,6 +1018,8 @@ def create_app_split_pie_chart(data: Dict, metric: str = "Page Impressions") ->
     if not values:
         return None
     
+    go = _get_go()
+    
     fig = go.Figure(data=[go.Pie(
         labels=labels,
         values=values,
@@ -679,18 +1029,12 @@ def create_app_split_pie_chart(data: Dict, metric: str = "Page Impressions") ->
         texttemplate="%{label}<br>%{percent:.1%}<br>%{value:,.0f}"
     )])
     
-    fig.update_layout(
-        title=f"📱 App-Aufschlüsselung: iOS vs. Android ({metric})",
-        width=CHART_WIDTH,
-        height=CHART_HEIGHT,
-        font=dict(size=14),
-        title_font_size=18
-    )
+    fig.update_layout(title=f"📱 App-Aufschlüsselung: iOS vs. Android ({metric})")
     
-    return fig.to_image(format="png", scale=CHART_SCALE)
+    return fig
 
 
-def create_yoy_comparison_chart(current_data: Dict, yoy_data: Dict, metric: str = "Page Impressions") -> Optional[bytes]:
+def create_yoy_comparison_chart(current_data: Dict, yoy_data: Dict, metric: str = "Page Impressions") -> Optional["go.Figure"]:
     """
     Erstellt ein YoY-Vergleichs-Balkendiagramm (Aktuell vs. Vorjahr).
     Analog zum Weekly Report KPI-Vergleich.
@@ -698,11 +1042,13 @@ def create_yoy_comparison_chart(current_data: Dict, yoy_data: Dict, metric: str
     if not PLOTLY_AVAILABLE:
         return None
     
-    chart_data = []
+    # Direkt nach Jahr gruppieren (ein Trace pro Jahr, ohne DataFrame)
+    traces = {}
     
     current_year = yoy_data.get("current", {}).get("year", 2025)
-    prev_year = yoy_data.get("previous_year", {}).get("year", 2024)
-    prev_year_data = yoy_data.get("previous_year", {}).get("data", {})
+    previous_year = yoy_data.get("previous_year", {})
+    prev_year = previous_year.get("year", 2024)
+    prev_year_data = previous_year.get("data", {})
     
     for platform in ["Web", "App"]:
         key = f"VOL_{platform}"
@@ -710,54 +1056,39 @@ def create_yoy_comparison_chart(current_data: Dict, yoy_data: Dict, metric: str
         # Aktuelles Jahr
         current_val = current_data.get(key, {}).get(metric, {}).get("current_sum", 0)
         if current_val > 0:
-            chart_data.append({
-                "property": f"VOL {platform}",
-                "wert": current_val,
-                "periode": f"{current_year}"
-            })
+            xs, ys = traces.setdefault(f"{current_year}", ([], []))
+            xs.append(f"VOL {platform}")
+            ys.append(current_val)
         
         # Vorjahr
         prev_val = prev_year_data.get(key, {}).get(metric, 0)
         if prev_val > 0:
-            chart_data.append({
-                "property": f"VOL {platform}",
-                "wert": prev_val,
-                "periode": f"{prev_year}"
-            })
+            xs, ys = traces.setdefault(f"{prev_year}", ([], []))
+            xs.append(f"VOL {platform}")
+            ys.append(prev_val)
     
-    if not chart_data:
+    if not traces:
         return None
     
-    df = pd.DataFrame(chart_data)
+    year_colors = dict(zip((f"{current_year}", f"{prev_year}"), YOY_PALETTE))
     
-    fig = px.bar(
-        df,
-        x="property",
-        y="wert",
-        color="periode",
-        barmode="group",
-        title=f"📊 {metric} - YoY Vergleich (Jahr-über-Jahr)",
-        color_discrete_map={
-            f"{current_year}": "#3B82F6",
-            f"{prev_year}": "#93C5FD"
-        }
-    )
+    go = _get_go()
+    
+    fig = go.Figure([
+        go.Bar(name=year, x=xs, y=ys, marker_color=year_colors[year])
+        for year, (xs, ys) in traces.items()
+    ])
     
     fig.update_layout(
-        yaxis=dict(tickformat=",", title=""),
-        xaxis_title="",
-        legend_title="",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        width=CHART_WIDTH,
-        height=CHART_HEIGHT,
-        font=dict(size=14),
-        title_font_size=18
+        title=f"📊 {metric} - YoY Vergleich (Jahr-über-Jahr)",
+        barmode="group",
+        legend=LEGEND_TOP
     )
     
-    return fig.to_image(format="png", scale=CHART_SCALE)
+    return fig
 
 
-def create_daily_trend_chart(daily_data: Dict, metric: str = "Page Impressions", month_str: str = "") -> Optional[bytes]:
+def create_daily_trend_chart(daily_data: Dict, metric: str = "Page Impressions", month_str: str = "") -> Optional["go.Figure"]:
     """
     Erstellt ein Tages-Trend-Liniendiagramm für den gesamten Monat.
     Analog zum Weekly Report Trend-Chart.
@@ -765,51 +1096,43 @@ def create_daily_trend_chart(daily_data: Dict, metric: str = "Page Impressions",
     if not PLOTLY_AVAILABLE:
         return None
     
-    chart_data = []
+    go = _get_go()
+    
+    traces = []
     
     for platform in ["Web", "App"]:
         key = f"VOL_{platform}"
         if key in daily_data and metric in daily_data[key]:
             daily = daily_data[key][metric].get("daily", {})
-            for datum, wert in daily.items():
-                chart_data.append({
-                    "datum": datum,
-                    "wert": wert,
-                    "property": f"VOL {platform}"
-                })
-    
-    if not chart_data:
+            if not daily:
+                continue
+            # ISO-Datumsstrings sortieren lexikografisch = chronologisch,
+            # Plotly erkennt sie selbst als Datumsachse
+            daten = sorted(daily)
+            label = f"VOL {platform}"
+            traces.append(go.Scatter(
+                name=label,
+                x=daten,
+                y=[daily[d] for d in daten],
+                mode="lines+markers",
+                line_color=BRAND_COLORS.get(label)
+            ))
+    
+    if not traces:
         return None
     
-    df = pd.DataFrame(chart_data)
-    df["datum"] = pd.to_datetime(df["datum"])
-    df = df.sort_values("datum")
-    
-    fig = px.line(
-        df,
-        x="datum",
-        y="wert",
-        color="property",
-        title=f"📈 {metric} - Tagestrend {month_str}",
-        color_discrete_map=BRAND_COLORS,
-        markers=True
-    )
+    fig = go.Figure(traces)
     
     fig.update_layout(
-        yaxis=dict(tickformat=",", title=""),
-        xaxis=dict(tickformat="%d.%m.", title=""),
-        legend_title="",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        width=CHART_WIDTH,
-        height=CHART_HEIGHT,
-        font=dict(size=14),
-        title_font_size=18
+        title=f"📈 {metric} - Tagestrend {month_str}",
+        xaxis=dict(tickformat="%d.%m."),
+        legend=LEGEND_TOP
     )
     
-    return fig.to_image(format="png", scale=CHART_SCALE)
+    return fig
 
 
-def create_multi_metric_comparison_chart(data: Dict) -> Optional[bytes]:
+def create_multi_metric_comparison_chart(data: Dict) -> Optional["go.Figure"]:
     """
     Erstellt ein Vergleichsdiagramm für alle Metriken (PI, Visits).
     Zeigt MoM-Änderungen für Web und App.
@@ -817,65 +1140,359 @@ def create_multi_metric_comparison_chart(data: Dict) -> Optional[bytes]:
     if not PLOTLY_AVAILABLE:
         return None
     
-    chart_data = []
+    # Direkt nach Plattform gruppieren (ein Trace pro Plattform, ohne DataFrame)
+    traces = {}
     
     for metric in ["Page Impressions", "Visits"]:
         for platform in ["Web", "App"]:
             key = f"VOL_{platform}"
             if key in data and metric in data[key]:
-                m = data[key][metric]
-                mom_change = m.get("mom_change", 0) or 0
-                chart_data.append({
-                    "metrik": metric.replace("Page Impressions", "PI"),
-                    "plattform": f"VOL {platform}",
-                    "mom_change": mom_change * 100,  # In Prozent
-                    "farbe": "positiv" if mom_change >= 0 else "negativ"
-                })
+                mom_change = data[key][metric].get("mom_change", 0) or 0
+                xs, ys = traces.setdefault(f"VOL {platform}", ([], []))
+                xs.append(metric.replace("Page Impressions", "PI"))
+                ys.append(mom_change * 100)  # In Prozent
     
-    if not chart_data:
+    if not traces:
         return None
     
-    df = pd.DataFrame(chart_data)
+    go = _get_go()
     
-    fig = px.bar(
-        df,
-        x="metrik",
-        y="mom_change",
-        color="plattform",
-        barmode="group",
-        title="📊 MoM-Änderungen nach Metrik (%)",
-        color_discrete_map={
-            "VOL Web": "#3B82F6",
-            "VOL App": "#10B981"
-        },
-        text=df["mom_change"].apply(lambda x: f"{x:+.1f}%")
-    )
+    fig = go.Figure([
+        go.Bar(
+            name=platform,
+            x=xs,
+            y=ys,
+            marker_color=CHANGE_COLORS[platform],
+            text=[f"{y:+.1f}%" for y in ys],
+            textposition="outside"
+        )
+        for platform, (xs, ys) in traces.items()
+    ])
     
     # Nulllinie hinzufügen
     fig.add_hline(y=0, line_dash="dash", line_color="gray")
     
     fig.update_layout(
+        title="📊 MoM-Änderungen nach Metrik (%)",
+        barmode="group",
         yaxis=dict(title="MoM-Änderung (%)"),
-        xaxis_title="",
-        legend_title="",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        width=CHART_WIDTH,
-        height=CHART_HEIGHT,
-        font=dict(size=14),
-        title_font_size=18
+        legend=LEGEND_TOP
+    )
+    
+    return fig
+
+
+def create_dashboard_grid(figures: List[Tuple[str, "go.Figure"]]) -> Optional["go.Figure"]:
+    """
+    Fasst mehrere Diagramme in ein Raster mit 2 Spalten zusammen.
+    
+    Die Traces werden aus den fertigen Figures übernommen (eine Zelle pro
+    Diagramm, Pie-Charts in einer "domain"-Zelle). Achsen-Einstellungen und
+    Linien (z.B. Nulllinie) wandern mit; die Legende ist nach Diagramm
+    gruppiert.
+    """
+    if not PLOTLY_AVAILABLE or not figures:
+        return None
+    
+    _get_go()  # Template "oewa" registrieren
+    from plotly.subplots import make_subplots
+    
+    rows = (len(figures) + 1) // 2
+    specs = [[None, None] for _ in range(rows)]
+    is_pie = [any(trace.type == "pie" for trace in fig.data) for _, fig in figures]
+    for i, pie in enumerate(is_pie):
+        specs[i // 2][i % 2] = {"type": "domain" if pie else "xy"}
+    
+    grid = make_subplots(
+        rows=rows, cols=2, specs=specs,
+        subplot_titles=[name for name, _ in figures],
+        horizontal_spacing=0.08,
+        vertical_spacing=0.3 / rows
+    )
+    
+    for i, (name, fig) in enumerate(figures):
+        row, col = i // 2 + 1, i % 2 + 1
+        for trace in fig.data:
+            grid.add_trace(
+                dict(trace.to_plotly_json(), legendgroup=name, legendgrouptitle_text=name),
+                row=row, col=col
+            )
+        if is_pie[i]:
+            continue
+        grid.update_xaxes(fig.layout.xaxis.to_plotly_json(), row=row, col=col)
+        grid.update_yaxes(fig.layout.yaxis.to_plotly_json(), row=row, col=col)
+        for shape in fig.layout.shapes:
+            grid.add_shape(shape.to_plotly_json(), row=row, col=col)
+    
+    grid.update_layout(
+        title="📊 VOL Monats-Dashboard",
+        height=rows * DASHBOARD_ROW_HEIGHT,
+        barmode="group",
+        legend=dict(groupclick="toggleitem", tracegroupgap=20)
     )
     
-    fig.update_traces(textposition="outside")
+    return grid
+
+
+# =============================================================================
+# CHART-RENDERING (PARALLEL)
+# =============================================================================
+
+@lru_cache(maxsize=1)
+def _get_kaleido_scope():
+    """
+    Persistenter Kaleido-Scope (kaleido 0.2.x) des aktuellen Prozesses.
+    
+    Der Scope hält Chromium über alle Renders am Leben. Neuere
+    Plotly/Kaleido-Versionen haben keinen Scope mehr → None. Ab Plotly 6.1
+    mit Kaleido 1.x ist pio.kaleido.scope nur noch ein Defaults-Wrapper ohne
+    transform() → ebenfalls None (dort rendert der Kaleido-Server).
+    """
+    try:
+        import plotly.io as pio
+        scope = pio.kaleido.scope
+    except (ImportError, AttributeError):
+        return None
+    return scope if hasattr(scope, "transform") else None
+
+
+@lru_cache(maxsize=1)
+def _start_kaleido_server() -> bool:
+    """
+    Startet einmal pro Prozess einen persistenten Kaleido-Server (kaleido >= 1.1).
+    
+    Ohne Server startet to_image() für jedes Diagramm einen eigenen Chromium;
+    mit Server nutzen alle Renders dieses Prozesses denselben Browser.
+    Ältere Kaleido-Versionen → False (dort hält _get_kaleido_scope Chromium).
+    
+    Der Server arbeitet Aufträge seriell über eine gemeinsame Antwort-Queue ab
+    und ist nicht thread-sicher - parallel gerendert wird daher über Prozesse
+    (render_charts), nie über Threads.
+    """
+    try:
+        import kaleido
+        kaleido.start_sync_server(silence_warnings=True)
+    except (ImportError, AttributeError):
+        return False
+    except Exception as e:
+        print(f"   ⚠️ Kaleido-Server nicht gestartet ({type(e).__name__}: {e})")
+        return False
+    # Finalize statt atexit: läuft auch beim Beenden der Render-Worker-Prozesse
+    multiprocessing.util.Finalize(None, kaleido.stop_sync_server,
+                                  kwargs={"silence_warnings": True}, exitpriority=0)
+    return True
+
+
+def _render_payload(fig: "go.Figure") -> Dict:
+    """
+    Figure als picklebares Dict für Kaleido - ohne ungenutzte Template-Defaults.
+    
+    Das Plotly-Standardtemplate bringt Trace-Defaults für ~25 Typen mit
+    (Heatmap, Surface, Carpet, ...) - über die Hälfte des JSON, das an
+    die Worker und an Chromium geht. Gebraucht werden nur die Typen, die
+    in der Figure vorkommen; das Bild bleibt identisch.
+    """
+    fig_dict = fig.to_dict()  # tiefe Kopie, darf verändert werden
+    template = fig_dict.get("layout", {}).get("template", {})
+    if "data" in template:
+        used = {trace.get("type", "scatter") for trace in fig_dict.get("data", [])}
+        template["data"] = {kind: defaults for kind, defaults in template["data"].items() if kind in used}
+    return fig_dict
+
+
+def _render_image(fig_dict: Dict) -> bytes:
+    """Rendert eine Figure (als picklebares Dict) als CHART_FORMAT - läuft im Worker-Prozess."""
+    # Explizite Größe im Layout (Dashboard-Raster) hat Vorrang
+    layout = fig_dict.get("layout", {})
+    width = layout.get("width", CHART_WIDTH)
+    height = layout.get("height", CHART_HEIGHT)
+    scope = _get_kaleido_scope()
+    if scope is not None:
+        # Kaleido 0.2: Dict direkt an den Scope (ohne erneutes Aufbauen/Validieren der Figure)
+        return scope.transform(fig_dict, format=CHART_FORMAT, width=width,
+                               height=height, scale=CHART_SCALE)
+    # Kaleido 1.x: to_image() über den persistenten Server dieses Prozesses
+    _start_kaleido_server()
+    return _get_go().Figure(fig_dict).to_image(format=CHART_FORMAT, width=width,
+                                               height=height, scale=CHART_SCALE)
+
+
+def _chart_cache_path(fig: "go.Figure") -> str:
+    """
+    Cache-Datei für eine Figure (content-addressed).
+    
+    Der Key umfasst die komplette Figure (Daten, Layout, Monat im Titel/Achsen)
+    plus Render-Skalierung - jede Änderung ergibt automatisch einen neuen Key.
+    """
+    fig_hash = hashlib.md5(f"{fig.to_json()}|{CHART_SCALE}".encode("utf-8")).hexdigest()
+    return os.path.join(CHART_CACHE_DIR, f"{fig_hash}.{CHART_FORMAT}")
+
+
+def _read_chart_cache(path: str) -> Optional[bytes]:
+    """Liefert ein bereits gerendertes PNG oder None."""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_chart_cache(path: str, png: bytes):
+    """Speichert ein gerendertes PNG (Fehler beim Schreiben sind nicht kritisch)."""
+    try:
+        os.makedirs(CHART_CACHE_DIR, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(png)
+    except OSError as e:
+        print(f"   ⚠️ Chart-Cache nicht beschreibbar: {e}")
+
+
+def render_charts(figures: List[Tuple[str, "go.Figure"]]) -> Iterator[Tuple[str, bytes]]:
+    """
+    Rendert mehrere Diagramme parallel zu PNG.
+    
+    Bereits gerenderte Figures kommen aus dem Disk-Cache (CHART_CACHE_DIR).
+    Kaleido/Chromium-Rendering ist CPU-gebunden, daher ein Prozess-Pool
+    statt Threads. Die Render-Jobs werden sofort eingereicht, die Ergebnisse
+    kommen als Iterator, sobald sie fertig sind - der Upload eines Diagramms
+    läuft so schon, während die übrigen noch rendern. Schlägt der Pool
+    fehl, wird seriell gerendert.
+    
+    Args:
+        figures: Liste von (Name, Figure)
+    
+    Returns:
+        Iterator über (Name, PNG-Bytes) in Fertigstellungsreihenfolge
+        (Cache-Treffer zuerst); Diagramme, die auch seriell nicht rendern,
+        fehlen
+    """
+    cache_paths = [_chart_cache_path(fig) for _, fig in figures]
+    pngs = [_read_chart_cache(path) for path in cache_paths]
+    
+    # Nur Cache-Misses rendern
+    missing = [i for i, png in enumerate(pngs) if png is None]
+    if len(missing) < len(figures):
+        print(f"   ♻️ {len(figures) - len(missing)} Diagramme aus Cache")
+    
+    # Jobs jetzt einreichen: die Worker-Prozesse forken, bevor
+    # Upload-/GPT-Threads laufen
+    executor = None
+    futures = {}
+    workers = min(CHART_RENDER_WORKERS, len(missing))
+    if workers > 1:
+        try:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            futures = {executor.submit(_render_image, _render_payload(figures[i][1])): i for i in missing}
+        except Exception as e:
+            print(f"   ⚠️ Paralleles Rendering fehlgeschlagen ({type(e).__name__}: {e}) - rendere seriell")
+            futures = {}
+    
+    def _finish(i: int, png: bytes):
+        if png:
+            _write_chart_cache(cache_paths[i], png)
+            yield figures[i][0], png
+    
+    def _results():
+        try:
+            for i, png in enumerate(pngs):
+                if png is not None:
+                    yield figures[i][0], png
+            
+            done = set()
+            pool_error = None
+            for future in as_completed(futures):
+                try:
+                    png = future.result()
+                except Exception as e:
+                    pool_error = pool_error or e
+                    continue
+                done.add(futures[future])
+                yield from _finish(futures[future], png)
+            
+            # Serieller Fallback (kein Pool oder fehlgeschlagene Jobs)
+            if pool_error is not None:
+                print(f"   ⚠️ Paralleles Rendering fehlgeschlagen ({type(pool_error).__name__}: {pool_error}) - rendere seriell")
+            for i in missing:
+                if i not in done:
+                    try:
+                        png = _render_image(_render_payload(figures[i][1]))
+                    except Exception as e:
+                        # Einzelnes Diagramm überspringen, die übrigen trotzdem rendern
+                        print(f"   ⚠️ {figures[i][0]} nicht gerendert ({type(e).__name__}: {e})")
+                        continue
+                    yield from _finish(i, png)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+    
+    return _results()
+
+
+def publish_interactive_charts(figures: List[Tuple[str, "go.Figure"]], prefix: str) -> Dict[str, str]:
+    """
+    Speichert Detail-Charts als interaktives Plotly-HTML für GitLab Pages.
+    
+    Kein Kaleido-Rendering und kein imgBB-Upload nötig; plotly.js kommt
+    vom CDN, die Datei enthält nur die Figure-Daten (wenige KB).
     
-    return fig.to_image(format="png", scale=CHART_SCALE)
+    Args:
+        figures: Liste von (Name, Figure)
+        prefix: Dateipräfix, z.B. "2025-11" (Links früherer Monate bleiben gültig)
+    
+    Returns:
+        {Name: Pages-URL}
+    """
+    if not figures:
+        return {}
+    
+    os.makedirs(CHART_PAGES_DIR, exist_ok=True)
+    urls = {}
+    for name, fig in figures:
+        # "MoM-Übersicht" → "MoM-Ubersicht" (ASCII-sichere Dateinamen)
+        ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+        slug = "-".join(ascii_name.split())
+        filename = f"{prefix}_{slug}.html"
+        fig.write_html(os.path.join(CHART_PAGES_DIR, filename), include_plotlyjs="cdn", full_html=True)
+        urls[name] = f"{CHART_PAGES_URL.rstrip('/')}/{filename}"
+    
+    return urls
 
 
 # =============================================================================
 # GPT SUMMARY (BULLETPOINT-FORMAT)
 # =============================================================================
 
+def _gpt_cache_path(prompt: str) -> str:
+    """Cache-Datei für einen Prompt (Dateiname = SHA1 des Prompts)."""
+    prompt_hash = hashlib.sha1(prompt.encode("utf-8")).hexdigest()
+    return os.path.join(GPT_CACHE_DIR, f"{prompt_hash}.txt")
+
+
+def _read_gpt_cache(prompt: str) -> Optional[str]:
+    """Liefert eine bereits gespeicherte GPT-Antwort oder None."""
+    if GPT_CACHE_DISABLED:
+        return None
+    try:
+        with open(_gpt_cache_path(prompt), "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_gpt_cache(prompt: str, content: str):
+    """Speichert eine GPT-Antwort (Fehler beim Schreiben sind nicht kritisch)."""
+    try:
+        os.makedirs(GPT_CACHE_DIR, exist_ok=True)
+        with open(_gpt_cache_path(prompt), "w", encoding="utf-8") as f:
+            f.write(content)
+    except OSError as e:
+        print(f"   ⚠️ GPT-Cache nicht beschreibbar: {e}")
+
+
 def generate_bulletpoint_summary(data: Dict, current_month: str, prev_month: str, 
-                                  yoy_data: Dict, trend_data: List[Dict]) -> str:
+                                  yoy_data: Dict, trend_data: List[Dict],
+                                  share: PlatformShare = None,
+                                  platform_metrics: Dict[str, PlatformMetrics] = None) -> str:
     """
     Generiert eine KOMPAKTE GPT-Zusammenfassung im BULLETPOINT-Format.
     Kurz, prägnant, datenorientiert.
@@ -883,63 +1500,82 @@ def generate_bulletpoint_summary(data: Dict, current_month: str, prev_month: str
     if not OPENAI_API_KEY:
         return "• GPT-Zusammenfassung nicht verfügbar (API Key fehlt)"
     
-    # Gesamt-KPIs berechnen
-    total_pi = 0
-    total_visits = 0
-    for key in ["VOL_Web", "VOL_App"]:
-        if key in data:
-            total_pi += data[key].get("Page Impressions", {}).get("current_sum", 0)
-            total_visits += data[key].get("Visits", {}).get("current_sum", 0)
+    # Gesamt-KPIs (einmal in run_monthly_report berechnet)
+    if share is None:
+        share = compute_platform_share(data)
+    total_pi = share.total_pi
+    total_visits = share.total_visits
     
-    # MoM-Änderungen
-    web_pi_mom = data.get("VOL_Web", {}).get("Page Impressions", {}).get("mom_change")
-    app_pi_mom = data.get("VOL_App", {}).get("Page Impressions", {}).get("mom_change")
+    # Plattform-KPIs (ein Durchlauf über data/yoy_data, ebenfalls vorab berechnet)
+    metrics = platform_metrics or extract_platform_metrics(data, yoy_data)
+    web = metrics["VOL_Web"]
+    app = metrics["VOL_App"]
     
-    # YoY-Änderungen
-    yoy_changes = yoy_data.get("yoy_changes", {})
-    web_pi_yoy = yoy_changes.get("VOL_Web", {}).get("Page Impressions")
-    app_pi_yoy = yoy_changes.get("VOL_App", {}).get("Page Impressions")
+    # MoM-/YoY-Änderungen
+    web_pi_mom, web_pi_yoy = web.pi_mom, web.pi_yoy
+    app_pi_mom, app_pi_yoy = app.pi_mom, app.pi_yoy
     
     # Web vs. App Anteil
-    web_pi = data.get("VOL_Web", {}).get("Page Impressions", {}).get("current_sum", 0)
-    app_pi = data.get("VOL_App", {}).get("Page Impressions", {}).get("current_sum", 0)
-    web_share = (web_pi / (web_pi + app_pi) * 100) if (web_pi + app_pi) > 0 else 0
+    web_pi = share.web_pi
+    app_pi = share.app_pi
+    web_share = share.web_share
     
     # iOS/Android Daten (NEU)
-    ios_pi = data.get("VOL_iOS", {}).get("Page Impressions", {}).get("current_sum", 0)
-    android_pi = data.get("VOL_Android", {}).get("Page Impressions", {}).get("current_sum", 0)
-    ios_pi_mom = data.get("VOL_iOS", {}).get("Page Impressions", {}).get("mom_change")
-    android_pi_mom = data.get("VOL_Android", {}).get("Page Impressions", {}).get("mom_change")
+    ios_pi = metrics["VOL_iOS"].pi
+    android_pi = metrics["VOL_Android"].pi
+    ios_pi_mom = metrics["VOL_iOS"].pi_mom
+    android_pi_mom = metrics["VOL_Android"].pi_mom
     ios_share = (ios_pi / app_pi * 100) if app_pi > 0 else 0
     android_share = (android_pi / app_pi * 100) if app_pi > 0 else 0
     
-    # Daten für Prompt aufbereiten
+    # Keine nennenswerten Ausschläge → Standardtext ohne OpenAI-Call.
+    # Fehlende Werte (None) zählen nicht als stabil.
+    mom_changes = (web_pi_mom, app_pi_mom, ios_pi_mom, android_pi_mom)
+    yoy_changes = (web_pi_yoy, app_pi_yoy)
+    if (all(c is not None and abs(c) < STABLE_MOM_THRESHOLD for c in mom_changes)
+            and all(c is not None and abs(c) < STABLE_YOY_THRESHOLD for c in yoy_changes)):
+        print("   → Stabile Entwicklung - Standardtext statt GPT-Call")
+        return f"""📈 **HIGHLIGHT DES MONATS**
+Stabile Entwicklung im {current_month}: {format_number(total_pi)} Page Impressions und {format_number(total_visits)} Visits (Web + App), Web-Anteil {web_share:.0f}%.
+
+📊 **MoM-ENTWICKLUNG (Vormonat)**
+• Web: PI {format_change(web_pi_mom)} ggü. {prev_month} (YoY: {format_change(web_pi_yoy)})
+• App (Gesamt): PI {format_change(app_pi_mom)} ggü. {prev_month} (YoY: {format_change(app_pi_yoy)})
+
+📱 **APP-PLATTFORM-ANALYSE (iOS vs. Android)**
+• iOS: PI {format_change(ios_pi_mom)}, {ios_share:.0f}% der App-PI
+• Android: PI {format_change(android_pi_mom)}, {android_share:.0f}% der App-PI
+
+✅ **GESAMTBEWERTUNG**
+Stabil: alle PI-Änderungen unter ±{STABLE_MOM_THRESHOLD:.0%} (MoM) bzw. ±{STABLE_YOY_THRESHOLD:.0%} (YoY), keine Auffälligkeiten."""
+    
+    # Daten für Prompt aufbereiten (reines ASCII-Markup: Box-Zeichen und Emojis
+    # kosten mehrere Tokens pro Zeichen; Emojis nur im Ausgabeformat unten)
     kpi_summary = f"""
 GESAMT:
-• PI: {format_number(total_pi)} 
-• Visits: {format_number(total_visits)}
-• Web-Anteil: {web_share:.0f}%
+- PI: {format_number(total_pi)} 
+- Visits: {format_number(total_visits)}
+- Web-Anteil: {web_share:.0f}%
 
 WEB:
-• PI: {format_number(web_pi)} (MoM: {format_change(web_pi_mom)} | YoY: {format_change(web_pi_yoy)})
+- PI: {format_number(web_pi)} (MoM: {format_change(web_pi_mom)} | YoY: {format_change(web_pi_yoy)})
 
 APP (GESAMT):
-• PI: {format_number(app_pi)} (MoM: {format_change(app_pi_mom)} | YoY: {format_change(app_pi_yoy)})
+- PI: {format_number(app_pi)} (MoM: {format_change(app_pi_mom)} | YoY: {format_change(app_pi_yoy)})
 
 APP-AUFSCHLÜSSELUNG:
-• iOS: {format_number(ios_pi)} ({ios_share:.0f}%) (MoM: {format_change(ios_pi_mom)})
-• Android: {format_number(android_pi)} ({android_share:.0f}%) (MoM: {format_change(android_pi_mom)})
+- iOS: {format_number(ios_pi)} ({ios_share:.0f}%) (MoM: {format_change(ios_pi_mom)})
+- Android: {format_number(android_pi)} ({android_share:.0f}%) (MoM: {format_change(android_pi_mom)})
 """
 
     prompt = f"""Du bist ein Web-Analytics-Experte. Erstelle eine ULTRAKOMPAKTE Analyse im BULLETPOINT-Format.
 
-═══════════════════════════════════════
-📅 MONAT: {current_month} (nur VOL.AT)
-═══════════════════════════════════════
+---
+MONAT: {current_month} (nur VOL.AT)
+---
 
 {kpi_summary}
-
-═══════════════════════════════════════
+---
 
 WICHTIG:
 - Professioneller, eloquenter Stil für Management-Ebene
@@ -971,8 +1607,14 @@ FORMAT (EXAKT einhalten):
 [1 prägnanter Satz: positiv/stabil/leicht rückläufig/kritisch + Begründung]
 """
 
+    # Identischer Prompt (z.B. Re-Run) → gespeicherte Antwort wiederverwenden
+    cached = _read_gpt_cache(prompt)
+    if cached is not None:
+        print("   ♻️ GPT-Zusammenfassung aus Cache")
+        return cached
+    
     try:
-        response = requests.post(
+        response = _SESSION.post(
             "https://api.openai.com/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {OPENAI_API_KEY}",
@@ -988,7 +1630,9 @@ FORMAT (EXAKT einhalten):
         )
         
         if response.status_code == 200:
-            return response.json()["choices"][0]["message"]["content"]
+            content = parse_json_response(response)["choices"][0]["message"]["content"]
+            _write_gpt_cache(prompt, content)
+            return content
         return f"• GPT-Fehler: {response.status_code}"
     except Exception as e:
         return f"• GPT-Fehler: {str(e)}"
@@ -1000,7 +1644,10 @@ FORMAT (EXAKT einhalten):
 
 def send_monthly_teams_report_v4(title: str, summary: str, data: Dict, 
                                   current_month: str, prev_month: str,
-                                  yoy_data: Dict, image_urls: Dict = None):
+                                  yoy_data: Dict, image_urls: Dict = None,
+                                  share: PlatformShare = None,
+                                  interactive_urls: Dict = None,
+                                  platform_metrics: Dict[str, PlatformMetrics] = None):
     """
     Sendet den Monatsbericht an Teams mit strukturierter KPI-Übersicht.
     
@@ -1021,25 +1668,6 @@ def send_monthly_teams_report_v4(title: str, summary: str, data: Dict,
         print("⚠️ TEAMS_WEBHOOK_URL nicht konfiguriert")
         return
     
-    yoy_changes = yoy_data.get("yoy_changes", {})
-    
-    # === HILFSFUNKTION: Zahl mit Punkt-Trennung formatieren ===
-    def format_num_de(value: int) -> str:
-        """Formatiert Zahl mit Punkt als Tausendertrennzeichen (deutsch)"""
-        return f"{value:,}".replace(",", ".")
-    
-    # === HILFSFUNKTION: Prozent formatieren (kurz) ===
-    def format_pct(change: float, is_uc_yoy: bool = False) -> str:
-        """Formatiert prozentuale Änderung kurz: +2% oder -3%"""
-        if is_uc_yoy:
-            return "N/A"
-        if change is None:
-            return "N/A"
-        pct = change * 100
-        if pct >= 0:
-            return f"+{pct:.0f}%"
-        return f"{pct:.0f}%"
-    
     # === HILFSFUNKTION: Metrik-Zeile formatieren (exakt wie Vorlage) ===
     def format_metric_line(label: str, current: int, mom: float, yoy: float, is_uc: bool = False) -> str:
         """Formatiert: Visits 2.500.000 (MOM: +2%, YOY: +4%)"""
@@ -1047,73 +1675,35 @@ def send_monthly_teams_report_v4(title: str, summary: str, data: Dict,
         yoy_str = format_pct(yoy, is_uc_yoy=is_uc)
         return f"{label} {format_num_de(current)} (MOM: {mom_str}, YOY: {yoy_str})"
     
-    # === DATEN EXTRAHIEREN ===
-    def get_platform_metrics(key: str) -> Dict:
-        """Extrahiert alle Metriken für eine Plattform"""
-        platform_data = data.get(key, {})
-        yoy_platform = yoy_changes.get(key, {})
-        
-        return {
-            "visits": platform_data.get("Visits", {}).get("current_sum", 0),
-            "visits_mom": platform_data.get("Visits", {}).get("mom_change"),
-            "visits_yoy": yoy_platform.get("Visits"),
-            "pi": platform_data.get("Page Impressions", {}).get("current_sum", 0),
-            "pi_mom": platform_data.get("Page Impressions", {}).get("mom_change"),
-            "pi_yoy": yoy_platform.get("Page Impressions"),
-            "uc": platform_data.get("Unique Clients", {}).get("current_sum", 0),
-            "uc_mom": platform_data.get("Unique Clients", {}).get("mom_change"),
-            "hppi": platform_data.get("Homepage PI", {}).get("current_sum", 0),
-            "hppi_mom": platform_data.get("Homepage PI", {}).get("mom_change"),
-            "hppi_yoy": yoy_platform.get("Homepage PI"),
-        }
-    
-    # Plattform-Daten laden
-    web = get_platform_metrics("VOL_Web")
-    app = get_platform_metrics("VOL_App")
-    ios = get_platform_metrics("VOL_iOS")
-    android = get_platform_metrics("VOL_Android")
+    # === DATEN EXTRAHIEREN (ein Durchlauf über data/yoy_data) ===
+    metrics = platform_metrics or extract_platform_metrics(data, yoy_data)
+    web = metrics["VOL_Web"]
+    app = metrics["VOL_App"]
+    ios = metrics["VOL_iOS"]
+    android = metrics["VOL_Android"]
     
     # === GESAMT berechnen (Web + App) ===
-    def calc_mom(curr: int, prev_sum: int) -> float:
-        """Berechnet MoM aus current und prev_sum"""
-        if prev_sum > 0:
-            return (curr - prev_sum) / prev_sum
-        return None
-    
     # Gesamt-Summen
-    total_visits = web["visits"] + app["visits"]
-    total_pi = web["pi"] + app["pi"]
-    total_uc = web["uc"] + app["uc"]
-    total_hppi = web["hppi"]  # HPPI nur Web
-    
-    # Gesamt Prev-Summen für MoM
-    total_visits_prev = (data.get("VOL_Web", {}).get("Visits", {}).get("prev_sum", 0) + 
-                         data.get("VOL_App", {}).get("Visits", {}).get("prev_sum", 0))
-    total_pi_prev = (data.get("VOL_Web", {}).get("Page Impressions", {}).get("prev_sum", 0) + 
-                     data.get("VOL_App", {}).get("Page Impressions", {}).get("prev_sum", 0))
-    total_uc_prev = (data.get("VOL_Web", {}).get("Unique Clients", {}).get("prev_sum", 0) + 
-                     data.get("VOL_App", {}).get("Unique Clients", {}).get("prev_sum", 0))
-    
-    total_visits_mom = calc_mom(total_visits, total_visits_prev)
-    total_pi_mom = calc_mom(total_pi, total_pi_prev)
-    total_uc_mom = calc_mom(total_uc, total_uc_prev)
+    if share is None:
+        share = compute_platform_share(data)
+    total_visits = share.total_visits
+    total_pi = share.total_pi
+    total_uc = web.uc + app.uc
+    total_hppi = web.hppi  # HPPI nur Web
+    
+    # Gesamt MoM aus den Prev-Summen
+    total_visits_mom = pct_change(total_visits, web.visits_prev + app.visits_prev)
+    total_pi_mom = pct_change(total_pi, web.pi_prev + app.pi_prev)
+    total_uc_mom = pct_change(total_uc, web.uc_prev + app.uc_prev)
     
     # Gesamt YoY (gewichteter Durchschnitt aus Web + App)
     total_visits_yoy = None
     total_pi_yoy = None
-    if web["visits_yoy"] is not None and app["visits_yoy"] is not None:
-        yoy_web_visits_prev = yoy_data.get("previous_year", {}).get("data", {}).get("VOL_Web", {}).get("Visits", 0)
-        yoy_app_visits_prev = yoy_data.get("previous_year", {}).get("data", {}).get("VOL_App", {}).get("Visits", 0)
-        yoy_total_prev = yoy_web_visits_prev + yoy_app_visits_prev
-        if yoy_total_prev > 0:
-            total_visits_yoy = (total_visits - yoy_total_prev) / yoy_total_prev
-    
-    if web["pi_yoy"] is not None and app["pi_yoy"] is not None:
-        yoy_web_pi_prev = yoy_data.get("previous_year", {}).get("data", {}).get("VOL_Web", {}).get("Page Impressions", 0)
-        yoy_app_pi_prev = yoy_data.get("previous_year", {}).get("data", {}).get("VOL_App", {}).get("Page Impressions", 0)
-        yoy_total_prev = yoy_web_pi_prev + yoy_app_pi_prev
-        if yoy_total_prev > 0:
-            total_pi_yoy = (total_pi - yoy_total_prev) / yoy_total_prev
+    if web.visits_yoy is not None and app.visits_yoy is not None:
+        total_visits_yoy = pct_change(total_visits, web.visits_prev_year + app.visits_prev_year)
+    
+    if web.pi_yoy is not None and app.pi_yoy is not None:
+        total_pi_yoy = pct_change(total_pi, web.pi_prev_year + app.pi_prev_year)
     
     # === FARBE basierend auf Performance ===
     if total_pi_mom and total_pi_mom > 0:
@@ -1127,43 +1717,42 @@ def send_monthly_teams_report_v4(title: str, summary: str, data: Dict,
     # WICHTIG: MS Teams benötigt <br> für echte Zeilenumbrüche!
     BR = "<br>"  # HTML Line Break für MS Teams
     
-    kpi_text = ""
-    
-    # 1. Gesamtentwicklung (mit HPPI)
-    kpi_text += f"**Gesamtentwicklung:**{BR}"
-    kpi_text += f"{format_metric_line('Visits', total_visits, total_visits_mom, total_visits_yoy)}{BR}"
-    kpi_text += f"{format_metric_line('PI', total_pi, total_pi_mom, total_pi_yoy)}{BR}"
-    kpi_text += f"{format_metric_line('UC', total_uc, total_uc_mom, None, is_uc=True)}{BR}"
-    kpi_text += f"{format_metric_line('HPPI', total_hppi, web['hppi_mom'], web['hppi_yoy'])}{BR}"
-    kpi_text += f"{BR}"
-    
-    # 2. Web-Entwicklung (mit HPPI)
-    kpi_text += f"**Web-Entwicklung**{BR}"
-    kpi_text += f"{format_metric_line('Visits', web['visits'], web['visits_mom'], web['visits_yoy'])}{BR}"
-    kpi_text += f"{format_metric_line('PI', web['pi'], web['pi_mom'], web['pi_yoy'])}{BR}"
-    kpi_text += f"{format_metric_line('UC', web['uc'], web['uc_mom'], None, is_uc=True)}{BR}"
-    kpi_text += f"{format_metric_line('HPPI', web['hppi'], web['hppi_mom'], web['hppi_yoy'])}{BR}"
-    kpi_text += f"{BR}"
-    
-    # 3. App-Entwicklung (Gesamt) - OHNE HPPI
-    kpi_text += f"**App-Entwicklung (Gesamt)**{BR}"
-    kpi_text += f"{format_metric_line('Visits', app['visits'], app['visits_mom'], app['visits_yoy'])}{BR}"
-    kpi_text += f"{format_metric_line('PI', app['pi'], app['pi_mom'], app['pi_yoy'])}{BR}"
-    kpi_text += f"{format_metric_line('UC', app['uc'], app['uc_mom'], None, is_uc=True)}{BR}"
-    kpi_text += f"{BR}"
-    
-    # 4. App-Entwicklung (iOS) - OHNE HPPI
-    kpi_text += f"**App-Entwicklung (iOS)**{BR}"
-    kpi_text += f"{format_metric_line('Visits', ios['visits'], ios['visits_mom'], ios['visits_yoy'])}{BR}"
-    kpi_text += f"{format_metric_line('PI', ios['pi'], ios['pi_mom'], ios['pi_yoy'])}{BR}"
-    kpi_text += f"{format_metric_line('UC', ios['uc'], ios['uc_mom'], None, is_uc=True)}{BR}"
-    kpi_text += f"{BR}"
-    
-    # 5. App-Entwicklung (Android) - OHNE HPPI
-    kpi_text += f"**App-Entwicklung (Android)**{BR}"
-    kpi_text += f"{format_metric_line('Visits', android['visits'], android['visits_mom'], android['visits_yoy'])}{BR}"
-    kpi_text += f"{format_metric_line('PI', android['pi'], android['pi_mom'], android['pi_yoy'])}{BR}"
-    kpi_text += f"{format_metric_line('UC', android['uc'], android['uc_mom'], None, is_uc=True)}"
+    # Zeilen sammeln und einmal verbinden (statt wiederholtem +=);
+    # "" ergibt die Leerzeile zwischen den Sektionen
+    kpi_lines = [
+        # 1. Gesamtentwicklung (mit HPPI)
+        "**Gesamtentwicklung:**",
+        format_metric_line('Visits', total_visits, total_visits_mom, total_visits_yoy),
+        format_metric_line('PI', total_pi, total_pi_mom, total_pi_yoy),
+        format_metric_line('UC', total_uc, total_uc_mom, None, is_uc=True),
+        format_metric_line('HPPI', total_hppi, web.hppi_mom, web.hppi_yoy),
+        "",
+        # 2. Web-Entwicklung (mit HPPI)
+        "**Web-Entwicklung**",
+        format_metric_line('Visits', web.visits, web.visits_mom, web.visits_yoy),
+        format_metric_line('PI', web.pi, web.pi_mom, web.pi_yoy),
+        format_metric_line('UC', web.uc, web.uc_mom, None, is_uc=True),
+        format_metric_line('HPPI', web.hppi, web.hppi_mom, web.hppi_yoy),
+        "",
+        # 3. App-Entwicklung (Gesamt) - OHNE HPPI
+        "**App-Entwicklung (Gesamt)**",
+        format_metric_line('Visits', app.visits, app.visits_mom, app.visits_yoy),
+        format_metric_line('PI', app.pi, app.pi_mom, app.pi_yoy),
+        format_metric_line('UC', app.uc, app.uc_mom, None, is_uc=True),
+        "",
+        # 4. App-Entwicklung (iOS) - OHNE HPPI
+        "**App-Entwicklung (iOS)**",
+        format_metric_line('Visits', ios.visits, ios.visits_mom, ios.visits_yoy),
+        format_metric_line('PI', ios.pi, ios.pi_mom, ios.pi_yoy),
+        format_metric_line('UC', ios.uc, ios.uc_mom, None, is_uc=True),
+        "",
+        # 5. App-Entwicklung (Android) - OHNE HPPI
+        "**App-Entwicklung (Android)**",
+        format_metric_line('Visits', android.visits, android.visits_mom, android.visits_yoy),
+        format_metric_line('PI', android.pi, android.pi_mom, android.pi_yoy),
+        format_metric_line('UC', android.uc, android.uc_mom, None, is_uc=True),
+    ]
+    kpi_text = BR.join(kpi_lines)
     
     # === SECTIONS BAUEN ===
     sections = [
@@ -1193,6 +1782,14 @@ def send_monthly_teams_report_v4(title: str, summary: str, data: Dict,
                     "images": [{"image": url, "title": chart_name}]
                 })
     
+    # Interaktive Detail-Charts (GitLab Pages, ohne Vorschaubild)
+    if interactive_urls:
+        for chart_name, url in interactive_urls.items():
+            sections.append({
+                "title": f"📈 {chart_name}",
+                "text": f"[🔍 Interaktiv öffnen]({url})"
+            })
+    
     # === CARD BAUEN ===
     card = {
         "@type": "MessageCard",
@@ -1218,18 +1815,26 @@ def send_monthly_teams_report_v4(title: str, summary: str, data: Dict,
         print("⚠️ Keine TEAMS_WEBHOOK_URL konfiguriert")
         return
     
-    success_count = 0
-    for webhook_name, webhook_url in webhooks:
+    # Card einmal serialisieren, an alle Webhooks (und Retries) derselbe Body
+    body = dump_json(card)
+    headers = {"Content-Type": "application/json"}
+    
+    def _post(channel: str, url: str) -> bool:
         try:
-            response = requests.post(webhook_url, json=card, timeout=30)
+            response = _SESSION.post(url, data=body, headers=headers, timeout=30)
             if response.status_code == 200:
-                print(f"✅ Monatsbericht v5.0 an Teams gesendet ({webhook_name})")
-                success_count += 1
-            else:
-                print(f"⚠️ Teams Fehler ({webhook_name}): {response.status_code}")
-                print(f"   Response: {response.text[:200]}")
+                print(f"✅ Monatsbericht v5.0 an Teams gesendet ({channel})")
+                return True
+            print(f"⚠️ Teams Fehler ({channel}): {response.status_code}")
+            print(f"   Response: {response.text[:200]}")
         except Exception as e:
-            print(f"⚠️ Teams Fehler ({webhook_name}): {e}")
+            print(f"⚠️ Teams Fehler ({channel}): {e}")
+        return False
+    
+    # Channels parallel beliefern (reines Netzwerk-Warten)
+    with ThreadPoolExecutor(max_workers=len(webhooks)) as executor:
+        futures = [executor.submit(_post, name, url) for name, url in webhooks]
+        success_count = sum(future.result() for future in futures)
     
     print(f"📤 Report an {success_count}/{len(webhooks)} Channels gesendet")
 
@@ -1272,19 +1877,23 @@ def run_monthly_report(target_year: int = None, target_month: int = None):
     
     prev_year, prev_month = get_previous_month(year, month)
     
-    month_names = ["", "Januar", "Februar", "März", "April", "Mai", "Juni", 
-                   "Juli", "August", "September", "Oktober", "November", "Dezember"]
-    
-    current_month_str = f"{month_names[month]} {year}"
-    prev_month_str = f"{month_names[prev_month]} {prev_year}"
+    current_month_str = f"{MONTH_NAMES_DE[month]} {year}"
+    prev_month_str = f"{MONTH_NAMES_DE[prev_month]} {prev_year}"
     
     print(f"\n📅 Berichtsmonat: {current_month_str}")
     print(f"📊 MoM-Vergleich: {prev_month_str}")
-    print(f"📊 YoY-Vergleich: {month_names[month]} {year - 1}")
+    print(f"📊 YoY-Vergleich: {MONTH_NAMES_DE[month]} {year - 1}")
     
     # ==========================================================================
     # DATEN LADEN (DIREKT VON INFONLINE API, mit Airtable-Fallback)
     # ==========================================================================
+    # 12-Monats-Trend (Airtable) ist unabhängig von INFOnline → parallel vorladen
+    trend_future = None
+    if MONTHLY_UTILS_AVAILABLE and AIRTABLE_API_KEY:
+        trend_executor = ThreadPoolExecutor(max_workers=1)
+        trend_future = trend_executor.submit(get_12_month_trend, year, month, brand_filter="VOL", aggregate_app=False)
+        trend_executor.shutdown(wait=False)
+    
     current_data_raw, prev_data_raw, prev_year_data_raw = fetch_monthly_comparison_from_api(year, month)
     
     # Prüfe ob API-Daten vorhanden sind
@@ -1299,17 +1908,21 @@ def run_monthly_report(target_year: int = None, target_month: int = None):
             
             from monthly_data_utils import get_monthly_data as airtable_get_monthly_data
             
-            # Aktueller Monat
-            current_data_raw = airtable_get_monthly_data(year, month, brand_filter="VOL", aggregate_app=False)
-            print(f"      → Aktueller Monat: {len(current_data_raw)} Plattformen")
-            
-            # Vormonat
-            prev_data_raw = airtable_get_monthly_data(prev_year, prev_month, brand_filter="VOL", aggregate_app=False)
-            print(f"      → Vormonat: {len(prev_data_raw)} Plattformen")
-            
-            # Vorjahr
-            prev_year_data_raw = airtable_get_monthly_data(year - 1, month, brand_filter="VOL", aggregate_app=False)
-            print(f"      → Vorjahr: {len(prev_year_data_raw)} Plattformen")
+            try:
+                # Aktueller Monat
+                current_data_raw = airtable_get_monthly_data(year, month, brand_filter="VOL", aggregate_app=False)
+                print(f"      → Aktueller Monat: {len(current_data_raw)} Plattformen")
+                
+                # Vormonat
+                prev_data_raw = airtable_get_monthly_data(prev_year, prev_month, brand_filter="VOL", aggregate_app=False)
+                print(f"      → Vormonat: {len(prev_data_raw)} Plattformen")
+                
+                # Vorjahr
+                prev_year_data_raw = airtable_get_monthly_data(year - 1, month, brand_filter="VOL", aggregate_app=False)
+                print(f"      → Vorjahr: {len(prev_year_data_raw)} Plattformen")
+            except requests.RequestException as e:
+                print(f"   ❌ Airtable-Fallback fehlgeschlagen: {e}")
+                return
             
             # App aggregieren
             for data_dict in [current_data_raw, prev_data_raw, prev_year_data_raw]:
@@ -1336,31 +1949,20 @@ def run_monthly_report(target_year: int = None, target_month: int = None):
     yoy_data = {
         "current": {"year": year, "month": month, "data": current_data_raw},
         "previous_year": {"year": year - 1, "month": month, "data": prev_year_data_raw},
-        "yoy_changes": {}
+        "yoy_changes": compute_changes(current_data_raw, prev_year_data_raw)
     }
     
-    # YoY-Änderungen berechnen
-    for key in current_data_raw:
-        if key in prev_year_data_raw:
-            yoy_data["yoy_changes"][key] = {}
-            for metric in current_data_raw[key]:
-                current_val = current_data_raw[key][metric]
-                prev_val = prev_year_data_raw.get(key, {}).get(metric, 0)
-                if prev_val > 0:
-                    yoy_data["yoy_changes"][key][metric] = (current_val - prev_val) / prev_val
-                else:
-                    yoy_data["yoy_changes"][key][metric] = None
-    
     # 12-Monats-Trend (optional, nur wenn Airtable verfügbar)
     trend_data = []
     trend_data_separate = []
-    if MONTHLY_UTILS_AVAILABLE and AIRTABLE_API_KEY:
+    if trend_future is not None:
         print("\n📈 Lade 12-Monats-Trend (für Diagramme)...")
         try:
-            trend_data = get_12_month_trend(year, month, brand_filter="VOL", aggregate_app=True)
-            print(f"   → {len(trend_data)} Monate geladen (aggregiert)")
-            trend_data_separate = get_12_month_trend(year, month, brand_filter="VOL", aggregate_app=False)
+            # Einmal getrennt geladen, App (= iOS + Android) lokal aggregieren
+            trend_data_separate = trend_future.result()
             print(f"   → {len(trend_data_separate)} Monate geladen (iOS/Android separat)")
+            trend_data = [dict(entry, data=aggregate_platforms(entry["data"])) for entry in trend_data_separate]
+            print(f"   → {len(trend_data)} Monate aggregiert (App gesamt)")
         except Exception as e:
             print(f"   ⚠️ Trend-Daten nicht verfügbar: {e}")
     else:
@@ -1381,30 +1983,24 @@ def run_monthly_report(target_year: int = None, target_month: int = None):
     
     data = {}
     for key, metrics in current_data.items():
-        data[key] = {}
-        for metric, value in metrics.items():
-            prev_value = prev_data.get(key, {}).get(metric, 0)
-            mom_change = ((value - prev_value) / prev_value) if prev_value > 0 else None
-            
-            data[key][metric] = {
+        prev_metrics = prev_data.get(key, {})
+        data[key] = {
+            metric: {
                 "current_sum": value,
-                "prev_sum": prev_value,
-                "mom_change": mom_change
+                "prev_sum": prev_metrics.get(metric, 0),
+                "mom_change": pct_change(value, prev_metrics.get(metric, 0))
             }
+            for metric, value in metrics.items()
+        }
     
     # Statistiken ausgeben
     print("\n   === GESAMT-ÜBERSICHT (offizielle INFOnline-Werte) ===")
     # Nur Web + App zählen (nicht iOS/Android einzeln, da diese in App enthalten sind)
-    web_pi = data.get("VOL_Web", {}).get("Page Impressions", {}).get("current_sum", 0)
-    app_pi = data.get("VOL_App", {}).get("Page Impressions", {}).get("current_sum", 0)
-    web_visits = data.get("VOL_Web", {}).get("Visits", {}).get("current_sum", 0)
-    app_visits = data.get("VOL_App", {}).get("Visits", {}).get("current_sum", 0)
-    total_pi = web_pi + app_pi
-    total_visits = web_visits + app_visits
-    print(f"   • PI Gesamt (Web + App): {total_pi:,}")
-    print(f"   • Visits Gesamt (Web + App): {total_visits:,}")
-    print(f"   • Web PI: {web_pi:,} | App PI: {app_pi:,}")
-    print(f"   • Web Visits: {web_visits:,} | App Visits: {app_visits:,}")
+    share = compute_platform_share(data)
+    print(f"   • PI Gesamt (Web + App): {share.total_pi:,}")
+    print(f"   • Visits Gesamt (Web + App): {share.total_visits:,}")
+    print(f"   • Web PI: {share.web_pi:,} | App PI: {share.app_pi:,}")
+    print(f"   • Web Visits: {share.web_visits:,} | App Visits: {share.app_visits:,}")
     
     for key in sorted(data.keys()):
         print(f"\n   {key}:")
@@ -1428,94 +2024,121 @@ def run_monthly_report(target_year: int = None, target_month: int = None):
     # DIAGRAMME ERSTELLEN (analog Weekly Report)
     # ==========================================================================
     image_urls = {}
+    interactive_urls = {}
+    rendered_charts = []
+    chart_order = []
     if PLOTLY_AVAILABLE:
         print("\n📊 Erstelle Diagramme (analog Weekly Report)...")
         
         try:
+            # Reihenfolge der Liste = Reihenfolge im Teams-Bericht
+            charts = []
+            
             # 1. MoM-Vergleich PI (Aktuell vs. Vormonat - wie Weekly KPI-Vergleich)
             mom_pi_chart = create_mom_comparison_chart(data, "Page Impressions")
             if mom_pi_chart:
                 print("   → MoM PI-Vergleich erstellt")
-                url = upload_to_imgbb(mom_pi_chart)
-                if url:
-                    image_urls["PI MoM-Vergleich"] = url
+                charts.append(("PI MoM-Vergleich", mom_pi_chart))
             
             # 2. MoM-Vergleich Visits
             mom_visits_chart = create_mom_comparison_chart(data, "Visits")
             if mom_visits_chart:
                 print("   → MoM Visits-Vergleich erstellt")
-                url = upload_to_imgbb(mom_visits_chart)
-                if url:
-                    image_urls["Visits MoM-Vergleich"] = url
+                charts.append(("Visits MoM-Vergleich", mom_visits_chart))
             
             # 3. YoY-Vergleich PI (Jahr-über-Jahr)
             yoy_chart = create_yoy_comparison_chart(data, yoy_data, "Page Impressions")
             if yoy_chart:
                 print("   → YoY PI-Vergleich erstellt")
-                url = upload_to_imgbb(yoy_chart)
-                if url:
-                    image_urls["PI YoY-Vergleich"] = url
+                charts.append(("PI YoY-Vergleich", yoy_chart))
             
             # 4. 12-Monats-Trend PI (inkl. iOS/Android)
             trend_pi_chart = create_12_month_trend_chart(trend_data, "Page Impressions", trend_data_separate)
             if trend_pi_chart:
                 print("   → 12-Monats-Trend PI erstellt (inkl. iOS/Android)")
-                url = upload_to_imgbb(trend_pi_chart)
-                if url:
-                    image_urls["12-Monats-Trend PI"] = url
+                charts.append(("12-Monats-Trend PI", trend_pi_chart))
             
             # 5. 12-Monats-Trend Visits (inkl. iOS/Android)
             trend_visits_chart = create_12_month_trend_chart(trend_data, "Visits", trend_data_separate)
             if trend_visits_chart:
                 print("   → 12-Monats-Trend Visits erstellt (inkl. iOS/Android)")
-                url = upload_to_imgbb(trend_visits_chart)
-                if url:
-                    image_urls["12-Monats-Trend Visits"] = url
+                charts.append(("12-Monats-Trend Visits", trend_visits_chart))
             
             # 6. MoM-Änderungen alle Metriken (Übersicht)
             multi_chart = create_multi_metric_comparison_chart(data)
             if multi_chart:
                 print("   → Multi-Metrik MoM-Übersicht erstellt")
-                url = upload_to_imgbb(multi_chart)
-                if url:
-                    image_urls["MoM-Übersicht"] = url
+                charts.append(("MoM-Übersicht", multi_chart))
             
             # 7. Plattform-Anteil Pie (Web vs. App)
             # GEÄNDERT: Visits statt Page Impressions für besseren Vergleich
             pie_chart = create_platform_pie_chart(data, "Visits")
             if pie_chart:
                 print("   → Plattform-Anteil (Visits) erstellt")
-                url = upload_to_imgbb(pie_chart)
-                if url:
-                    image_urls["Web vs. App Visits"] = url
+                charts.append(("Web vs. App Visits", pie_chart))
             
             # 8. NEU: App-Split Pie (iOS vs. Android)
             # GEÄNDERT: Visits statt Page Impressions für besseren Vergleich
             app_split_chart = create_app_split_pie_chart(data, "Visits")
             if app_split_chart:
                 print("   → App-Split (iOS/Android Visits) erstellt")
-                url = upload_to_imgbb(app_split_chart)
-                if url:
-                    image_urls["iOS vs. Android Visits"] = url
+                charts.append(("iOS vs. Android Visits", app_split_chart))
             
-            print(f"\n   ✅ {len(image_urls)} Diagramme erfolgreich hochgeladen")
+            # Detail-Charts interaktiv über GitLab Pages (kein Rendering/Upload)
+            if CHART_PAGES_URL:
+                detail_charts = [(n, fig) for n, fig in charts if n in INTERACTIVE_ONLY_CHARTS]
+                charts = [(n, fig) for n, fig in charts if n not in INTERACTIVE_ONLY_CHARTS]
+                interactive_urls = publish_interactive_charts(detail_charts, f"{year}-{month:02d}")
+                print(f"   → {len(interactive_urls)} Detail-Charts als interaktives HTML gespeichert")
+            
+            # Restliche Detail-Charts als ein Dashboard-Raster (ein Render, ein Upload)
+            if CHART_DASHBOARD:
+                grid_charts = [(n, fig) for n, fig in charts if n not in DASHBOARD_STANDALONE_CHARTS]
+                if len(grid_charts) > 1:
+                    charts = [(n, fig) for n, fig in charts if n in DASHBOARD_STANDALONE_CHARTS]
+                    charts.append(("Dashboard", create_dashboard_grid(grid_charts)))
+                    print(f"   → Dashboard-Raster mit {len(grid_charts)} Diagrammen erstellt")
+            
+            # Rendering parallel (CPU-bound); liefert die PNGs, sobald sie fertig sind
+            chart_order = [name for name, _ in charts]
+            rendered_charts = render_charts(charts)
                     
         except Exception as e:
-            print(f"   ⚠️ Diagramm-Fehler: {e}")
-            import traceback
-            traceback.print_exc()
+            print(f"   ⚠️ Diagramm-Fehler: {type(e).__name__}: {e}")
+            if OEWA_DEBUG:
+                traceback.print_exc()
     
     # ==========================================================================
-    # GPT SUMMARY (Bulletpoints)
+    # GPT SUMMARY (Bulletpoints) + CHART-UPLOADS
     # ==========================================================================
-    print("\n🤖 Generiere Bulletpoint-Analyse...")
-    summary = generate_bulletpoint_summary(
-        data, 
-        current_month_str, 
-        prev_month_str,
-        yoy_data,
-        trend_data
-    )
+    # GPT-Call und imgBB-Uploads sind unabhängig und I/O-bound → überlappen.
+    # Uploads starten, sobald das jeweilige PNG fertig ist. Erst nach dem
+    # Einreichen der Render-Jobs starten: der Render-Pool forkt Prozesse,
+    # das soll ohne laufende HTTP-Threads passieren.
+    # Plattform-KPIs einmal extrahieren - GPT-Prompt und Teams-Card lesen beide daraus
+    platform_metrics = extract_platform_metrics(data, yoy_data)
+    
+    print("\n🤖 Generiere Bulletpoint-Analyse (parallel zu den Chart-Uploads)...")
+    with ThreadPoolExecutor(max_workers=1) as gpt_executor:
+        summary_future = gpt_executor.submit(
+            generate_bulletpoint_summary,
+            data, 
+            current_month_str, 
+            prev_month_str,
+            yoy_data,
+            trend_data,
+            share,
+            platform_metrics
+        )
+        
+        try:
+            image_urls = upload_charts(rendered_charts, order=chart_order)
+        except Exception as e:
+            print(f"   ⚠️ Diagramm-Fehler: {type(e).__name__}: {e}")
+        if image_urls:
+            print(f"\n   ✅ {len(image_urls)} Diagramme erfolgreich hochgeladen")
+        
+        summary = summary_future.result()
     print(f"   → {len(summary)} Zeichen generiert")
     
     # ==========================================================================
@@ -1530,7 +2153,10 @@ def run_monthly_report(target_year: int = None, target_month: int = None):
         current_month_str, 
         prev_month_str,
         yoy_data,
-        image_urls
+        image_urls,
+        share,
+        interactive_urls,
+        platform_metrics
     )
     
     print("\n" + "=" * 70)
@@ -5,24 +5,67 @@
 Führt alle Tests aus und sendet Ergebnisse an Teams bei Fehlern.
 """
 
+import json
+import re
 import subprocess
 import sys
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 
+# orjson (optional) - schnelleres Serialisieren der Teams-Card
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 TEAMS_WEBHOOK_URL = os.environ.get("TEAMS_WEBHOOK_URL", "")
 
+# Relevante Zeilen für die Teams-Benachrichtigung (pro Zeile beim Streamen geprüft)
+_FAIL_RE = re.compile(r"^.*(?:FAILED|ERROR|AssertionError).*$", re.M)
+
+# HTTP-Session für Teams:
+# Keep-Alive + Retry/Backoff über urllib3 (inkl. Retry-After bei 429).
+# Nur GET wird wiederholt - ein wiederholter POST kann die Teams-Karte doppelt posten.
+HTTP_MAX_RETRIES = 3
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=1,
+    max_retries=Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False  # Letzte Antwort zurückgeben statt Exception
+    )
+))
+
+
+def dump_json(obj) -> bytes:
+    """Serialisiert einen Request-Body (UTF-8) - mit orjson falls verfügbar, sonst stdlib."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 
 def run_tests(test_type: str = "all") -> tuple:
     """
-    Führt pytest aus und gibt (success, output) zurück.
+    Führt pytest aus (Ausgabe wird live gestreamt) und gibt
+    (success, output, failure_lines) zurück.
+    
+    Die Fehlerzeilen für die Teams-Benachrichtigung werden schon beim
+    Streamen gesammelt - kein zweiter Durchlauf über die Ausgabe.
     
     Args:
         test_type: "all", "critical", "security", "integration"
     
     Returns:
-        (bool, str): (success, output)
+        (bool, str, list): (success, output, failure_lines)
     """
     # Basis-Befehl
     cmd = ["python", "-m", "pytest", "tests/", "-v", "--tb=short"]
@@ -35,32 +78,38 @@ def run_tests(test_type: str = "all") -> tuple:
     elif test_type == "integration":
         cmd.extend(["-m", "integration"])
     
-    # Führe Tests aus
-    result = subprocess.run(
+    # Führe Tests aus - Ausgabe zeilenweise live durchreichen (CI-Log)
+    # und parallel für die Teams-Benachrichtigung sammeln
+    proc = subprocess.Popen(
         cmd,
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
         text=True,
+        bufsize=1,
         env={**os.environ, "PYTHONIOENCODING": "utf-8"}
     )
     
-    output = result.stdout + result.stderr
-    success = result.returncode == 0
+    lines = []
+    failure_lines = []
+    for line in proc.stdout:
+        sys.stdout.write(line)
+        lines.append(line)
+        if _FAIL_RE.search(line):
+            failure_lines.append(line)
+    
+    success = proc.wait() == 0
     
-    return success, output
+    return success, "".join(lines), failure_lines
 
 
-def send_failure_notification(test_type: str, output: str):
+def send_failure_notification(test_type: str, output: str, failure_lines: list):
     """Sendet Fehler-Benachrichtigung an Teams"""
     if not TEAMS_WEBHOOK_URL:
         print("TEAMS_WEBHOOK_URL nicht gesetzt - keine Benachrichtigung")
         return
     
-    # Extrahiere relevante Zeilen (max 500 Zeichen)
-    relevant_output = ""
-    for line in output.split('\n'):
-        if any(keyword in line for keyword in ['FAILED', 'ERROR', 'AssertionError']):
-            relevant_output += line + "\n"
-    
+    # Relevante Zeilen (max 500 Zeichen), sonst das Ende der Ausgabe
+    relevant_output = "".join(failure_lines)
     relevant_output = relevant_output[:500] if relevant_output else output[-500:]
     
     card = {
@@ -96,7 +145,8 @@ def send_failure_notification(test_type: str, output: str):
     }
     
     try:
-        response = requests.post(TEAMS_WEBHOOK_URL, json=card, timeout=10)
+        response = _SESSION.post(TEAMS_WEBHOOK_URL, data=dump_json(card),
+                                 headers={"Content-Type": "application/json"}, timeout=10)
         if response.status_code == 200:
             print("✅ Fehler-Benachrichtigung an Teams gesendet")
         else:
@@ -116,9 +166,7 @@ def main():
     print(f"\n🔍 Führe Tests aus: {test_type}")
     print("-" * 70)
     
-    success, output = run_tests(test_type)
-    
-    print(output)
+    success, output, failure_lines = run_tests(test_type)
     
     if success:
         print("\n" + "=" * 70)
@@ -130,7 +178,7 @@ def main():
         print("=" * 70)
         
         # Sende Benachrichtigung bei Fehlern
-        send_failure_notification(test_type, output)
+        send_failure_notification(test_type, output, failure_lines)
         
         sys.exit(1)
 
@@ -9,11 +9,33 @@ Testet das neue Format mit:
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import date, datetime, timedelta
 
 # Konfiguration
 TEAMS_WEBHOOK_URL = os.environ.get("TEAMS_WEBHOOK_URL", "")
 
+WEEKDAY_NAMES_DE = ("Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag")
+
+# HTTP-Session für Teams:
+# Keep-Alive + Retry/Backoff über urllib3 (inkl. Retry-After bei 429).
+# Nur GET wird wiederholt - ein wiederholter POST kann die Teams-Karte doppelt posten.
+HTTP_MAX_RETRIES = 3
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=1,
+    max_retries=Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False  # Letzte Antwort zurückgeben statt Exception
+    )
+))
+
 def main():
     print("=" * 70)
     print("🧪 TEST: Neues Alert-Format mit Abweichungsdaten")
@@ -29,8 +51,7 @@ def main():
     abweichungs_datum = date.today() - timedelta(days=1)  # Gestern
     bericht_datum = datetime.now()
     
-    weekday_names = ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"]
-    weekday_name = weekday_names[abweichungs_datum.weekday()]
+    weekday_name = WEEKDAY_NAMES_DE[abweichungs_datum.weekday()]
     
     # Simulierte historische Daten (letzte 6 gleiche Wochentage)
     historical_data = [
@@ -121,7 +142,7 @@ Content-Performance und technisches Tracking für VOL.AT prüfen."""
     print(f"\n📤 Sende Test-Alert an Teams...")
     
     try:
-        response = requests.post(TEAMS_WEBHOOK_URL, json=card, timeout=10)
+        response = _SESSION.post(TEAMS_WEBHOOK_URL, json=card, timeout=10)
         if response.status_code == 200:
             print("✅ Test-Alert erfolgreich gesendet!")
             print("\n🔍 Prüfe deinen Teams-Channel für die Nachricht.")
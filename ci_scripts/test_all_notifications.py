@@ -14,6 +14,7 @@ Nutzung:
     python ci_scripts/test_all_notifications.py --weekly
     python ci_scripts/test_all_notifications.py --alert
     python ci_scripts/test_all_notifications.py --gpt-only
+    python ci_scripts/test_all_notifications.py --all --parallel
 
 Wichtig: Setzt echte Daten an Teams! Nur für Tests verwenden.
 """
@@ -21,16 +22,48 @@ Wichtig: Setzt echte Daten an Teams! Nur für Tests verwenden.
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional
 
+# orjson (optional) - schnelleres Serialisieren/Parsen der Teams- und GPT-Payloads
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # =============================================================================
 # KONFIGURATION
 # =============================================================================
 TEAMS_WEBHOOK_URL = os.environ.get("TEAMS_WEBHOOK_URL", "")
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
 
+# Parallele Tests mit --parallel (ein Thread pro Test)
+TEST_WORKERS = 5
+
+# HTTP-Session für OpenAI und Teams (viele Calls pro Lauf):
+# Keep-Alive + Retry/Backoff über urllib3 (inkl. Retry-After bei 429).
+# Nur GET wird wiederholt - ein wiederholter POST kann eine Teams-Karte doppelt
+# posten bzw. einen GPT-Request doppelt verrechnen.
+HTTP_MAX_RETRIES = 3
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=TEST_WORKERS,
+    max_retries=Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False  # Letzte Antwort zurückgeben statt Exception
+    )
+))
+
 # Test-Daten (simuliert)
 TEST_DATA = {
     "date": date.today().isoformat(),
@@ -72,6 +105,20 @@ def check_config():
     return len([i for i in issues if i.startswith("❌")]) == 0
 
 
+def dump_json(obj) -> bytes:
+    """Serialisiert einen Request-Body (UTF-8) - mit orjson falls verfügbar, sonst stdlib."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def parse_json_response(response: requests.Response) -> Dict:
+    """Parst eine JSON-Response - mit orjson falls verfügbar, sonst stdlib."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 def send_teams_card(card: dict, test_name: str) -> bool:
     """Sendet eine Teams Card und gibt Erfolg zurück"""
     if not TEAMS_WEBHOOK_URL:
@@ -79,7 +126,8 @@ def send_teams_card(card: dict, test_name: str) -> bool:
         return False
     
     try:
-        response = requests.post(TEAMS_WEBHOOK_URL, json=card, timeout=10)
+        response = _SESSION.post(TEAMS_WEBHOOK_URL, data=dump_json(card),
+                                 headers={"Content-Type": "application/json"}, timeout=10)
         if response.status_code == 200:
             print(f"   ✅ {test_name}: Erfolgreich gesendet")
             return True
@@ -98,28 +146,28 @@ def call_gpt(prompt: str, test_name: str) -> Optional[str]:
         return None
     
     try:
-        response = requests.post(
+        response = _SESSION.post(
             "https://api.openai.com/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {OPENAI_API_KEY}",
                 "Content-Type": "application/json"
             },
-            json={
+            data=dump_json({
                 "model": "gpt-4o-mini",
                 "messages": [{"role": "user", "content": prompt}],
                 "max_tokens": 500,
                 "temperature": 0.7
-            },
+            }),
             timeout=60
         )
         
         if response.status_code == 200:
-            content = response.json()["choices"][0]["message"]["content"]
+            content = parse_json_response(response)["choices"][0]["message"]["content"]
             print(f"   ✅ {test_name}: GPT Response ({len(content)} Zeichen)")
             return content
         else:
             print(f"   ❌ {test_name}: GPT HTTP {response.status_code}")
-            error = response.json().get("error", {}).get("message", "Unknown error")
+            error = parse_json_response(response).get("error", {}).get("message", "Unknown error")
             print(f"      → {error[:100]}")
             return None
     except Exception as e:
@@ -478,6 +526,8 @@ def main():
     parser.add_argument("--alert", action="store_true", help="Alert Check Test")
     parser.add_argument("--emergency", action="store_true", help="Emergency Alert Test")
     parser.add_argument("--gpt-only", action="store_true", help="Nur GPT API Test")
+    parser.add_argument("--parallel", action="store_true",
+                        help="Tests gleichzeitig ausführen (schneller, Ausgaben vermischt)")
     
     args = parser.parse_args()
     
@@ -494,23 +544,30 @@ def main():
         print("\n❌ Konfigurationsfehler - Tests abgebrochen")
         return
     
-    results = {}
-    
-    # Tests ausführen
+    # Ausgewählte Tests
+    tests = {}
     if run_all or args.gpt_only:
-        results["GPT API"] = test_gpt_only()
+        tests["GPT API"] = test_gpt_only
     
     if run_all or args.daily:
-        results["Daily Ingest"] = test_daily_ingest_notification()
+        tests["Daily Ingest"] = test_daily_ingest_notification
     
     if run_all or args.weekly:
-        results["Weekly Report"] = test_weekly_report_with_gpt()
+        tests["Weekly Report"] = test_weekly_report_with_gpt
     
     if run_all or args.alert:
-        results["Alert Check"] = test_alert_check_with_gpt()
+        tests["Alert Check"] = test_alert_check_with_gpt
     
     if run_all or args.emergency:
-        results["Emergency Alert"] = test_emergency_alert()
+        tests["Emergency Alert"] = test_emergency_alert
+    
+    # Tests ausführen - parallel überlappen sich die GPT- und Teams-Wartezeiten
+    if args.parallel:
+        with ThreadPoolExecutor(max_workers=TEST_WORKERS) as executor:
+            futures = {name: executor.submit(test) for name, test in tests.items()}
+        results = {name: future.result() for name, future in futures.items()}
+    else:
+        results = {name: test() for name, test in tests.items()}
     
     # Zusammenfassung
     print("\n" + "=" * 70)
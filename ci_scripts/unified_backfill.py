@@ -26,12 +26,20 @@ Nutzung:
 import os
 import sys
 import json
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import argparse
 from datetime import date, datetime, timedelta
-from time import sleep
+from time import sleep, monotonic
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Tuple, Optional, Dict, List, Set
 
+# Datums-Fenster wie beim Laden der Monatsdaten (monthly_data_utils)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from monthly_data_utils import split_date_range
+
 # =============================================================================
 # KONFIGURATION
 # =============================================================================
@@ -43,8 +51,29 @@ AIRTABLE_BASE_ID = os.environ.get("AIRTABLE_BASE_ID", "")  # Muss in CI/CD Varia
 UC_DELAY_DAYS = 3
 
 # Rate Limiting
-API_DELAY = 0.15  # Sekunden zwischen API-Calls
-BATCH_DELAY = 0.25  # Sekunden zwischen Airtable-Batches
+INFONLINE_MAX_CONCURRENT = 5  # Gleichzeitige INFOnline-Requests
+INFONLINE_MAX_RPS = 5  # INFOnline-Requests pro Sekunde (über alle Threads)
+AIRTABLE_MAX_RPS = 4  # Airtable-Requests pro Sekunde (Limit: 5/s pro Base, etwas Puffer)
+AIRTABLE_DATE_SLICES = 4  # Parallele Datums-Fenster beim Laden existierender Keys
+
+# HTTP-Session für INFOnline und Airtable: Keep-Alive über alle
+# Tages-/Seiten-Requests, Retry/Backoff über urllib3 (inkl. Retry-After bei 429).
+# Nur GET wird wiederholt - ein wiederholter Airtable-POST kann Records doppelt
+# anlegen (Timeout/5xx nach dem Schreiben); dort bremst _airtable_throttle.
+HTTP_MAX_RETRIES = 3
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=INFONLINE_MAX_CONCURRENT,
+    max_retries=Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False  # Letzte Antwort zurückgeben statt Exception
+    )
+))
 
 # =============================================================================
 # SITES KONFIGURATION
@@ -104,7 +133,7 @@ def fetch_infonline_data(site_id: str, metric: str, target_date: date) -> dict:
     }
     
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+        response = _SESSION.get(url, params=params, headers=headers, timeout=30)
         if response.status_code == 200:
             return {"success": True, "data": response.json()}
         elif response.status_code == 404:
@@ -115,6 +144,45 @@ def fetch_infonline_data(site_id: str, metric: str, target_date: date) -> dict:
         return {"success": False, "error": str(e)}
 
 
+_infonline_lock = threading.Lock()
+_infonline_next_slot = 0.0
+
+
+def _infonline_throttle():
+    """Wartet auf den nächsten freien Request-Slot (max. INFONLINE_MAX_RPS/s über alle Threads)."""
+    global _infonline_next_slot
+    with _infonline_lock:
+        now = monotonic()
+        slot = max(now, _infonline_next_slot)
+        _infonline_next_slot = slot + 1 / INFONLINE_MAX_RPS
+    if slot > now:
+        sleep(slot - now)
+
+
+def fetch_infonline_parallel(jobs: List[Tuple[str, str, date]]) -> List[dict]:
+    """
+    Ruft mehrere (site_id, metric, Datum)-Werte parallel ab.
+    
+    Die Abfragen sind unabhängig und rein I/O-bound → Thread-Pool mit
+    INFONLINE_MAX_CONCURRENT Verbindungen statt sequenzieller Requests;
+    die Request-Rate begrenzt _infonline_throttle über alle Threads.
+    
+    Returns:
+        Ergebnisse von fetch_infonline_data in Eingangsreihenfolge
+    """
+    def _fetch(job: Tuple[str, str, date]) -> dict:
+        _infonline_throttle()
+        return fetch_infonline_data(*job)
+    
+    results = [None] * len(jobs)
+    with ThreadPoolExecutor(max_workers=INFONLINE_MAX_CONCURRENT) as executor:
+        futures = {executor.submit(_fetch, job): i for i, job in enumerate(jobs)}
+        for done, future in enumerate(as_completed(futures), 1):
+            results[futures[future]] = future.result()
+            print(f"\r   [{done}/{len(jobs)}] abgerufen...", end="")
+    return results
+
+
 def extract_value(data: dict, metric_key: str) -> Tuple[Optional[int], bool]:
     """Extrahiert den Wert aus der API-Response (IOM-Daten)"""
     if not isinstance(data, dict) or "data" not in data:
@@ -133,8 +201,30 @@ def extract_value(data: dict, metric_key: str) -> Tuple[Optional[int], bool]:
     return None, True
 
 
-def get_existing_keys(dry_run: bool = False) -> Set[str]:
-    """Holt alle existierenden Unique Keys aus Airtable"""
+_airtable_lock = threading.Lock()
+_airtable_next_slot = 0.0
+
+
+def _airtable_throttle():
+    """Wartet auf den nächsten freien Request-Slot (max. AIRTABLE_MAX_RPS/s über alle Threads)."""
+    global _airtable_next_slot
+    with _airtable_lock:
+        now = monotonic()
+        slot = max(now, _airtable_next_slot)
+        _airtable_next_slot = slot + 1 / AIRTABLE_MAX_RPS
+    if slot > now:
+        sleep(slot - now)
+
+
+def get_existing_keys(start: date, end: date, dry_run: bool = False) -> Set[str]:
+    """
+    Holt die existierenden Unique Keys im Zeitraum [start, end] aus Airtable.
+    
+    Gefiltert wird serverseitig über {Datum} statt die ganze Tabelle zu laden.
+    Die Pagination ist sequentiell (Offset der vorherigen Seite) - der
+    Zeitraum wird daher in AIRTABLE_DATE_SLICES Fenster geteilt, die parallel
+    geladen werden.
+    """
     if dry_run:
         print("   [DRY-RUN] Überspringe Airtable-Abfrage")
         return set()
@@ -142,32 +232,39 @@ def get_existing_keys(dry_run: bool = False) -> Set[str]:
     url = f"https://api.airtable.com/v0/{AIRTABLE_BASE_ID}/Measurements"
     headers = {"Authorization": f"Bearer {AIRTABLE_API_KEY}"}
     
-    existing_keys = set()
-    offset = None
-    
-    print("   Lade existierende Keys aus Airtable...")
-    while True:
-        params = {"fields[]": "Unique Key", "pageSize": 100}
-        if offset:
-            params["offset"] = offset
+    def _fetch_slice(slice_start: date, slice_end: date) -> Set[str]:
+        keys = set()
+        params = {
+            "filterByFormula": f"AND(IS_AFTER({{Datum}}, '{(slice_start - timedelta(days=1)).isoformat()}'), IS_BEFORE({{Datum}}, '{(slice_end + timedelta(days=1)).isoformat()}'))",
+            "fields[]": "Unique Key",
+            "pageSize": 100
+        }
+        while True:
+            _airtable_throttle()
+            response = _SESSION.get(url, headers=headers, params=params, timeout=30)
+            if response.status_code != 200:
+                print(f"   ⚠️ Airtable Fehler: {response.status_code}")
+                break
             
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        if response.status_code != 200:
-            print(f"   ⚠️ Airtable Fehler: {response.status_code}")
-            break
+            data = response.json()
+            for record in data.get("records", []):
+                key = record.get("fields", {}).get("Unique Key")
+                if key:
+                    keys.add(key)
             
-        data = response.json()
-        for record in data.get("records", []):
-            key = record.get("fields", {}).get("Unique Key")
-            if key:
-                existing_keys.add(key)
-        
-        offset = data.get("offset")
-        if not offset:
-            break
-        
-        print(f"   ... {len(existing_keys)} Keys geladen", end="\r")
-        sleep(0.1)
+            offset = data.get("offset")
+            if not offset:
+                break
+            params["offset"] = offset
+        return keys
+    
+    existing_keys = set()
+    slices = split_date_range(start, end, AIRTABLE_DATE_SLICES)
+    
+    print(f"   Lade existierende Keys aus Airtable ({start} → {end})...")
+    with ThreadPoolExecutor(max_workers=len(slices)) as executor:
+        for keys in executor.map(lambda r: _fetch_slice(*r), slices):
+            existing_keys |= keys
     
     print(f"   ✓ {len(existing_keys)} existierende Keys gefunden")
     return existing_keys
@@ -191,7 +288,8 @@ def check_key_exists(unique_key: str) -> bool:
             "maxRecords": 1
         }
         
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        _airtable_throttle()
+        response = _SESSION.get(url, headers=headers, params=params, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -246,26 +344,36 @@ def save_to_airtable(records: List[dict], dry_run: bool = False, double_check: b
         print("   ℹ️ Nach Double-Check: Keine neuen Records zum Speichern")
         return results
     
-    # Batch-Insert (max 10 pro Request)
-    for i in range(0, len(records), 10):
-        batch = records[i:i+10]
+    def _post_batch(batch: List[dict]) -> Optional[str]:
+        """Speichert einen Batch, gibt None oder die Fehlermeldung zurück."""
+        _airtable_throttle()
         try:
-            response = requests.post(
+            response = _SESSION.post(
                 url,
                 headers=headers,
                 json={"records": batch},
                 timeout=30
             )
             if response.status_code in (200, 201):
-                results["created"] += len(batch)
-            else:
-                error_msg = response.text[:200]
-                results["errors"].append(f"Batch {i//10 + 1}: {error_msg}")
+                return None
+            return response.text[:200]
         except Exception as e:
-            results["errors"].append(f"Batch {i//10 + 1}: {str(e)}")
-        
-        sleep(BATCH_DELAY)
-        print(f"   ... {results['created']}/{len(records)} gespeichert", end="\r")
+            return str(e)
+    
+    # Batch-Insert (max 10 pro Request) - parallel, gedrosselt auf AIRTABLE_MAX_RPS
+    batches = [records[i:i+10] for i in range(0, len(records), 10)]
+    errors = [None] * len(batches)
+    with ThreadPoolExecutor(max_workers=AIRTABLE_MAX_RPS) as executor:
+        futures = {executor.submit(_post_batch, batch): n for n, batch in enumerate(batches)}
+        for future in as_completed(futures):
+            n = futures[future]
+            errors[n] = future.result()
+            if errors[n] is None:
+                results["created"] += len(batches[n])
+            print(f"   ... {results['created']}/{len(records)} gespeichert", end="\r")
+    
+    # Fehler in Batch-Reihenfolge melden
+    results["errors"].extend(f"Batch {n + 1}: {error}" for n, error in enumerate(errors) if error)
     
     print()  # Neue Zeile
     return results
@@ -351,7 +459,7 @@ def run_unified_backfill(days: int = 90, start_date: date = None, end_date: date
     
     # Existierende Keys laden
     print(f"\n📋 DUPLIKAT-PRÜFUNG:")
-    existing_keys = get_existing_keys(dry_run)
+    existing_keys = get_existing_keys(min(standard_start, uc_start), max(standard_end, uc_end), dry_run)
     
     # Statistiken
     stats = {
@@ -373,53 +481,48 @@ def run_unified_backfill(days: int = 90, start_date: date = None, end_date: date
     print("📊 PHASE 1: Page Impressions + Visits (Web + App)")
     print("=" * 70)
     
-    phase1_total = len(standard_dates) * len(SITES) * 2
-    phase1_current = 0
-    
+    # Duplikat-Check vorab, dann alle fehlenden Werte parallel abrufen
+    jobs = []
     for target_date in standard_dates:
         for site in SITES:
             for metric_key in ["pageimpressions", "visits"]:
-                phase1_current += 1
                 metric_name = METRICS_MAP[metric_key]
                 unique_key = f"{target_date.isoformat()}_{site['brand']}_{site['surface']}_{metric_name}"
                 
-                # Fortschritt
-                print(f"\r   [{phase1_current}/{phase1_total}] {target_date} {site['name']} {metric_name}...", end="")
-                
-                # Duplikat-Check
                 if unique_key in existing_keys:
                     stats["skipped_duplicate"] += 1
                     continue
-                
-                # API abrufen
-                result = fetch_infonline_data(site["site_id"], metric_key, target_date)
-                sleep(API_DELAY)
-                
-                if result["success"]:
-                    value, preliminary = extract_value(result["data"], metric_key)
-                    
-                    if value is not None:
-                        stats["fetched"] += 1
-                        all_records.append({
-                            "fields": {
-                                "Datum": target_date.isoformat(),
-                                "Brand": site["brand"],
-                                "Plattform": site["surface"],
-                                "Metrik": metric_name,
-                                "Wert": value,
-                                "Site ID": site["site_id"],
-                                "Vorläufig": preliminary,
-                                "Erfasst am": datetime.utcnow().isoformat(),
-                                "Unique Key": unique_key
-                            }
-                        })
-                    else:
-                        stats["skipped_no_data"] += 1
-                else:
-                    if "Keine Daten" not in result.get("error", ""):
-                        stats["errors"].append(f"{target_date} {site['name']}/{metric_name}: {result['error']}")
-                    else:
-                        stats["skipped_no_data"] += 1
+                jobs.append((target_date, site, metric_key, metric_name, unique_key))
+    
+    results = fetch_infonline_parallel([(site["site_id"], metric_key, target_date)
+                                        for target_date, site, metric_key, _, _ in jobs])
+    
+    for (target_date, site, metric_key, metric_name, unique_key), result in zip(jobs, results):
+        if result["success"]:
+            value, preliminary = extract_value(result["data"], metric_key)
+            
+            if value is not None:
+                stats["fetched"] += 1
+                all_records.append({
+                    "fields": {
+                        "Datum": target_date.isoformat(),
+                        "Brand": site["brand"],
+                        "Plattform": site["surface"],
+                        "Metrik": metric_name,
+                        "Wert": value,
+                        "Site ID": site["site_id"],
+                        "Vorläufig": preliminary,
+                        "Erfasst am": datetime.utcnow().isoformat(),
+                        "Unique Key": unique_key
+                    }
+                })
+            else:
+                stats["skipped_no_data"] += 1
+        else:
+            if "Keine Daten" not in result.get("error", ""):
+                stats["errors"].append(f"{target_date} {site['name']}/{metric_name}: {result['error']}")
+            else:
+                stats["skipped_no_data"] += 1
     
     print(f"\n   ✓ Phase 1 abgeschlossen: {stats['fetched']} Records gesammelt")
     
@@ -430,51 +533,49 @@ def run_unified_backfill(days: int = 90, start_date: date = None, end_date: date
     print("🏠 PHASE 2: Homepage Page Impressions")
     print("=" * 70)
     
-    phase2_total = len(standard_dates) * len(HOMEPAGE_SITES)
-    phase2_current = 0
     phase2_fetched = 0
+    metric_name = "Homepage PI"
     
+    jobs = []
     for target_date in standard_dates:
         for site in HOMEPAGE_SITES:
-            phase2_current += 1
-            metric_name = "Homepage PI"
             unique_key = f"{target_date.isoformat()}_{site['brand']}_{site['surface']}_{metric_name}"
             
-            print(f"\r   [{phase2_current}/{phase2_total}] {target_date} {site['name']}...", end="")
-            
             if unique_key in existing_keys:
                 stats["skipped_duplicate"] += 1
                 continue
+            jobs.append((target_date, site, unique_key))
+    
+    results = fetch_infonline_parallel([(site["site_id"], "pageimpressions", target_date)
+                                        for target_date, site, _ in jobs])
+    
+    for (target_date, site, unique_key), result in zip(jobs, results):
+        if result["success"]:
+            value, preliminary = extract_value(result["data"], "pageimpressions")
             
-            result = fetch_infonline_data(site["site_id"], "pageimpressions", target_date)
-            sleep(API_DELAY)
-            
-            if result["success"]:
-                value, preliminary = extract_value(result["data"], "pageimpressions")
-                
-                if value is not None:
-                    stats["fetched"] += 1
-                    phase2_fetched += 1
-                    all_records.append({
-                        "fields": {
-                            "Datum": target_date.isoformat(),
-                            "Brand": site["brand"],
-                            "Plattform": site["surface"],
-                            "Metrik": metric_name,
-                            "Wert": value,
-                            "Site ID": site["site_id"],
-                            "Vorläufig": preliminary,
-                            "Erfasst am": datetime.utcnow().isoformat(),
-                            "Unique Key": unique_key
-                        }
-                    })
-                else:
-                    stats["skipped_no_data"] += 1
+            if value is not None:
+                stats["fetched"] += 1
+                phase2_fetched += 1
+                all_records.append({
+                    "fields": {
+                        "Datum": target_date.isoformat(),
+                        "Brand": site["brand"],
+                        "Plattform": site["surface"],
+                        "Metrik": metric_name,
+                        "Wert": value,
+                        "Site ID": site["site_id"],
+                        "Vorläufig": preliminary,
+                        "Erfasst am": datetime.utcnow().isoformat(),
+                        "Unique Key": unique_key
+                    }
+                })
+            else:
+                stats["skipped_no_data"] += 1
+        else:
+            if "Keine Daten" not in result.get("error", ""):
+                stats["errors"].append(f"{target_date} {site['name']}/Homepage PI: {result['error']}")
             else:
-                if "Keine Daten" not in result.get("error", ""):
-                    stats["errors"].append(f"{target_date} {site['name']}/Homepage PI: {result['error']}")
-                else:
-                    stats["skipped_no_data"] += 1
+                stats["skipped_no_data"] += 1
     
     print(f"\n   ✓ Phase 2 abgeschlossen: {phase2_fetched} Records gesammelt")
     
@@ -486,54 +587,52 @@ def run_unified_backfill(days: int = 90, start_date: date = None, end_date: date
     print("   ⚠️ UC-Werte von 0 werden übersprungen (noch nicht finalisiert)")
     print("=" * 70)
     
-    phase3_total = len(uc_dates) * len(SITES)
-    phase3_current = 0
     phase3_fetched = 0
+    metric_name = "Unique Clients"
     
+    jobs = []
     for target_date in uc_dates:
         for site in SITES:
-            phase3_current += 1
-            metric_name = "Unique Clients"
             unique_key = f"{target_date.isoformat()}_{site['brand']}_{site['surface']}_{metric_name}"
             
-            print(f"\r   [{phase3_current}/{phase3_total}] {target_date} {site['name']}...", end="")
-            
             if unique_key in existing_keys:
                 stats["skipped_duplicate"] += 1
                 continue
+            jobs.append((target_date, site, unique_key))
+    
+    results = fetch_infonline_parallel([(site["site_id"], "uniqueclients", target_date)
+                                        for target_date, site, _ in jobs])
+    
+    for (target_date, site, unique_key), result in zip(jobs, results):
+        if result["success"]:
+            value, preliminary = extract_value(result["data"], "uniqueclients")
             
-            result = fetch_infonline_data(site["site_id"], "uniqueclients", target_date)
-            sleep(API_DELAY)
-            
-            if result["success"]:
-                value, preliminary = extract_value(result["data"], "uniqueclients")
-                
-                # KRITISCH: UC = 0 bedeutet "noch nicht finalisiert" - NICHT importieren!
-                if value is not None and value > 0:
-                    stats["fetched"] += 1
-                    phase3_fetched += 1
-                    all_records.append({
-                        "fields": {
-                            "Datum": target_date.isoformat(),
-                            "Brand": site["brand"],
-                            "Plattform": site["surface"],
-                            "Metrik": metric_name,
-                            "Wert": value,
-                            "Site ID": site["site_id"],
-                            "Vorläufig": preliminary,
-                            "Erfasst am": datetime.utcnow().isoformat(),
-                            "Unique Key": unique_key
-                        }
-                    })
-                elif value == 0:
-                    stats["skipped_uc_zero"] += 1
-                else:
-                    stats["skipped_no_data"] += 1
+            # KRITISCH: UC = 0 bedeutet "noch nicht finalisiert" - NICHT importieren!
+            if value is not None and value > 0:
+                stats["fetched"] += 1
+                phase3_fetched += 1
+                all_records.append({
+                    "fields": {
+                        "Datum": target_date.isoformat(),
+                        "Brand": site["brand"],
+                        "Plattform": site["surface"],
+                        "Metrik": metric_name,
+                        "Wert": value,
+                        "Site ID": site["site_id"],
+                        "Vorläufig": preliminary,
+                        "Erfasst am": datetime.utcnow().isoformat(),
+                        "Unique Key": unique_key
+                    }
+                })
+            elif value == 0:
+                stats["skipped_uc_zero"] += 1
+            else:
+                stats["skipped_no_data"] += 1
+        else:
+            if "Keine Daten" not in result.get("error", ""):
+                stats["errors"].append(f"{target_date} {site['name']}/UC: {result['error']}")
             else:
-                if "Keine Daten" not in result.get("error", ""):
-                    stats["errors"].append(f"{target_date} {site['name']}/UC: {result['error']}")
-                else:
-                    stats["skipped_no_data"] += 1
+                stats["skipped_no_data"] += 1
     
     print(f"\n   ✓ Phase 3 abgeschlossen: {phase3_fetched} Records gesammelt")
     if stats["skipped_uc_zero"] > 0:
@@ -22,24 +22,66 @@ Nutzung:
 
 import os
 import json
+import atexit
+import hashlib
+import traceback
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import statistics
-import base64
 import io
-import time
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, List, Dict, Optional, Tuple
 
-# Plotly für Diagramme (optional, mit Fallback)
+# orjson (optional) - deutlich schnelleres Parsen großer Airtable-Seiten
 try:
-    import plotly.express as px
-    import plotly.graph_objects as go
-    import pandas as pd
-    PLOTLY_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PLOTLY_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# Plotly für Diagramme (optional, mit Fallback)
+if TYPE_CHECKING:
+    import plotly.graph_objects as go  # nur für Typ-Annotationen
+# Nur Verfügbarkeit prüfen - importiert wird erst beim ersten Diagramm
+# (_get_go), Läufe ohne Diagramme sparen den Import.
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
+if not PLOTLY_AVAILABLE:
     print("⚠️ Plotly nicht verfügbar - keine Diagramme möglich")
 
+
+@lru_cache(maxsize=1)
+def _get_go():
+    """
+    plotly.graph_objects (lazy, einmal pro Prozess importiert).
+    
+    Registriert beim ersten Aufruf das Template "oewa" mit dem gemeinsamen
+    Layout aller Wochenbericht-Diagramme (analog Monthly Report); die
+    create_*-Funktionen setzen nur noch Titel, Legende und Achsen-Spezialfälle.
+    """
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    
+    pio.templates["oewa"] = go.layout.Template(layout=dict(
+        width=CHART_WIDTH,
+        height=CHART_HEIGHT,
+        font=dict(size=14),
+        title_font_size=20,
+        xaxis=dict(title=""),
+        yaxis=dict(tickformat=",", title="")
+    ))
+    pio.templates.default = "plotly+oewa"
+    return go
+
+
+# Horizontale Legende oben rechts (Balken-/Liniendiagramme). Bewusst nicht im
+# Template: das Pie-Chart behält die Standard-Legende.
+LEGEND_TOP = dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, title_text="")
+
+
 # =============================================================================
 # KONFIGURATION
 # =============================================================================
@@ -48,12 +90,24 @@ AIRTABLE_BASE_ID = os.environ.get("AIRTABLE_BASE_ID", "")  # Muss in CI/CD Varia
 TEAMS_WEBHOOK_URL = os.environ.get("TEAMS_WEBHOOK_URL", "")
 TEAMS_WEBHOOK_URL_WEEKLY_SECONDARY = os.environ.get("TEAMS_WEBHOOK_URL_WEEKLY_SECONDARY", "")  # Zusätzlicher Teams Channel für Weekly Reports
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
+OEWA_DEBUG = os.environ.get("OEWA_DEBUG", "") not in ("", "0")  # Tracebacks bei Fehlern ausgeben
 IMGBB_API_KEY = os.environ.get("IMGBB_API_KEY", "")
 
-# Chart-Größe (ERHÖHT für bessere Lesbarkeit in Teams)
-CHART_WIDTH = 1600
-CHART_HEIGHT = 800
-CHART_SCALE = 2  # Retina-Qualität
+# Chart-Größe (optimiert für Teams, identisch zum Monthly Report)
+# Teams zeigt Bilder ohnehin verkleinert an - 1200x600 spart ~44% Pixel
+# gegenüber 1600x800 (Rendering, Upload-Größe, imgBB-Latenz)
+CHART_WIDTH = 1200
+CHART_HEIGHT = 600
+CHART_SCALE = 1.5  # Teams zeigt max. ~800 px breit - 1.5x bleibt scharf, ~44% weniger Pixel als 2x
+
+# Bildformat (png, webp, jpeg). WebP/JPEG sind deutlich kleiner, PNG wird
+# von allen Teams-Clients in MessageCards angezeigt → Standard.
+# SVG geht nicht: imgBB nimmt kein SVG an, Teams zeigt es in Cards nicht an.
+CHART_FORMAT = os.environ.get("CHART_FORMAT", "png").lower()
+CHART_MIME_TYPES = {"png": "image/png", "webp": "image/webp", "jpeg": "image/jpeg"}
+if CHART_FORMAT not in CHART_MIME_TYPES:
+    print(f"⚠️ CHART_FORMAT '{CHART_FORMAT}' nicht unterstützt - verwende png")
+    CHART_FORMAT = "png"
 
 # Daten-Verzögerung (Tage) - INFOnline API liefert erst nach ~2 Tagen finale Daten
 REPORT_DELAY_DAYS = 2
@@ -81,12 +135,42 @@ PLATFORM_COLORS = {
     "Web": "#3B82F6",
     "App": "#10B981",
 }
+CHANGE_COLORS = {"VOL Web": "#3B82F6", "VOL App": "#10B981"}
+# Aktuelle Woche / Ø Vergleichswochen
+KPI_COLORS = ("#3B82F6", "#93C5FD")
+
+# HTTP-Session für Airtable, imgBB, OpenAI und Teams:
+# Keep-Alive + Retry/Backoff über urllib3 (inkl. Retry-After bei 429)
+HTTP_MAX_RETRIES = 3
+IMGBB_UPLOAD_WORKERS = 6  # Parallele Chart-Uploads (= pool_maxsize)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=IMGBB_UPLOAD_WORKERS,
+    max_retries=Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "POST"],
+        respect_retry_after_header=True,
+        raise_on_status=False  # Letzte Antwort zurückgeben statt Exception
+    )
+))
+
+# GPT-Antwort-Cache (Re-Runs derselben Woche ohne erneuten OpenAI-Call)
+GPT_CACHE_DIR = os.environ.get("GPT_CACHE_DIR", ".gpt_cache")
+# OEWA_DISABLE_GPT_CACHE=1: gespeicherte Antworten ignorieren (Neu-Generierung erzwingen)
+GPT_CACHE_DISABLED = os.environ.get("OEWA_DISABLE_GPT_CACHE", "") not in ("", "0")
+
+# Chart-Cache (Key = Figure-Inhalt): Re-Runs mit unveränderten Daten ohne Kaleido
+CHART_CACHE_DIR = os.environ.get("CHART_CACHE_DIR", ".chart_cache")
 
 
 # =============================================================================
 # HILFSFUNKTIONEN
 # =============================================================================
 
+@lru_cache(maxsize=256)
 def format_number(n: float) -> str:
     """Formatiert große Zahlen lesbar (z.B. 5.5M, 789K)."""
     if n >= 1_000_000:
@@ -96,6 +180,7 @@ def format_number(n: float) -> str:
     return f"{n:,.0f}"
 
 
+@lru_cache(maxsize=256)
 def format_change(change: Optional[float], prefix: str = "") -> str:
     """Formatiert prozentuale Änderung."""
     if change is None:
@@ -103,68 +188,214 @@ def format_change(change: Optional[float], prefix: str = "") -> str:
     return f"{prefix}{change*100:+.1f}%"
 
 
+@lru_cache(maxsize=256)
+def format_num_de(value: int) -> str:
+    """Formatiert Zahl mit Punkt als Tausendertrennzeichen (deutsch)."""
+    return f"{value:,}".replace(",", ".")
+
+
+@lru_cache(maxsize=256)
+def format_pct(change: Optional[float]) -> str:
+    """Formatiert prozentuale Änderung kurz: +2% oder -3% (Teams-KPI-Zeilen)."""
+    if change is None:
+        return "N/A"
+    pct = change * 100
+    if pct >= 0:
+        return f"+{pct:.0f}%"
+    return f"{pct:.0f}%"
+
+
+def parse_json_response(response: requests.Response) -> Dict:
+    """Parst eine JSON-Response - mit orjson falls verfügbar, sonst stdlib."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def dump_json(obj) -> bytes:
+    """Serialisiert einen Request-Body (UTF-8) - mit orjson falls verfügbar, sonst stdlib."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
 # =============================================================================
 # ROBUSTER IMAGE UPLOAD (mit Retry - analog Monthly Report)
 # =============================================================================
 
-def upload_to_imgbb_robust(image_bytes: bytes, max_retries: int = 3) -> Optional[str]:
+# imgBB-Antworten, nach denen weitere Uploads in diesem Lauf zwecklos sind
+# (ungültiger Key bzw. Rate-Limit auch nach den Session-Retries)
+IMGBB_FATAL_STATUS = (401, 403, 429)
+_IMGBB_DISABLED = False
+
+
+def upload_to_imgbb_robust(image_bytes: bytes) -> Optional[str]:
     """
-    Lädt ein Bild zu imgBB hoch mit Retry-Mechanismus.
+    Lädt ein Bild zu imgBB hoch.
+    
+    Retries mit exponentiellem Backoff (429/5xx, Verbindungsfehler, Retry-After)
+    übernimmt der HTTPAdapter der Modul-Session.
     
     Args:
         image_bytes: PNG-Bilddaten
-        max_retries: Maximale Anzahl Versuche
     
     Returns:
         URL des hochgeladenen Bildes oder None
     """
+    global _IMGBB_DISABLED
     if not image_bytes or not IMGBB_API_KEY:
         if not IMGBB_API_KEY:
             print("   ⚠️ IMGBB_API_KEY nicht konfiguriert")
         return None
+    if _IMGBB_DISABLED:
+        return None
     
-    for attempt in range(max_retries):
-        try:
-            print(f"   📤 Upload-Versuch {attempt + 1}/{max_retries} ({len(image_bytes)} bytes)...")
-            
-            response = requests.post(
-                "https://api.imgbb.com/1/upload",
-                data={
-                    "key": IMGBB_API_KEY,
-                    "image": base64.b64encode(image_bytes).decode("utf-8"),
-                    "expiration": 0
-                },
-                timeout=90
-            )
-            
-            if response.status_code == 200:
-                url = response.json()["data"]["url"]
-                print(f"   ✅ Upload erfolgreich: {url[:50]}...")
-                return url
-            else:
-                print(f"   ⚠️ HTTP {response.status_code}")
-                if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt
-                    print(f"   ⏳ Warte {wait_time}s vor erneutem Versuch...")
-                    time.sleep(wait_time)
-                    
-        except requests.exceptions.Timeout:
-            print(f"   ⚠️ Timeout bei Versuch {attempt + 1}")
-            if attempt < max_retries - 1:
-                time.sleep(2)
-        except Exception as e:
-            print(f"   ⚠️ Fehler: {type(e).__name__}: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2)
+    try:
+        print(f"   📤 Upload ({len(image_bytes)} bytes)...")
+        
+        response = _SESSION.post(
+            "https://api.imgbb.com/1/upload",
+            data={
+                "key": IMGBB_API_KEY,
+                "expiration": 0
+            },
+            # Multipart-Upload: Rohdaten statt Base64 (~33% kleinerer Request)
+            files={"image": (f"chart.{CHART_FORMAT}", image_bytes, CHART_MIME_TYPES[CHART_FORMAT])},
+            timeout=90
+        )
+        
+        if response.status_code == 200:
+            url = parse_json_response(response)["data"]["url"]
+            print(f"   ✅ Upload erfolgreich: {url[:50]}...")
+            return url
+        
+        print(f"   ⚠️ HTTP {response.status_code}")
+        if response.status_code in IMGBB_FATAL_STATUS:
+            # Restliche Charts nicht mehr hochladen (spart deren Retry-Backoff)
+            _IMGBB_DISABLED = True
+            print("   ⛔ imgBB abgelehnt - weitere Uploads in diesem Lauf übersprungen")
+    except requests.exceptions.Timeout:
+        print("   ⚠️ Timeout beim Upload")
+    except Exception as e:
+        print(f"   ⚠️ Fehler: {type(e).__name__}: {e}")
     
     print("   ❌ Upload nach allen Versuchen fehlgeschlagen")
     return None
 
 
+def upload_charts(charts: Iterable[Tuple[str, bytes]]) -> Dict[str, str]:
+    """
+    Lädt mehrere Diagramme parallel zu imgBB hoch (analog Monthly Report).
+    
+    Jeder Upload startet, sobald sein PNG vorliegt - charts darf ein
+    Generator sein, der noch rendert. Bricht der Generator mit einem Fehler
+    ab, bleiben die bis dahin gelieferten Diagramme erhalten. Alle Uploads
+    teilen sich die Keep-Alive-Verbindungen der Modul-Session.
+    
+    Returns:
+        {Name: URL} in Eingangsreihenfolge, fehlgeschlagene Uploads fehlen
+    """
+    futures = {}
+    with ThreadPoolExecutor(max_workers=IMGBB_UPLOAD_WORKERS) as executor:
+        try:
+            for name, png in charts:
+                futures[name] = executor.submit(upload_to_imgbb, png)
+        except Exception as e:
+            print(f"   ⚠️ Diagramm-Fehler: {type(e).__name__}: {e} - lade {len(futures)} fertige Diagramme hoch")
+    
+    urls = {name: future.result() for name, future in futures.items()}
+    return {name: url for name, url in urls.items() if url}
+
+
 # =============================================================================
 # DIAGRAMM-FUNKTIONEN (erweitert für v4.0)
 # =============================================================================
 
+@lru_cache(maxsize=1)
+def _start_kaleido_server() -> bool:
+    """
+    Startet einmal pro Lauf einen persistenten Kaleido-Server (kaleido >= 1.1).
+    
+    Ohne Server startet to_image() für jedes Diagramm einen eigenen Chromium;
+    mit Server nutzen alle sechs Charts denselben Browser.
+    
+    Der Server ist nicht thread-sicher (gemeinsame Antwort-Queue): gerendert
+    wird nur im Haupt-Thread, die Uploads laufen parallel (upload_charts).
+    """
+    try:
+        import kaleido
+        kaleido.start_sync_server(silence_warnings=True)
+    except (ImportError, AttributeError):
+        return False
+    except Exception as e:
+        print(f"   ⚠️ Kaleido-Server nicht gestartet ({type(e).__name__}: {e})")
+        return False
+    atexit.register(kaleido.stop_sync_server, silence_warnings=True)
+    return True
+
+
+def _chart_cache_path(fig: "go.Figure") -> str:
+    """
+    Cache-Datei für eine Figure (content-addressed, analog Monthly Report).
+    
+    Der Key umfasst die komplette Figure (Daten, Layout, KW im Titel) plus
+    Render-Skalierung - jede Änderung ergibt automatisch einen neuen Key.
+    """
+    fig_hash = hashlib.md5(f"{fig.to_json()}|{CHART_SCALE}".encode("utf-8")).hexdigest()
+    return os.path.join(CHART_CACHE_DIR, f"{fig_hash}.{CHART_FORMAT}")
+
+
+def _read_chart_cache(path: str) -> Optional[bytes]:
+    """Liefert ein bereits gerendertes Bild oder None."""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_chart_cache(path: str, image: bytes):
+    """Speichert ein gerendertes Bild (Fehler beim Schreiben sind nicht kritisch)."""
+    try:
+        os.makedirs(CHART_CACHE_DIR, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(image)
+    except OSError as e:
+        print(f"   ⚠️ Chart-Cache nicht beschreibbar: {e}")
+
+
+def _render_payload(fig: "go.Figure") -> Dict:
+    """
+    Figure als Dict für Kaleido - ohne ungenutzte Template-Defaults (analog Monthly).
+    
+    Das Plotly-Standardtemplate bringt Trace-Defaults für ~25 Typen mit;
+    an Chromium gehen nur die Typen, die in der Figure vorkommen.
+    """
+    fig_dict = fig.to_dict()  # tiefe Kopie, darf verändert werden
+    template = fig_dict.get("layout", {}).get("template", {})
+    if "data" in template:
+        used = {trace.get("type", "scatter") for trace in fig_dict.get("data", [])}
+        template["data"] = {kind: defaults for kind, defaults in template["data"].items() if kind in used}
+    return fig_dict
+
+
+def _render_image(fig: "go.Figure") -> bytes:
+    """
+    Rendert eine Figure als CHART_FORMAT (über den persistenten Kaleido-Server).
+    
+    Bereits gerenderte Figures kommen aus dem Disk-Cache (CHART_CACHE_DIR).
+    """
+    cache_path = _chart_cache_path(fig)
+    image = _read_chart_cache(cache_path)
+    if image is not None:
+        return image
+    _start_kaleido_server()
+    image = _get_go().Figure(_render_payload(fig)).to_image(format=CHART_FORMAT, scale=CHART_SCALE)
+    if image:
+        _write_chart_cache(cache_path, image)
+    return image
+
+
 def create_kpi_comparison_chart(data: Dict, metric: str = "Page Impressions") -> Optional[bytes]:
     """
     Erstellt ein KPI-Vergleichs-Balkendiagramm (Aktuell vs. 6-Wochen-Durchschnitt) als großes PNG.
@@ -173,7 +404,8 @@ def create_kpi_comparison_chart(data: Dict, metric: str = "Page Impressions") ->
     if not PLOTLY_AVAILABLE:
         return None
     
-    chart_data = []
+    # Spaltenweise sammeln: ein Trace für die aktuelle Woche, einer für den Ø
+    props, current_values, avg_values = [], [], []
     
     # NUR VOL - Vienna ausgeschlossen
     for surface in ["Web", "App"]:
@@ -181,51 +413,28 @@ def create_kpi_comparison_chart(data: Dict, metric: str = "Page Impressions") ->
         if key in data and metric in data[key]:
             metric_data = data[key][metric]
             
-            # Aktuelle Woche
-            chart_data.append({
-                "property": f"VOL {surface}",
-                "wert": metric_data.get("current_sum", 0),
-                "periode": "Aktuelle Woche"
-            })
-            
-            # 6-Wochen-Durchschnitt
-            chart_data.append({
-                "property": f"VOL {surface}",
-                "wert": metric_data.get("avg_6_weeks", 0),
-                "periode": "Ø 6 Wochen"
-            })
-    
-    if not chart_data:
+            # Aktuelle Woche + 6-Wochen-Durchschnitt
+            props.append(f"VOL {surface}")
+            current_values.append(metric_data.get("current_sum", 0))
+            avg_values.append(metric_data.get("avg_6_weeks", 0))
+    
+    if not props:
         return None
     
-    df = pd.DataFrame(chart_data)
+    go = _get_go()
     
-    fig = px.bar(
-        df,
-        x="property",
-        y="wert",
-        color="periode",
-        barmode="group",
-        title=f"📊 {metric} - Aktuelle Woche vs. 6-Wochen-Ø (nur VOL)",
-        color_discrete_map={
-            "Aktuelle Woche": "#3B82F6",
-            "Ø 6 Wochen": "#93C5FD"
-        }
-    )
+    fig = go.Figure([
+        go.Bar(name="Aktuelle Woche", x=props, y=current_values, marker_color=KPI_COLORS[0]),
+        go.Bar(name="Ø 6 Wochen", x=props, y=avg_values, marker_color=KPI_COLORS[1]),
+    ])
     
     fig.update_layout(
-        yaxis=dict(tickformat=",", title=""),
-        xaxis_title="",
-        legend_title="",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        width=CHART_WIDTH,
-        height=CHART_HEIGHT,
-        font=dict(size=14),
-        title_font_size=20
+        title=f"📊 {metric} - Aktuelle Woche vs. 6-Wochen-Ø (nur VOL)",
+        barmode="group",
+        legend=LEGEND_TOP
     )
     
-    img_bytes = fig.to_image(format="png", scale=CHART_SCALE)
-    return img_bytes
+    return _render_image(fig)
 
 
 def create_trend_chart(data: Dict, metric: str = "Page Impressions") -> Optional[bytes]:
@@ -236,50 +445,38 @@ def create_trend_chart(data: Dict, metric: str = "Page Impressions") -> Optional
     if not PLOTLY_AVAILABLE:
         return None
     
-    chart_data = []
+    traces = []
     
     # NUR VOL - Vienna ausgeschlossen
     for surface in ["Web", "App"]:
         key = f"VOL_{surface}"
         if key in data and metric in data[key]:
             daily = data[key][metric].get("daily", {})
-            for datum, wert in daily.items():
-                chart_data.append({
-                    "datum": datum,
-                    "wert": wert,
-                    "property": f"VOL {surface}"
-                })
-    
-    if not chart_data:
+            if not daily:
+                continue
+            # ISO-Datumsstrings sortieren lexikografisch = chronologisch,
+            # Plotly erkennt sie selbst als Datumsachse
+            daten = sorted(daily)
+            label = f"VOL {surface}"
+            traces.append((label, daten, [daily[d] for d in daten]))
+    
+    if not traces:
         return None
     
-    df = pd.DataFrame(chart_data)
-    df["datum"] = pd.to_datetime(df["datum"])
-    df = df.sort_values("datum")
+    go = _get_go()
     
-    fig = px.line(
-        df,
-        x="datum",
-        y="wert",
-        color="property",
-        title=f"📈 {metric} - 7-Tage-Trend (nur VOL)",
-        color_discrete_map=BRAND_COLORS,
-        markers=True
-    )
+    fig = go.Figure([
+        go.Scatter(name=label, x=daten, y=werte, mode="lines+markers", line_color=BRAND_COLORS.get(label))
+        for label, daten, werte in traces
+    ])
     
     fig.update_layout(
-        yaxis=dict(tickformat=",", title=""),
-        xaxis=dict(tickformat="%d.%m.", title=""),
-        legend_title="",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        width=CHART_WIDTH,
-        height=CHART_HEIGHT,
-        font=dict(size=14),
-        title_font_size=20
+        title=f"📈 {metric} - 7-Tage-Trend (nur VOL)",
+        xaxis_tickformat="%d.%m.",
+        legend=LEGEND_TOP
     )
     
-    img_bytes = fig.to_image(format="png", scale=CHART_SCALE)
-    return img_bytes
+    return _render_image(fig)
 
 
 def create_6week_comparison_chart(weekly_data: Dict, metric: str = "Page Impressions") -> Optional[bytes]:
@@ -291,58 +488,52 @@ def create_6week_comparison_chart(weekly_data: Dict, metric: str = "Page Impress
     if not PLOTLY_AVAILABLE:
         return None
     
-    chart_data = []
+    # Ein Trace pro Plattform (ohne DataFrame)
+    traces = []
     
     # Daten für Web und App
     for surface in ["Web", "App"]:
         key = f"VOL_{surface}"
         if key in weekly_data:
             weeks_data = weekly_data[key].get(metric, {}).get("weekly_values", [])
+            if not weeks_data:
+                continue
             # CHRONOLOGISCH: Liste umkehren (älteste zuerst, neueste zuletzt)
-            weeks_data_sorted = list(reversed(weeks_data))
-            for week_info in weeks_data_sorted:
-                chart_data.append({
-                    "woche": week_info["label"],
-                    "wert": week_info["value"],
-                    "property": f"VOL {surface}",
-                    "is_current": week_info.get("is_current", False)
-                })
+            weeks_data_sorted = weeks_data[::-1]
+            label = f"VOL {surface}"
+            current_color = BRAND_COLORS.get(label, "#3B82F6")
+            traces.append((
+                label,
+                [week_info["label"] for week_info in weeks_data_sorted],
+                [week_info["value"] for week_info in weeks_data_sorted],
+                [current_color if week_info.get("is_current", False) else "#93C5FD"
+                 for week_info in weeks_data_sorted],
+            ))
     
-    if not chart_data:
+    if not traces:
         return None
     
-    df = pd.DataFrame(chart_data)
-    
-    fig = go.Figure()
+    go = _get_go()
     
-    for surface in ["Web", "App"]:
-        surface_data = df[df["property"] == f"VOL {surface}"]
-        if not surface_data.empty:
-            colors = [BRAND_COLORS.get(f"VOL {surface}", "#3B82F6") if row["is_current"] 
-                     else "#93C5FD" for _, row in surface_data.iterrows()]
-            
-            fig.add_trace(go.Bar(
-                x=surface_data["woche"],
-                y=surface_data["wert"],
-                name=f"VOL {surface}",
-                marker_color=colors,
-                text=surface_data["wert"].apply(lambda x: f"{x:,.0f}".replace(",", ".")),
-                textposition="outside"
-            ))
+    fig = go.Figure([
+        go.Bar(
+            x=wochen,
+            y=werte,
+            name=label,
+            marker_color=colors,
+            text=[f"{x:,.0f}".replace(",", ".") for x in werte],
+            textposition="outside"
+        )
+        for label, wochen, werte, colors in traces
+    ])
     
     fig.update_layout(
         title=f"📊 {metric} - 7-Wochen-Übersicht (nur VOL)",
-        yaxis=dict(tickformat=",", title=""),
-        xaxis_title="",
         barmode="group",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        width=CHART_WIDTH,
-        height=CHART_HEIGHT,
-        font=dict(size=14),
-        title_font_size=20
+        legend=LEGEND_TOP
     )
     
-    return fig.to_image(format="png", scale=CHART_SCALE)
+    return _render_image(fig)
 
 
 def create_multi_metric_chart(data: Dict) -> Optional[bytes]:
@@ -353,7 +544,8 @@ def create_multi_metric_chart(data: Dict) -> Optional[bytes]:
     if not PLOTLY_AVAILABLE:
         return None
     
-    chart_data = []
+    # Direkt nach Plattform gruppieren (ein Trace pro Plattform)
+    traces = {}
     
     for metric in ["Page Impressions", "Visits"]:
         for platform in ["Web", "App"]:
@@ -361,47 +553,38 @@ def create_multi_metric_chart(data: Dict) -> Optional[bytes]:
             if key in data and metric in data[key]:
                 m = data[key][metric]
                 pct_change = m.get("pct_change", 0) or 0
-                chart_data.append({
-                    "metrik": metric.replace("Page Impressions", "PI"),
-                    "plattform": f"VOL {platform}",
-                    "pct_change": pct_change * 100,
-                })
+                xs, ys = traces.setdefault(f"VOL {platform}", ([], []))
+                xs.append(metric.replace("Page Impressions", "PI"))
+                ys.append(pct_change * 100)
     
-    if not chart_data:
+    if not traces:
         return None
     
-    df = pd.DataFrame(chart_data)
+    go = _get_go()
     
-    fig = px.bar(
-        df,
-        x="metrik",
-        y="pct_change",
-        color="plattform",
-        barmode="group",
-        title="📊 Änderungen vs. 6-Wochen-Ø (%)",
-        color_discrete_map={
-            "VOL Web": "#3B82F6",
-            "VOL App": "#10B981"
-        },
-        text=df["pct_change"].apply(lambda x: f"{x:+.1f}%")
-    )
+    fig = go.Figure([
+        go.Bar(
+            name=label,
+            x=xs,
+            y=ys,
+            marker_color=CHANGE_COLORS[label],
+            text=[f"{y:+.1f}%" for y in ys]
+        )
+        for label, (xs, ys) in traces.items()
+    ])
     
     fig.add_hline(y=0, line_dash="dash", line_color="gray")
     
     fig.update_layout(
-        yaxis=dict(title="Änderung (%)"),
-        xaxis_title="",
-        legend_title="",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        width=CHART_WIDTH,
-        height=CHART_HEIGHT,
-        font=dict(size=14),
-        title_font_size=20
+        title="📊 Änderungen vs. 6-Wochen-Ø (%)",
+        barmode="group",
+        yaxis=dict(title="Änderung (%)", tickformat=""),
+        legend=LEGEND_TOP
     )
     
     fig.update_traces(textposition="outside")
     
-    return fig.to_image(format="png", scale=CHART_SCALE)
+    return _render_image(fig)
 
 
 def create_platform_pie_chart(data: Dict, metric: str = "Page Impressions") -> Optional[bytes]:
@@ -427,6 +610,8 @@ def create_platform_pie_chart(data: Dict, metric: str = "Page Impressions") -> O
     if not values:
         return None
     
+    go = _get_go()
+    
     fig = go.Figure(data=[go.Pie(
         labels=labels,
         values=values,
@@ -437,14 +622,10 @@ def create_platform_pie_chart(data: Dict, metric: str = "Page Impressions") -> O
     )])
     
     fig.update_layout(
-        title=f"📊 {metric} - Web vs. App Anteil",
-        width=CHART_WIDTH,
-        height=CHART_HEIGHT,
-        font=dict(size=14),
-        title_font_size=20
+        title=f"📊 {metric} - Web vs. App Anteil"
     )
     
-    return fig.to_image(format="png", scale=CHART_SCALE)
+    return _render_image(fig)
 
 
 # Alias für Rückwärtskompatibilität
@@ -481,12 +662,12 @@ def get_measurements(days: int = 56) -> List[Dict]:
         if offset:
             params["offset"] = offset
             
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = _SESSION.get(url, headers=headers, params=params, timeout=30)
         if response.status_code != 200:
             print(f"⚠️ Airtable Fehler: {response.status_code}")
             break
             
-        data = response.json()
+        data = parse_json_response(response)
         records.extend(data.get("records", []))
         
         offset = data.get("offset")
@@ -562,7 +743,8 @@ def process_data(records: List[Dict], week_start: date, week_end: date = None) -
         metric = fields.get("Metrik")
         wert = fields.get("Wert")
         
-        if not all([datum_str, brand, metric, wert]):
+        # Kurzschluss-Prüfung statt all([...]) - keine Listen-Allokation pro Record
+        if not (datum_str and brand and metric and wert):
             continue
         
         # NUR VOL (wird bereits beim Laden gefiltert, aber sicherheitshalber)
@@ -648,6 +830,33 @@ def process_data(records: List[Dict], week_start: date, week_end: date = None) -
 # GPT SUMMARY
 # =============================================================================
 
+def _gpt_cache_path(prompt: str) -> str:
+    """Cache-Datei für einen Prompt (Dateiname = SHA1 des Prompts)."""
+    prompt_hash = hashlib.sha1(prompt.encode("utf-8")).hexdigest()
+    return os.path.join(GPT_CACHE_DIR, f"{prompt_hash}.txt")
+
+
+def _read_gpt_cache(prompt: str) -> Optional[str]:
+    """Liefert eine bereits gespeicherte GPT-Antwort oder None."""
+    if GPT_CACHE_DISABLED:
+        return None
+    try:
+        with open(_gpt_cache_path(prompt), "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_gpt_cache(prompt: str, content: str):
+    """Speichert eine GPT-Antwort (Fehler beim Schreiben sind nicht kritisch)."""
+    try:
+        os.makedirs(GPT_CACHE_DIR, exist_ok=True)
+        with open(_gpt_cache_path(prompt), "w", encoding="utf-8") as f:
+            f.write(content)
+    except OSError as e:
+        print(f"   ⚠️ GPT-Cache nicht beschreibbar: {e}")
+
+
 def generate_gpt_summary(data: Dict, period: str) -> str:
     """
     Generiert eine GPT-Zusammenfassung.
@@ -658,17 +867,19 @@ def generate_gpt_summary(data: Dict, period: str) -> str:
     
     # Daten für den Prompt aufbereiten - NUR VOL
     # PROFESSIONELL: Tagesdurchschnitte für fairen Vergleich
-    kpi_text = ""
+    # Zeilen sammeln und einmal zusammenfügen (statt wiederholtem +=)
+    kpi_parts = []
     for key in ["VOL_Web", "VOL_App"]:
         if key in data:
-            kpi_text += f"\n**{key.replace('_', ' ')}:**\n"
+            kpi_parts.append(f"\n**{key.replace('_', ' ')}:**\n")
             for metric in METRICS:
                 if metric in data[key]:
                     m = data[key][metric]
                     pct = f"{m['pct_change']*100:+.1f}%" if m.get('pct_change') is not None else "N/A"
                     daily_avg = m.get('current_avg', 0)
                     prev_daily_avg = m.get('avg_daily_6_weeks', 0)
-                    kpi_text += f"  - {metric}: Ø {daily_avg:,.0f}/Tag (vs. 6-Wochen-Ø {prev_daily_avg:,.0f}/Tag: {pct})\n"
+                    kpi_parts.append(f"  - {metric}: Ø {daily_avg:,.0f}/Tag (vs. 6-Wochen-Ø {prev_daily_avg:,.0f}/Tag: {pct})\n")
+    kpi_text = "".join(kpi_parts)
     
     # Beste/Schlechteste Performance identifizieren
     changes = []
@@ -684,7 +895,7 @@ def generate_gpt_summary(data: Dict, period: str) -> str:
     if changes:
         best = max(changes, key=lambda x: x["change"])
         worst = min(changes, key=lambda x: x["change"])
-        highlight_text = f"🏆 TOP: {best['name']} ({best['change']*100:+.1f}% vs. 6-Wochen-Ø)\n📉 LOW: {worst['name']} ({worst['change']*100:+.1f}% vs. 6-Wochen-Ø)"
+        highlight_text = f"TOP: {best['name']} ({best['change']*100:+.1f}% vs. 6-Wochen-Ø)\nLOW: {worst['name']} ({worst['change']*100:+.1f}% vs. 6-Wochen-Ø)"
     else:
         highlight_text = "Keine Vergleichsdaten verfügbar"
     
@@ -694,18 +905,17 @@ Erstelle einen klaren, kompakten EXECUTIVE SUMMARY für das Management von Russm
 WICHTIG: Dieser Bericht betrifft NUR VOL.AT (Web + App). Vienna ist NICHT enthalten.
 WICHTIG: Alle KPIs sind als TAGESDURCHSCHNITTE angegeben für fairen Vergleich!
 
-═══════════════════════════════════════════════════════════════
-📅 BERICHTSZEITRAUM: {period}
-📊 VERGLEICH: Ø pro Tag vs. Ø pro Tag der letzten 6 Wochen
-═══════════════════════════════════════════════════════════════
+---
+BERICHTSZEITRAUM: {period}
+VERGLEICH: Ø pro Tag vs. Ø pro Tag der letzten 6 Wochen
+---
 
 KPI-DATEN (nur VOL.AT):
 {kpi_text}
 
 PERFORMANCE-ÜBERSICHT:
 {highlight_text}
-
-═══════════════════════════════════════════════════════════════
+---
 
 WICHTIG:
 - Professioneller, eloquenter Stil für Management-Ebene
@@ -732,8 +942,14 @@ FORMAT (EXAKT einhalten):
 [1 prägnanter Satz: positiv/stabil/leicht rückläufig/kritisch + Begründung]
 """
 
+    # Identischer Prompt (Zeitraum + KPIs, z.B. Re-Run) → gespeicherte Antwort
+    cached = _read_gpt_cache(prompt)
+    if cached is not None:
+        print("   ♻️ GPT-Zusammenfassung aus Cache")
+        return cached
+    
     try:
-        response = requests.post(
+        response = _SESSION.post(
             "https://api.openai.com/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {OPENAI_API_KEY}",
@@ -749,7 +965,9 @@ FORMAT (EXAKT einhalten):
         )
         
         if response.status_code == 200:
-            return response.json()["choices"][0]["message"]["content"]
+            content = parse_json_response(response)["choices"][0]["message"]["content"]
+            _write_gpt_cache(prompt, content)
+            return content
         else:
             return f"GPT-Fehler: {response.status_code}"
     except Exception as e:
@@ -780,21 +998,6 @@ def send_teams_report(title: str, summary: str, data: Dict, period: str, image_u
         print("⚠️ TEAMS_WEBHOOK_URL nicht konfiguriert")
         return
     
-    # === HILFSFUNKTION: Zahl mit Punkt-Trennung formatieren ===
-    def format_num_de(value: int) -> str:
-        """Formatiert Zahl mit Punkt als Tausendertrennzeichen (deutsch)"""
-        return f"{value:,}".replace(",", ".")
-    
-    # === HILFSFUNKTION: Prozent formatieren (kurz) ===
-    def format_pct(change: float) -> str:
-        """Formatiert prozentuale Änderung kurz: +2% oder -3%"""
-        if change is None:
-            return "N/A"
-        pct = change * 100
-        if pct >= 0:
-            return f"+{pct:.0f}%"
-        return f"{pct:.0f}%"
-    
     # === HILFSFUNKTION: Metrik-Zeile formatieren (exakt wie Vorlage) ===
     def format_metric_line(label: str, current: int, vs_prev_week: float, vs_avg: float) -> str:
         """Formatiert: Visits 2.500.000 (WOW: +2%, vs 6W-Ø: +4%)"""
@@ -865,43 +1068,42 @@ def send_teams_report(title: str, summary: str, data: Dict, period: str, image_u
     # WICHTIG: MS Teams benötigt <br> für echte Zeilenumbrüche!
     BR = "<br>"  # HTML Line Break für MS Teams
     
-    kpi_text = ""
-    
-    # 1. Gesamtentwicklung (mit HPPI)
-    kpi_text += f"**Gesamtentwicklung:**{BR}"
-    kpi_text += f"{format_metric_line('Visits', total_visits, total_visits_vs_prev, total_visits_vs_avg)}{BR}"
-    kpi_text += f"{format_metric_line('PI', total_pi, total_pi_vs_prev, total_pi_vs_avg)}{BR}"
-    kpi_text += f"{format_metric_line('UC', total_uc, total_uc_vs_prev, total_uc_vs_avg)}{BR}"
-    kpi_text += f"{format_metric_line('HPPI', total_hppi, web['hppi_vs_prev'], web['hppi_vs_avg'])}{BR}"
-    kpi_text += f"{BR}"
-    
-    # 2. Web-Entwicklung (mit HPPI)
-    kpi_text += f"**Web-Entwicklung**{BR}"
-    kpi_text += f"{format_metric_line('Visits', web['visits'], web['visits_vs_prev'], web['visits_vs_avg'])}{BR}"
-    kpi_text += f"{format_metric_line('PI', web['pi'], web['pi_vs_prev'], web['pi_vs_avg'])}{BR}"
-    kpi_text += f"{format_metric_line('UC', web['uc'], web['uc_vs_prev'], web['uc_vs_avg'])}{BR}"
-    kpi_text += f"{format_metric_line('HPPI', web['hppi'], web['hppi_vs_prev'], web['hppi_vs_avg'])}{BR}"
-    kpi_text += f"{BR}"
-    
-    # 3. App-Entwicklung (Gesamt) - OHNE HPPI
-    kpi_text += f"**App-Entwicklung (Gesamt)**{BR}"
-    kpi_text += f"{format_metric_line('Visits', app['visits'], app['visits_vs_prev'], app['visits_vs_avg'])}{BR}"
-    kpi_text += f"{format_metric_line('PI', app['pi'], app['pi_vs_prev'], app['pi_vs_avg'])}{BR}"
-    kpi_text += f"{format_metric_line('UC', app['uc'], app['uc_vs_prev'], app['uc_vs_avg'])}{BR}"
-    kpi_text += f"{BR}"
-    
-    # 4. App-Entwicklung (iOS) - OHNE HPPI
-    kpi_text += f"**App-Entwicklung (iOS)**{BR}"
-    kpi_text += f"{format_metric_line('Visits', ios['visits'], ios['visits_vs_prev'], ios['visits_vs_avg'])}{BR}"
-    kpi_text += f"{format_metric_line('PI', ios['pi'], ios['pi_vs_prev'], ios['pi_vs_avg'])}{BR}"
-    kpi_text += f"{format_metric_line('UC', ios['uc'], ios['uc_vs_prev'], ios['uc_vs_avg'])}{BR}"
-    kpi_text += f"{BR}"
-    
-    # 5. App-Entwicklung (Android) - OHNE HPPI
-    kpi_text += f"**App-Entwicklung (Android)**{BR}"
-    kpi_text += f"{format_metric_line('Visits', android['visits'], android['visits_vs_prev'], android['visits_vs_avg'])}{BR}"
-    kpi_text += f"{format_metric_line('PI', android['pi'], android['pi_vs_prev'], android['pi_vs_avg'])}{BR}"
-    kpi_text += f"{format_metric_line('UC', android['uc'], android['uc_vs_prev'], android['uc_vs_avg'])}"
+    # Zeilen sammeln und einmal verbinden (statt wiederholtem +=);
+    # "" ergibt die Leerzeile zwischen den Sektionen
+    kpi_lines = [
+        # 1. Gesamtentwicklung (mit HPPI)
+        "**Gesamtentwicklung:**",
+        format_metric_line('Visits', total_visits, total_visits_vs_prev, total_visits_vs_avg),
+        format_metric_line('PI', total_pi, total_pi_vs_prev, total_pi_vs_avg),
+        format_metric_line('UC', total_uc, total_uc_vs_prev, total_uc_vs_avg),
+        format_metric_line('HPPI', total_hppi, web['hppi_vs_prev'], web['hppi_vs_avg']),
+        "",
+        # 2. Web-Entwicklung (mit HPPI)
+        "**Web-Entwicklung**",
+        format_metric_line('Visits', web['visits'], web['visits_vs_prev'], web['visits_vs_avg']),
+        format_metric_line('PI', web['pi'], web['pi_vs_prev'], web['pi_vs_avg']),
+        format_metric_line('UC', web['uc'], web['uc_vs_prev'], web['uc_vs_avg']),
+        format_metric_line('HPPI', web['hppi'], web['hppi_vs_prev'], web['hppi_vs_avg']),
+        "",
+        # 3. App-Entwicklung (Gesamt) - OHNE HPPI
+        "**App-Entwicklung (Gesamt)**",
+        format_metric_line('Visits', app['visits'], app['visits_vs_prev'], app['visits_vs_avg']),
+        format_metric_line('PI', app['pi'], app['pi_vs_prev'], app['pi_vs_avg']),
+        format_metric_line('UC', app['uc'], app['uc_vs_prev'], app['uc_vs_avg']),
+        "",
+        # 4. App-Entwicklung (iOS) - OHNE HPPI
+        "**App-Entwicklung (iOS)**",
+        format_metric_line('Visits', ios['visits'], ios['visits_vs_prev'], ios['visits_vs_avg']),
+        format_metric_line('PI', ios['pi'], ios['pi_vs_prev'], ios['pi_vs_avg']),
+        format_metric_line('UC', ios['uc'], ios['uc_vs_prev'], ios['uc_vs_avg']),
+        "",
+        # 5. App-Entwicklung (Android) - OHNE HPPI
+        "**App-Entwicklung (Android)**",
+        format_metric_line('Visits', android['visits'], android['visits_vs_prev'], android['visits_vs_avg']),
+        format_metric_line('PI', android['pi'], android['pi_vs_prev'], android['pi_vs_avg']),
+        format_metric_line('UC', android['uc'], android['uc_vs_prev'], android['uc_vs_avg']),
+    ]
+    kpi_text = BR.join(kpi_lines)
     
     # === SECTIONS BAUEN ===
     sections = [
@@ -955,17 +1157,25 @@ def send_teams_report(title: str, summary: str, data: Dict, period: str, image_u
         print("⚠️ Keine TEAMS_WEBHOOK_URL konfiguriert")
         return
     
-    success_count = 0
-    for webhook_name, webhook_url in webhooks:
+    # Card einmal serialisieren, an alle Webhooks denselben Body senden
+    body = dump_json(card)
+    headers = {"Content-Type": "application/json"}
+    
+    def _post(channel: str, url: str) -> bool:
         try:
-            response = requests.post(webhook_url, json=card, timeout=30)
+            response = _SESSION.post(url, data=body, headers=headers, timeout=30)
             if response.status_code == 200:
-                print(f"✅ Wochenbericht v5.0 an Teams gesendet ({webhook_name})")
-                success_count += 1
-            else:
-                print(f"⚠️ Teams Fehler ({webhook_name}): {response.status_code}")
+                print(f"✅ Wochenbericht v5.0 an Teams gesendet ({channel})")
+                return True
+            print(f"⚠️ Teams Fehler ({channel}): {response.status_code}")
         except Exception as e:
-            print(f"⚠️ Teams Fehler ({webhook_name}): {e}")
+            print(f"⚠️ Teams Fehler ({channel}): {e}")
+        return False
+    
+    # Channels parallel beliefern (reines Netzwerk-Warten)
+    with ThreadPoolExecutor(max_workers=len(webhooks)) as executor:
+        futures = [executor.submit(_post, name, url) for name, url in webhooks]
+        success_count = sum(future.result() for future in futures)
     
     print(f"📤 Report an {success_count}/{len(webhooks)} Channels gesendet")
 
@@ -1041,73 +1251,65 @@ def run_weekly_report():
             print(f"               vs. 6-Wochen-Ø {prev_daily_avg:,.0f}/Tag → {pct}")
     
     # ==========================================================================
-    # DIAGRAMME ERSTELLEN (v4.0 - 6 Charts analog Monthly Report)
+    # GPT SUMMARY (parallel zu den Diagrammen)
     # ==========================================================================
-    image_urls = {}
-    if PLOTLY_AVAILABLE:
-        print("\n📊 Erstelle Diagramme (v4.0 - 6 Charts)...")
+    # GPT-Call liest nur data und ist I/O-bound → läuft im Hintergrund,
+    # während die Diagramme gerendert und hochgeladen werden.
+    print("\n🤖 Generiere KI-Zusammenfassung (parallel zu den Diagrammen)...")
+    with ThreadPoolExecutor(max_workers=1) as gpt_executor:
+        summary_future = gpt_executor.submit(generate_gpt_summary, data, period)
         
-        try:
-            # 1. PI Vergleich (Aktuell vs. 6-Wochen-Ø)
-            chart_bytes = create_kpi_comparison_chart(data, "Page Impressions")
-            if chart_bytes:
-                print("   → PI-Vergleich erstellt")
-                url = upload_to_imgbb(chart_bytes)
-                if url:
-                    image_urls["PI vs. 6-Wochen-Ø"] = url
-            
-            # 2. Visits Vergleich
-            visits_chart = create_kpi_comparison_chart(data, "Visits")
-            if visits_chart:
-                print("   → Visits-Vergleich erstellt")
-                url = upload_to_imgbb(visits_chart)
-                if url:
-                    image_urls["Visits vs. 6-Wochen-Ø"] = url
+        # ======================================================================
+        # DIAGRAMME ERSTELLEN (v4.0 - 6 Charts analog Monthly Report)
+        # ======================================================================
+        image_urls = {}
+        if PLOTLY_AVAILABLE:
+            print("\n📊 Erstelle Diagramme (v4.0 - 6 Charts)...")
             
-            # 3. 7-Tage Trend Chart
-            trend_bytes = create_trend_chart(data, "Page Impressions")
-            if trend_bytes:
-                print("   → 7-Tage-Trend erstellt")
-                url = upload_to_imgbb(trend_bytes)
-                if url:
-                    image_urls["7-Tage-Trend PI"] = url
+            # (Name im Bericht, Log-Text, Builder) - Reihenfolge = Reihenfolge im Bericht
+            chart_specs = [
+                # 1. PI Vergleich (Aktuell vs. 6-Wochen-Ø)
+                ("PI vs. 6-Wochen-Ø", "PI-Vergleich", lambda: create_kpi_comparison_chart(data, "Page Impressions")),
+                # 2. Visits Vergleich
+                ("Visits vs. 6-Wochen-Ø", "Visits-Vergleich", lambda: create_kpi_comparison_chart(data, "Visits")),
+                # 3. 7-Tage Trend Chart
+                ("7-Tage-Trend PI", "7-Tage-Trend", lambda: create_trend_chart(data, "Page Impressions")),
+                # 4. 7-Wochen-Übersicht
+                ("7-Wochen-Übersicht PI", "7-Wochen-Übersicht", lambda: create_6week_comparison_chart(data, "Page Impressions")),
+                # 5. Multi-Metrik Übersicht (NEU - analog Monthly)
+                ("Änderungen-Übersicht (%)", "Multi-Metrik Übersicht", lambda: create_multi_metric_chart(data)),
+                # 6. Plattform-Anteil Pie (NEU - analog Monthly)
+                # GEÄNDERT: Visits statt Page Impressions für besseren Vergleich
+                ("Web vs. App Visits", "Plattform-Anteil (Visits)", lambda: create_platform_pie_chart(data, "Visits")),
+            ]
             
-            # 4. 7-Wochen-Übersicht
-            week_chart = create_6week_comparison_chart(data, "Page Impressions")
-            if week_chart:
-                print("   → 7-Wochen-Übersicht erstellt")
-                url = upload_to_imgbb(week_chart)
-                if url:
-                    image_urls["7-Wochen-Übersicht PI"] = url
+            def rendered_charts():
+                # Generator: Rendern im Haupt-Thread, Upload des vorigen Charts läuft parallel
+                for name, label, build in chart_specs:
+                    try:
+                        chart_bytes = build()
+                    except Exception as e:
+                        # Einzelnes Diagramm überspringen, die übrigen trotzdem erstellen
+                        print(f"   ⚠️ {label} fehlgeschlagen: {type(e).__name__}: {e}")
+                        if OEWA_DEBUG:
+                            traceback.print_exc()
+                        continue
+                    if chart_bytes:
+                        print(f"   → {label} erstellt")
+                        yield name, chart_bytes
             
-            # 5. Multi-Metrik Übersicht (NEU - analog Monthly)
-            multi_chart = create_multi_metric_chart(data)
-            if multi_chart:
-                print("   → Multi-Metrik Übersicht erstellt")
-                url = upload_to_imgbb(multi_chart)
-                if url:
-                    image_urls["Änderungen-Übersicht (%)"] = url
-            
-            # 6. Plattform-Anteil Pie (NEU - analog Monthly)
-            # GEÄNDERT: Visits statt Page Impressions für besseren Vergleich
-            pie_chart = create_platform_pie_chart(data, "Visits")
-            if pie_chart:
-                print("   → Plattform-Anteil (Visits) erstellt")
-                url = upload_to_imgbb(pie_chart)
-                if url:
-                    image_urls["Web vs. App Visits"] = url
+            try:
+                image_urls = upload_charts(rendered_charts())
+                
+                print(f"\n   ✅ {len(image_urls)} Diagramme erfolgreich hochgeladen")
             
-            print(f"\n   ✅ {len(image_urls)} Diagramme erfolgreich hochgeladen")
-                    
-        except Exception as e:
-            print(f"   ⚠️ Diagramm-Erstellung fehlgeschlagen: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    # GPT Summary
-    print("\n🤖 Generiere KI-Zusammenfassung...")
-    summary = generate_gpt_summary(data, period)
-    print(f"   → {len(summary)} Zeichen generiert")
+            except Exception as e:
+                print(f"   ⚠️ Diagramm-Erstellung fehlgeschlagen: {type(e).__name__}: {e}")
+                if OEWA_DEBUG:
+                    traceback.print_exc()
+        
+        summary = summary_future.result()
+    print(f"\n   → KI-Zusammenfassung: {len(summary)} Zeichen generiert")
     
     # Teams Bericht
     print("\n📤 Sende Teams-Bericht...")
@@ -5,8 +5,15 @@
 
 import pytest
 import os
+import re
+import sys
+import json
 from datetime import date, timedelta
 
+# ci_scripts/ sind Standalone-Skripte (kein Paket) - für die Unit-Tests importierbar machen
+CI_SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ci_scripts")
+sys.path.insert(0, CI_SCRIPTS_DIR)
+
 # Test-Konfiguration
 TEST_AIRTABLE_API_KEY = os.environ.get("AIRTABLE_API_KEY", "")
 TEST_AIRTABLE_BASE_ID = os.environ.get("AIRTABLE_BASE_ID", "")  # Muss für Tests gesetzt sein
@@ -86,3 +93,80 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "security: Sicherheits-Tests")
     config.addinivalue_line("markers", "slow: Langsame Tests")
 
+
+# =============================================================================
+# AIRTABLE-FAKES (Unit-Tests ohne Netzwerk, ersetzen das Modul-_SESSION)
+# =============================================================================
+
+_DATUM_WINDOW = re.compile(r"IS_(?:AFTER|BEFORE)\(\{Datum\}, '([\d-]+)'\)")
+_MONTH_PREFIX = re.compile(r"FIND\('(\d{4}-\d{2})_MONTH_'")
+
+
+def datum_window(formula):
+    """(IS_AFTER-Datum, IS_BEFORE-Datum) einer filterByFormula als ISO-Strings"""
+    after, before = _DATUM_WINDOW.findall(formula)
+    return after, before
+
+
+class FakeResponse:
+    """Minimale requests.Response für Airtable-Seiten"""
+
+    def __init__(self, status_code=200, payload=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+        self.content = json.dumps(self._payload).encode("utf-8")
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    """Ersetzt _SESSION: Antwort pro Aufruf über eine Funktion(params)"""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+
+    def get(self, url, headers=None, params=None, timeout=None):
+        self.calls.append(dict(params or {}))
+        return self.handler(params or {})
+
+
+class FakeAirtable(FakeSession):
+    """
+    Simuliert filterByFormula auf der Measurements-Tabelle: Tagesrecords nach
+    IS_AFTER/IS_BEFORE-Fenster auf {Datum}, _MONTH_-Records nach den
+    FIND-Präfixen. Liefert Seiten zu `page_size` (mit Offset).
+    """
+
+    def __init__(self, records, month_records=(), page_size=100):
+        super().__init__(self._answer)
+        self.records = list(records)
+        self.month_records = list(month_records)
+        self.page_size = page_size
+
+    def _answer(self, params):
+        formula = params["filterByFormula"]
+        if "{Unique Key}) > 0" in formula:
+            prefixes = _MONTH_PREFIX.findall(formula)
+            records = [r for r in self.month_records if r["fields"]["Unique Key"][:7] in prefixes]
+        else:
+            after, before = datum_window(formula)
+            records = [r for r in self.records if after < r["fields"]["Datum"] < before]
+        start = int(params.get("offset", 0))
+        payload = {"records": records[start:start + self.page_size]}
+        if start + self.page_size < len(records):
+            payload["offset"] = str(start + self.page_size)
+        return FakeResponse(payload=payload)
+
+
+@pytest.fixture
+def no_throttle(monkeypatch):
+    """Kein Warten auf Rate-Limiter-Slots in den geladenen ci_scripts-Modulen"""
+    for name in ("monthly_data_utils", "unified_backfill", "monthly_report"):
+        module = sys.modules.get(name)
+        if module is None:
+            continue
+        for throttle in ("_airtable_throttle", "_infonline_throttle"):
+            if hasattr(module, throttle):
+                monkeypatch.setattr(module, throttle, lambda: None)
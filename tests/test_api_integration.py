@@ -177,12 +177,11 @@ class TestImgBBAPI:
             "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
         )
         
+        # Multipart-Upload wie in den Reports (ohne base64)
         response = requests.post(
             "https://api.imgbb.com/1/upload",
-            data={
-                "key": api_key,
-                "image": base64.b64encode(minimal_png).decode("utf-8")
-            },
+            data={"key": api_key},
+            files={"image": ("test.png", minimal_png, "image/png")},
             timeout=30
         )
         
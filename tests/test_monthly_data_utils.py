@@ -0,0 +1,200 @@
+"""
+Tests für monthly_data_utils (ohne Airtable - _SESSION gemockt)
+===============================================================
+"""
+
+import os
+import time
+from datetime import date, timedelta
+
+import pytest
+import requests
+
+import monthly_data_utils
+from tests.conftest import FakeAirtable, FakeResponse, FakeSession
+
+pytestmark = pytest.mark.usefixtures("no_throttle")
+
+
+def daily_records(year, month, days):
+    """Tagesrecords (VOL Web/iOS/Android) für die ersten `days` Tage eines Monats"""
+    records = []
+    for day in range(1, days + 1):
+        datum = date(year, month, day).isoformat()
+        for platform, value in (("Web", 10), ("iOS", 1), ("Android", 2)):
+            records.append({"fields": {"Datum": datum, "Brand": "VOL", "Plattform": platform,
+                                       "Metrik": "Page Impressions", "Wert": value}})
+    return records
+
+
+def month_record(year, month, platform, value):
+    """_MONTH_-Record wie vom Monthly Backfill angelegt"""
+    return {"fields": {"Unique Key": f"{year}-{month:02d}_MONTH_VOL_{platform}_Page Impressions",
+                       "Brand": "VOL", "Plattform": platform, "Metrik": "Page Impressions", "Wert": value}}
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Monats-Cache in ein temporäres Verzeichnis"""
+    path = str(tmp_path / "oewa_cache")
+    monkeypatch.setattr(monthly_data_utils, "MONTHLY_CACHE_DIR", path)
+    return path
+
+
+class TestFetchAllRecords:
+    """Tests für Pagination und Fehlerbehandlung"""
+
+    def test_follows_offset(self, monkeypatch):
+        """Alle Seiten werden über den Offset geladen"""
+        pages = {None: {"records": [{"id": 1}], "offset": "p2"}, "p2": {"records": [{"id": 2}]}}
+        session = FakeSession(lambda params: FakeResponse(payload=pages[params.get("offset")]))
+        monkeypatch.setattr(monthly_data_utils, "_SESSION", session)
+        assert monthly_data_utils.fetch_all_records("TRUE()") == [{"id": 1}, {"id": 2}]
+        assert len(session.calls) == 2
+
+    def test_failed_page_raises(self, monkeypatch):
+        """Nicht-200 auf einer Folgeseite → Exception statt Teilergebnis"""
+        def handler(params):
+            if params.get("offset"):
+                return FakeResponse(status_code=503)
+            return FakeResponse(payload={"records": [{"id": 1}], "offset": "p2"})
+        monkeypatch.setattr(monthly_data_utils, "_SESSION", FakeSession(handler))
+        with pytest.raises(requests.HTTPError):
+            monthly_data_utils.fetch_all_records("TRUE()")
+
+
+class TestMonthlyCache:
+    """Tests für den Disk-Cache von get_months_data"""
+
+    def test_ttl_closed_month_never_expires(self):
+        """Monate vor dem Vormonat sind abgeschlossen → kein Ablauf"""
+        today = date.today()
+        year, month = monthly_data_utils.get_previous_month(
+            *monthly_data_utils.get_previous_month(today.year, today.month))
+        assert monthly_data_utils._monthly_cache_ttl(year, month) is None
+        assert monthly_data_utils._monthly_cache_ttl(year - 1, month) is None
+
+    def test_ttl_current_and_previous_month_expire(self):
+        """Aktueller und Vormonat können sich noch ändern → MONTHLY_CACHE_TTL"""
+        today = date.today()
+        prev = monthly_data_utils.get_previous_month(today.year, today.month)
+        assert monthly_data_utils._monthly_cache_ttl(today.year, today.month) == monthly_data_utils.MONTHLY_CACHE_TTL
+        assert monthly_data_utils._monthly_cache_ttl(*prev) == monthly_data_utils.MONTHLY_CACHE_TTL
+
+    def test_write_and_read(self, cache_dir):
+        """Geschriebene Monatsdaten kommen unverändert zurück"""
+        data = {"VOL_Web": {"Page Impressions": 1000, "Visits": 400}}
+        path = monthly_data_utils._monthly_cache_path(2024, 3, "VOL", True)
+        monthly_data_utils._write_monthly_cache(path, data)
+        assert monthly_data_utils._read_monthly_cache(path, None) == data
+        assert [name for name in os.listdir(cache_dir) if name.endswith(".tmp")] == []
+
+    def test_read_expired_or_missing(self, cache_dir):
+        """Abgelaufene, fehlende oder defekte Dateien → None"""
+        path = monthly_data_utils._monthly_cache_path(2024, 3, None, False)
+        assert monthly_data_utils._read_monthly_cache(path, None) is None
+        monthly_data_utils._write_monthly_cache(path, {"VOL_Web": {"Visits": 1}})
+        old = time.time() - 7200
+        os.utime(path, (old, old))
+        assert monthly_data_utils._read_monthly_cache(path, 3600) is None
+        assert monthly_data_utils._read_monthly_cache(path, None) == {"VOL_Web": {"Visits": 1}}
+        with open(path, "wb") as f:
+            f.write(b"{kaputt")
+        assert monthly_data_utils._read_monthly_cache(path, None) is None
+
+    def test_cached_months_skip_airtable(self, monkeypatch, cache_dir):
+        """Nur fehlende Monate werden geladen, geladene werden gespeichert"""
+        cached = {"VOL_Web": {"Visits": 1}}
+        monthly_data_utils._write_monthly_cache(
+            monthly_data_utils._monthly_cache_path(2024, 2, "VOL", True), cached)
+        loaded = []
+
+        def fake_load(months, brand_filter=None, aggregate_app=True):
+            loaded.append(list(months))
+            return {ym: {"VOL_Web": {"Visits": 2}} for ym in months}
+
+        monkeypatch.setattr(monthly_data_utils, "load_months_data", fake_load)
+        result = monthly_data_utils.get_months_data([(2024, 2), (2024, 3)], brand_filter="VOL")
+        assert loaded == [[(2024, 3)]]
+        assert result == {(2024, 2): cached, (2024, 3): {"VOL_Web": {"Visits": 2}}}
+        path = monthly_data_utils._monthly_cache_path(2024, 3, "VOL", True)
+        assert monthly_data_utils._read_monthly_cache(path, None) == {"VOL_Web": {"Visits": 2}}
+
+    def test_failed_load_is_not_cached(self, monkeypatch, cache_dir):
+        """Schlägt Airtable fehl, wird kein (unvollständiger) Monat gespeichert"""
+        monkeypatch.setattr(monthly_data_utils, "_SESSION",
+                            FakeSession(lambda params: FakeResponse(status_code=500)))
+        with pytest.raises(requests.HTTPError):
+            monthly_data_utils.get_months_data([(2024, 3)], brand_filter="VOL")
+        assert not os.path.exists(cache_dir) or os.listdir(cache_dir) == []
+
+
+class TestSplitDateRange:
+    """Tests für die Aufteilung in Datums-Fenster"""
+
+    @pytest.mark.parametrize("days,slices", [(31, 4), (29, 4), (3, 4), (1, 4), (10, 1), (365, 4)])
+    def test_windows_cover_range_without_gaps(self, days, slices):
+        """Fenster sind lückenlos, überlappungsfrei und decken [start, end] ab"""
+        start = date(2024, 1, 1)
+        end = start + timedelta(days=days - 1)
+        ranges = monthly_data_utils.split_date_range(start, end, slices)
+        assert len(ranges) == min(days, slices)
+        assert ranges[0][0] == start
+        assert ranges[-1][1] == end
+        for (_, prev_end), (next_start, _) in zip(ranges, ranges[1:]):
+            assert next_start == prev_end + timedelta(days=1)
+        lengths = [(e - s).days + 1 for s, e in ranges]
+        assert max(lengths) - min(lengths) <= 1
+
+
+class TestLoadMonthsData:
+    """Tests für Strategiewahl und Zuordnung in load_months_data"""
+
+    @pytest.mark.parametrize("year,month,last_day", [(2024, 2, 29), (2024, 3, 31), (2023, 2, 28)])
+    def test_strategy_threshold(self, monkeypatch, year, month, last_day):
+        """Ab int(Tage * 0.9) Tagen gelten Tagesdaten, darunter _MONTH_"""
+        threshold = int(last_day * 0.9)
+        monthly = [month_record(year, month, "Web", 999)]
+        for days, expected in ((threshold, threshold * 10), (threshold - 1, 999)):
+            monkeypatch.setattr(monthly_data_utils, "_SESSION",
+                                FakeAirtable(daily_records(year, month, days), monthly))
+            result = monthly_data_utils.load_months_data([(year, month)], brand_filter="VOL")
+            assert result[(year, month)]["VOL_Web"]["Page Impressions"] == expected
+
+    def test_incomplete_daily_without_month_records(self, monkeypatch):
+        """Ohne _MONTH_-Records bleiben unvollständige Tagesdaten (Strategie 3)"""
+        monkeypatch.setattr(monthly_data_utils, "_SESSION",
+                            FakeAirtable(daily_records(2024, 4, 5), []))
+        result = monthly_data_utils.load_months_data([(2024, 4)])
+        assert result[(2024, 4)] == {"VOL_Web": {"Page Impressions": 50}, "VOL_App": {"Page Impressions": 15}}
+
+    def test_no_data(self, monkeypatch):
+        """Keine Records → leeres Dict"""
+        monkeypatch.setattr(monthly_data_utils, "_SESSION", FakeAirtable([], []))
+        assert monthly_data_utils.load_months_data([(2024, 4)]) == {(2024, 4): {}}
+
+    def test_months_bucketed_from_one_pass(self, monkeypatch):
+        """Mehrere Monate: ein Tagesdaten-Durchgang, Zuordnung über Datum und Unique Key"""
+        daily = daily_records(2024, 2, 29) + daily_records(2024, 3, 10)
+        monthly = [month_record(2024, 3, "Web", 5000), month_record(2024, 3, "iOS", 300),
+                   month_record(2024, 3, "Android", 200), month_record(2024, 5, "Web", 1)]
+        session = FakeAirtable(daily, monthly)
+        monkeypatch.setattr(monthly_data_utils, "_SESSION", session)
+
+        result = monthly_data_utils.load_months_data([(2024, 2), (2024, 3)], aggregate_app=False)
+
+        assert result[(2024, 2)] == {"VOL_Web": {"Page Impressions": 290},
+                                     "VOL_iOS": {"Page Impressions": 29},
+                                     "VOL_Android": {"Page Impressions": 58}}
+        assert result[(2024, 3)] == {"VOL_Web": {"Page Impressions": 5000},
+                                     "VOL_iOS": {"Page Impressions": 300},
+                                     "VOL_Android": {"Page Impressions": 200}}
+        # AIRTABLE_DATE_SLICES Fenster für Tagesdaten + eine _MONTH_-Abfrage
+        assert len(session.calls) == monthly_data_utils.AIRTABLE_DATE_SLICES + 1
+
+    def test_brand_filter_in_formulas(self, monkeypatch):
+        """brand_filter landet in jeder Abfrage"""
+        session = FakeAirtable([], [])
+        monkeypatch.setattr(monthly_data_utils, "_SESSION", session)
+        monthly_data_utils.load_months_data([(2024, 4)], brand_filter="VOL")
+        assert all("{Brand} = 'VOL'" in call["filterByFormula"] for call in session.calls)
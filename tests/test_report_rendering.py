@@ -0,0 +1,101 @@
+"""
+Tests für das Chart-Rendering des Monthly Reports
+=================================================
+"""
+
+import importlib.util
+
+import pytest
+
+pytest.importorskip("plotly")
+
+import monthly_report  # noqa: E402
+
+
+KALEIDO_AVAILABLE = importlib.util.find_spec("kaleido") is not None
+
+
+@pytest.fixture
+def figure():
+    """Kleine Balken-Figure wie in den Detail-Charts"""
+    go = monthly_report._get_go()
+    return go.Figure(go.Bar(x=["Web", "iOS", "Android"], y=[100, 80, 60]))
+
+
+@pytest.fixture(autouse=True)
+def fresh_scope():
+    """Scope-Cache vor und nach jedem Test leeren"""
+    monthly_report._get_kaleido_scope.cache_clear()
+    yield
+    monthly_report._get_kaleido_scope.cache_clear()
+
+
+class TestKaleidoScope:
+    """Tests für die Auswahl des Render-Pfads"""
+
+    def test_scope_without_transform_is_ignored(self, monkeypatch):
+        """Defaults-Wrapper (Plotly >= 6.1 + Kaleido 1.x) gilt nicht als Scope"""
+        import plotly.io as pio
+        monkeypatch.setattr(pio, "kaleido", type("K", (), {"scope": object()}), raising=False)
+        assert monthly_report._get_kaleido_scope() is None
+
+    def test_scope_with_transform_is_used(self, monkeypatch, figure):
+        """Kaleido-0.2-Scope rendert das Dict direkt"""
+        import plotly.io as pio
+
+        class FakeScope:
+            def transform(self, fig_dict, **kwargs):
+                assert kwargs["format"] == monthly_report.CHART_FORMAT
+                return b"scope"
+
+        monkeypatch.setattr(pio, "kaleido", type("K", (), {"scope": FakeScope()}), raising=False)
+        assert monthly_report._render_image(monthly_report._render_payload(figure)) == b"scope"
+
+    def test_fallback_to_image(self, monkeypatch, figure):
+        """Ohne Scope rendert to_image (Kaleido-Server-Pfad)"""
+        import plotly.io as pio
+        go = monthly_report._get_go()
+        monkeypatch.setattr(pio, "kaleido", type("K", (), {"scope": object()}), raising=False)
+        monkeypatch.setattr(monthly_report, "_start_kaleido_server", lambda: False)
+        monkeypatch.setattr(go.Figure, "to_image", lambda self, **kwargs: b"to_image")
+        assert monthly_report._render_image(monthly_report._render_payload(figure)) == b"to_image"
+
+    def test_fallback_starts_kaleido_server(self, monkeypatch, figure):
+        """Kaleido 1.x (Scope ohne transform) nutzt den persistenten Server"""
+        import plotly.io as pio
+        go = monthly_report._get_go()
+        started = []
+        monkeypatch.setattr(pio, "kaleido", type("K", (), {"scope": object()}), raising=False)
+        monkeypatch.setattr(monthly_report, "_start_kaleido_server", lambda: started.append(True) or True)
+        monkeypatch.setattr(go.Figure, "to_image", lambda self, **kwargs: b"to_image")
+        monthly_report._render_image(monthly_report._render_payload(figure))
+        assert started == [True]
+
+
+@pytest.mark.skipif(not KALEIDO_AVAILABLE, reason="kaleido nicht installiert")
+class TestRenderImage:
+    """Echtes Rendering über Kaleido/Chromium"""
+
+    def test_render_one_figure(self, figure):
+        """Eine Figure ergibt ein nicht-leeres Bild"""
+        image = monthly_report._render_image(monthly_report._render_payload(figure))
+        assert isinstance(image, bytes)
+        assert len(image) > 0
+
+
+class TestUploadCharts:
+    """Tests für upload_charts bei Render-Fehlern"""
+
+    def test_keeps_uploads_before_render_error(self, monkeypatch, tmp_path):
+        """Bricht das Rendern ab, bleiben die schon gelieferten Diagramme erhalten"""
+        monkeypatch.setattr(monthly_report, "CHART_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(monthly_report, "CHART_URL_CACHE", str(tmp_path / "urls.json"))
+        monkeypatch.setattr(monthly_report, "upload_to_imgbb", lambda png: f"https://i.ibb.co/{png.decode()}")
+
+        def charts():
+            yield "A", b"a"
+            yield "B", b"b"
+            raise RuntimeError("Kaleido kaputt")
+
+        urls = monthly_report.upload_charts(charts(), order=["A", "B", "C"])
+        assert urls == {"A": "https://i.ibb.co/a", "B": "https://i.ibb.co/b"}
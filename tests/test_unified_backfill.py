@@ -0,0 +1,112 @@
+"""
+Tests für unified_backfill (ohne Airtable - _SESSION gemockt)
+=============================================================
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+import unified_backfill
+from tests.conftest import FakeAirtable, FakeResponse, FakeSession, datum_window
+
+pytestmark = pytest.mark.usefixtures("no_throttle")
+
+
+def days(start, end):
+    """Alle Tage in [start, end]"""
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def key_records(dates):
+    """Ein Record (Datum + Unique Key) pro Tag"""
+    return [{"fields": {"Datum": d.isoformat(), "Unique Key": f"{d.isoformat()}_VOL_Web_Page Impressions"}}
+            for d in dates]
+
+
+class TestGetExistingKeys:
+    """Tests für das Laden existierender Keys im Backfill-Fenster"""
+
+    def test_only_window_keys(self, monkeypatch):
+        """Nur Keys aus [start, end] - Tage davor und danach nicht"""
+        airtable = FakeAirtable(key_records(days(date(2024, 2, 20), date(2024, 4, 10))))
+        monkeypatch.setattr(unified_backfill, "_SESSION", airtable)
+
+        keys = unified_backfill.get_existing_keys(date(2024, 3, 1), date(2024, 3, 31))
+
+        assert keys == {f"{d.isoformat()}_VOL_Web_Page Impressions"
+                        for d in days(date(2024, 3, 1), date(2024, 3, 31))}
+
+    def test_one_query_per_slice(self, monkeypatch):
+        """Je Datums-Fenster eine Abfrage, Fenster grenzen lückenlos aneinander"""
+        airtable = FakeAirtable(key_records(days(date(2024, 3, 1), date(2024, 3, 31))))
+        monkeypatch.setattr(unified_backfill, "_SESSION", airtable)
+
+        unified_backfill.get_existing_keys(date(2024, 3, 1), date(2024, 3, 31))
+
+        windows = sorted(datum_window(call["filterByFormula"]) for call in airtable.calls)
+        assert len(windows) == unified_backfill.AIRTABLE_DATE_SLICES
+        assert windows[0][0] == "2024-02-29"
+        assert windows[-1][1] == "2024-04-01"
+        for (_, prev_before), (next_after, _) in zip(windows, windows[1:]):
+            # IS_BEFORE(x) des einen, IS_AFTER(x - 1 Tag) des nächsten → kein Tag doppelt/fehlend
+            assert date.fromisoformat(next_after) == date.fromisoformat(prev_before) - timedelta(days=1)
+
+    def test_follows_offset_within_slice(self, monkeypatch):
+        """Pagination pro Fenster über den Offset"""
+        airtable = FakeAirtable(key_records(days(date(2024, 3, 1), date(2024, 3, 8))), page_size=1)
+        monkeypatch.setattr(unified_backfill, "_SESSION", airtable)
+
+        keys = unified_backfill.get_existing_keys(date(2024, 3, 1), date(2024, 3, 8))
+
+        assert len(keys) == 8
+        assert len(airtable.calls) == 8
+
+    def test_short_range_fewer_slices(self, monkeypatch):
+        """Weniger Tage als Fenster → ein Fenster pro Tag"""
+        airtable = FakeAirtable(key_records(days(date(2024, 3, 1), date(2024, 3, 2))))
+        monkeypatch.setattr(unified_backfill, "_SESSION", airtable)
+
+        keys = unified_backfill.get_existing_keys(date(2024, 3, 1), date(2024, 3, 2))
+
+        assert len(keys) == 2
+        assert len(airtable.calls) == 2
+
+    def test_dry_run_skips_airtable(self, monkeypatch):
+        """Dry-Run fragt Airtable nicht ab"""
+        airtable = FakeAirtable(key_records([date(2024, 3, 1)]))
+        monkeypatch.setattr(unified_backfill, "_SESSION", airtable)
+
+        assert unified_backfill.get_existing_keys(date(2024, 3, 1), date(2024, 3, 1), dry_run=True) == set()
+        assert airtable.calls == []
+
+
+class TestFetchInfonlineParallel:
+    """Tests für den parallelen INFOnline-Abruf"""
+
+    def test_every_request_waits_for_a_slot(self, monkeypatch):
+        """Jeder Abruf geht über den gemeinsamen Rate-Limiter, Ergebnisse in Eingangsreihenfolge"""
+        slots = []
+        monkeypatch.setattr(unified_backfill, "_infonline_throttle", lambda: slots.append(True))
+        monkeypatch.setattr(unified_backfill, "fetch_infonline_data",
+                            lambda site_id, metric, target_date: {"success": True, "data": (site_id, target_date.day)})
+        jobs = [("at_w_atvol", "visits", date(2024, 3, day)) for day in range(1, 11)]
+
+        results = unified_backfill.fetch_infonline_parallel(jobs)
+
+        assert len(slots) == len(jobs)
+        assert [r["data"] for r in results] == [("at_w_atvol", day) for day in range(1, 11)]
+
+
+class TestCheckKeyExists:
+    """Tests für den Double-Check vor dem Insert"""
+
+    def test_waits_for_airtable_slot(self, monkeypatch):
+        """Jede Einzel-Abfrage geht über den gemeinsamen Airtable-Rate-Limiter"""
+        slots = []
+        monkeypatch.setattr(unified_backfill, "_airtable_throttle", lambda: slots.append(True))
+        monkeypatch.setattr(unified_backfill, "_SESSION", FakeSession(lambda params: FakeResponse(
+            payload={"records": [{"fields": {"Unique Key": "2024-03-01_VOL_Web_Visits"}}]})))
+
+        assert unified_backfill.check_key_exists("2024-03-01_VOL_Web_Visits")
+        assert slots == [True]